@@ -0,0 +1,12 @@
+"""
+Benchmarks de rendimiento del SDK sobre catálogos sintéticos.
+
+    python -m benchmarks run --scales 10,1000 --output results.json
+    python -m benchmarks compare baseline.json results.json --threshold 0.2
+"""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    sys.path.append(str(ROOT / "src"))
@@ -0,0 +1,82 @@
+import argparse
+import sys
+from pathlib import Path
+
+from . import catalog
+from .runner import (
+    BENCHMARKS,
+    DEFAULT_SCALES,
+    MEMORY_SCALES,
+    compare_results,
+    load_results,
+    run_suite,
+    save_results,
+)
+
+
+def _scales(raw: str) -> list:
+    return [int(part) for part in raw.split(",") if part]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Ejecuta la suite y guarda los resultados en JSON")
+    run.add_argument("--scales", type=_scales, default=list(DEFAULT_SCALES),
+                     help="Tamaños de catálogo separados por coma (ej: 10,1000,10000)")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--only", type=lambda raw: raw.split(","), default=None,
+                     help=f"Subconjunto de: {', '.join(BENCHMARKS)}")
+    run.add_argument("--shape", choices=catalog.SHAPES, default="layered")
+    run.add_argument("--depth", type=int, default=8)
+    run.add_argument("--fan-out", type=int, default=3)
+    run.add_argument("--spec-style", choices=catalog.SPEC_STYLES, default="range")
+    run.add_argument("--files", type=int, default=2)
+    run.add_argument("--file-size", type=int, default=2048)
+    run.add_argument("--seed", type=int, default=1)
+    run.add_argument("--no-memory-scales", action="store_true",
+                     help="Omite las escalas extra de memoria (build_install_plan*@10000)")
+    run.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+
+    compare = commands.add_parser("compare", help="Compara dos resultados y lista regresiones")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument("--threshold", type=float, default=0.2)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_suite(
+            scales=args.scales,
+            repeat=args.repeat,
+            only=args.only,
+            spec_overrides={
+                "shape": args.shape,
+                "depth": args.depth,
+                "fan_out": args.fan_out,
+                "spec_style": args.spec_style,
+                "files": args.files,
+                "file_size": args.file_size,
+                "seed": args.seed,
+            },
+            progress=lambda key: print(f"→ {key}", file=sys.stderr),
+            extra_scales=None if args.no_memory_scales else MEMORY_SCALES,
+        )
+        save_results(results, args.output)
+        for key, result in results["results"].items():
+            print(f"{key:40} median={result['median']:.6f}s peak={result['peak_bytes']}B")
+        return 0
+
+    regressions = compare_results(
+        load_results(args.baseline), load_results(args.current), args.threshold
+    )
+    for regression in regressions:
+        print(f"REGRESIÓN {regression}")
+    if not regressions:
+        print("Sin regresiones")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
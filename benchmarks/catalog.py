@@ -0,0 +1,156 @@
+"""
+Generador de catálogos sintéticos: N componentes válidos con un DAG de
+dependencias de forma, profundidad y fan-out configurables.
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+SHAPES = ("layered", "chain", "star", "random")
+SPEC_STYLES = ("none", "exact", "range", "caret")
+
+
+@dataclass(frozen=True)
+class CatalogSpec:
+    """
+    Forma del catálogo.
+    - shape: layered (capas de profundidad `depth`), chain (cadena lineal),
+      star (todos dependen del primero) o random (aristas hacia cualquier anterior).
+    - fan_out: dependencias máximas por componente (layered / random).
+    - spec_style: especificación de versión de cada dependencia en los manifests
+      en memoria (none, exact "==x", range ">=x", caret "^x").
+    - files / file_size: archivos .py extra por componente y su tamaño aproximado.
+    """
+    components: int
+    shape: str = "layered"
+    depth: int = 8
+    fan_out: int = 3
+    spec_style: str = "range"
+    files: int = 2
+    file_size: int = 2048
+    seed: int = 1
+
+    def __post_init__(self) -> None:
+        if self.shape not in SHAPES:
+            raise ValueError(f"shape inválido '{self.shape}' (opciones: {', '.join(SHAPES)})")
+        if self.spec_style not in SPEC_STYLES:
+            raise ValueError(
+                f"spec_style inválido '{self.spec_style}' (opciones: {', '.join(SPEC_STYLES)})"
+            )
+        if self.components < 1 or self.depth < 1 or self.fan_out < 0:
+            raise ValueError("components y depth deben ser >= 1 y fan_out >= 0")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def component_name(index: int) -> str:
+    return f"bench_{index:05d}"
+
+
+def _version(index: int) -> str:
+    return f"{1 + index % 3}.{index % 7}.{index % 11}"
+
+
+def _spec(style: str, version: str) -> str:
+    if style == "exact":
+        return f"=={version}"
+    if style == "caret":
+        return f"^{version}"
+    return f">={version}"
+
+
+def dependency_edges(spec: CatalogSpec) -> List[List[int]]:
+    """Índices de las dependencias de cada componente (siempre hacia anteriores: DAG)."""
+    rng = random.Random(spec.seed)
+    count = spec.components
+    edges: List[List[int]] = [[] for _ in range(count)]
+
+    if spec.shape == "chain":
+        for i in range(1, count):
+            edges[i] = [i - 1]
+    elif spec.shape == "star":
+        for i in range(1, count):
+            edges[i] = [0]
+    elif spec.shape == "random":
+        for i in range(1, count):
+            edges[i] = sorted(rng.sample(range(i), min(i, rng.randint(0, spec.fan_out))))
+    else:
+        depth = min(spec.depth, count)
+        layers: List[List[int]] = [[] for _ in range(depth)]
+        for i in range(count):
+            layers[i * depth // count].append(i)
+        for previous, layer in zip(layers, layers[1:]):
+            for i in layer:
+                edges[i] = sorted(rng.sample(previous, min(len(previous), spec.fan_out)))
+    return edges
+
+
+def synthetic_manifests(spec: CatalogSpec) -> List[Dict[str, Any]]:
+    """
+    Manifests en memoria. Con spec_style distinto de none las dependencias se
+    declaran como {"name", "version"}, formato que acepta CatalogValidator.
+    """
+    manifests = []
+    for i, deps in enumerate(dependency_edges(spec)):
+        depends: List[Any] = [component_name(d) for d in deps]
+        if spec.spec_style != "none":
+            depends = [
+                {"name": component_name(d), "version": _spec(spec.spec_style, _version(d))}
+                for d in deps
+            ]
+        manifests.append({
+            "technical_name": component_name(i),
+            "display_name": f"Bench {i}",
+            "component_type": "module",
+            "package_type": "extension",
+            "version": _version(i),
+            "keywords": [f"group{i % 10}"],
+            "depends": depends,
+        })
+    return manifests
+
+
+def _source_file(index: int, size: int) -> str:
+    lines = [f'"""Archivo sintético {index}."""\n']
+    total = len(lines[0])
+    n = 0
+    while total < size:
+        line = f"VALUE_{n} = {n} * {index} + len('{'x' * 16}')\n"
+        lines.append(line)
+        total += len(line)
+        n += 1
+    return "".join(lines)
+
+
+def generate_catalog(base: Path, spec: CatalogSpec) -> List[Path]:
+    """
+    Escribe el catálogo en disco (<base>/<technical_name>/__meta__.py + archivos
+    .py) y devuelve las rutas en orden. Los __meta__.py declaran las dependencias
+    por nombre, que es lo que admite BaseMetaSchema.
+    """
+    base.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i, manifest in enumerate(synthetic_manifests(spec)):
+        component_dir = base / manifest["technical_name"]
+        component_dir.mkdir(exist_ok=True)
+        depends = [d["name"] if isinstance(d, dict) else d for d in manifest["depends"]]
+        meta = (
+            f'technical_name = "{manifest["technical_name"]}"\n'
+            f'display_name = "{manifest["display_name"]}"\n'
+            'component_type = "module"\n'
+            'package_type = "extension"\n'
+            f'version = "{manifest["version"]}"\n'
+            f"keywords = {manifest['keywords']!r}\n"
+            f"depends = {depends!r}\n"
+        )
+        (component_dir / "__meta__.py").write_text(meta, encoding="utf-8")
+        for f in range(spec.files):
+            (component_dir / f"mod_{f}.py").write_text(
+                _source_file(f, spec.file_size), encoding="utf-8"
+            )
+        paths.append(component_dir)
+    return paths
@@ -0,0 +1,361 @@
+"""
+Ejecución de benchmarks y formato de resultados.
+
+Cada benchmark tiene un setup (no medido) y una función medida. Los tiempos
+son de pared (perf_counter) sobre `repeat` ejecuciones; la memoria (pico y
+retenida por el resultado) se mide con tracemalloc en una ejecución adicional,
+separada para no distorsionar los tiempos.
+"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sdk import __version__ as SDK_VERSION
+from sdk.binary_snapshot import dump_manifests, load_manifests
+from sdk.dependency.install_plan import build_install_plan
+from sdk.dependency.resolver import DependencyResolver
+from sdk.installer import TransactionalInstaller
+from sdk.registry import ComponentRegistry
+from sdk.search_index import SearchIndex
+from sdk.utils.meta_parser import parse_meta_file
+from sdk.validation.catalog_validator import CatalogValidator
+from sdk.validation.component_validator import ComponentValidator
+
+from .catalog import CatalogSpec, generate_catalog, synthetic_manifests
+
+RESULTS_FORMAT = 1
+DEFAULT_SCALES = (10, 1000)
+
+# Escalas adicionales por benchmark (solo para esos benchmarks): el plan lean
+# se diseñó para catálogos de ~10k componentes y su pico de memoria se mide ahí.
+MEMORY_SCALES: Dict[str, Tuple[int, ...]] = {
+    "build_install_plan": (10_000,),
+    "build_install_plan_lean": (10_000,),
+}
+
+# Los registros individuales reescriben el registry completo en cada operación
+# (O(n²) en bytes); por encima de este tamaño se omite ese benchmark.
+MAX_SINGLE_REGISTRY_OPS = 1000
+
+
+@dataclass
+class BenchContext:
+    scale: int
+    spec: CatalogSpec
+    workdir: Path
+    paths: List[Path]
+    manifests: List[Dict[str, Any]]
+
+
+class BenchStorage:
+    """Backend de almacenamiento en disco sobre ComponentRegistry."""
+
+    def __init__(self, base_path: Path):
+        self.base_path = base_path
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.registry = ComponentRegistry(base_path / "registry.json")
+
+    def copy_files(self, source: Path, destination: Path) -> None:
+        if destination.exists():
+            shutil.rmtree(destination)
+        shutil.copytree(source, destination)
+
+    def remove_files(self, path: Path) -> None:
+        if path.is_dir():
+            shutil.rmtree(path)
+        elif path.exists():
+            path.unlink()
+
+    def register_component(self, path: Path, manifest: dict) -> None:
+        self.registry.register(manifest["technical_name"], {"path": str(path), **manifest})
+
+    def unregister_component(self, name: str) -> None:
+        self.registry.unregister(name)
+
+    def resolve_dependency(self, name: str, version_spec: str) -> Optional[Path]:
+        return None
+
+    def get_default_install_path(self, component_name: str) -> Path:
+        return self.base_path / component_name
+
+    def batch(self):
+        return self.registry.batch()
+
+
+# ----------------------------------------------------------------------
+# BENCHMARKS
+# ----------------------------------------------------------------------
+
+def _parse(ctx: BenchContext) -> Callable[[], Any]:
+    return lambda: [parse_meta_file(p / "__meta__.py") for p in ctx.paths]
+
+
+def _validate(ctx: BenchContext) -> Callable[[], Any]:
+    validator = ComponentValidator()
+    return lambda: [validator.validate_component(p) for p in ctx.paths]
+
+
+def _resolve(ctx: BenchContext) -> Callable[[], Any]:
+    def run() -> Any:
+        resolver = DependencyResolver()
+        for path in ctx.paths:
+            resolver.load_component(path)
+        return resolver.resolve()
+    return run
+
+
+def _plan(ctx: BenchContext) -> Callable[[], Any]:
+    return lambda: build_install_plan(ctx.paths)
+
+
+def _plan_lean(ctx: BenchContext) -> Callable[[], Any]:
+    return lambda: build_install_plan(ctx.paths, lean=True)
+
+
+def _catalog(ctx: BenchContext) -> Callable[[], Any]:
+    return lambda: CatalogValidator().validate(ctx.manifests)
+
+
+def _search(ctx: BenchContext) -> Callable[[], Any]:
+    index = SearchIndex.from_manifests(ctx.manifests)
+    # Objetivo: < 1 ms por consulta con 10k componentes (ver SearchIndex)
+    queries = ("group3", "bench 1", "group", "grp", "bench group3")
+    return lambda: [index.search(query, limit=20) for query in queries]
+
+
+def _snapshot_load(ctx: BenchContext) -> Callable[[], Any]:
+    data = dump_manifests(parse_meta_file(p / "__meta__.py") for p in ctx.paths)
+    return lambda: load_manifests(data)
+
+
+def _install_many(ctx: BenchContext) -> Callable[[], Any]:
+    runs = iter(range(1_000_000))
+
+    def run() -> Any:
+        target = ctx.workdir / f"installed_{next(runs)}"
+        try:
+            return TransactionalInstaller(BenchStorage(target)).install_many(ctx.paths)
+        finally:
+            shutil.rmtree(target, ignore_errors=True)
+    return run
+
+
+def _registry_batch(ctx: BenchContext) -> Callable[[], Any]:
+    runs = iter(range(1_000_000))
+
+    def run() -> Any:
+        registry = ComponentRegistry(ctx.workdir / f"registry_batch_{next(runs)}.json")
+        with registry.batch():
+            for manifest in ctx.manifests:
+                registry.register(manifest["technical_name"], manifest)
+        with registry.batch():
+            for manifest in ctx.manifests[::2]:
+                registry.unregister(manifest["technical_name"])
+        return len(registry.list())
+    return run
+
+
+def _registry_single(ctx: BenchContext) -> Optional[Callable[[], Any]]:
+    if ctx.scale > MAX_SINGLE_REGISTRY_OPS:
+        return None
+    runs = iter(range(1_000_000))
+
+    def run() -> Any:
+        registry = ComponentRegistry(ctx.workdir / f"registry_single_{next(runs)}.json")
+        for manifest in ctx.manifests:
+            registry.register(manifest["technical_name"], manifest)
+        return len(registry.list())
+    return run
+
+
+def _import_sdk(ctx: BenchContext) -> Callable[[], Any]:
+    # No depende de la escala: `import sdk` en un intérprete nuevo, arranque incluido.
+    # Sustituye al presupuesto absoluto de tiempo de importación de los tests.
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    command = [sys.executable, "-c", "import sdk"]
+    return lambda: subprocess.run(command, env=env, check=True)
+
+
+BENCHMARKS: Dict[str, Callable[[BenchContext], Optional[Callable[[], Any]]]] = {
+    "parse_meta_file": _parse,
+    "component_validator": _validate,
+    "dependency_resolve": _resolve,
+    "build_install_plan": _plan,
+    "build_install_plan_lean": _plan_lean,
+    "catalog_validator": _catalog,
+    "search_index_query": _search,
+    "snapshot_load": _snapshot_load,
+    "install_many": _install_many,
+    "registry_batch_mutations": _registry_batch,
+    "registry_single_mutations": _registry_single,
+    "import_sdk": _import_sdk,
+}
+
+
+# ----------------------------------------------------------------------
+# EJECUCIÓN
+# ----------------------------------------------------------------------
+
+def _measure(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    func()  # calentamiento: cachés de módulos, esquemas pydantic, page cache
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        result = func()
+        retained, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "repeat": repeat,
+        "times": times,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "peak_bytes": peak,
+        # Memoria que sigue viva mientras se conserva el resultado (p. ej. un plan)
+        "retained_bytes": retained,
+    }
+
+
+def result_key(name: str, scale: int) -> str:
+    return f"{name}@{scale}"
+
+
+def run_suite(
+    scales: Iterable[int] = DEFAULT_SCALES,
+    repeat: int = 5,
+    only: Optional[Iterable[str]] = None,
+    spec_overrides: Optional[Dict[str, Any]] = None,
+    workdir: Optional[Path] = None,
+    progress: Optional[Callable[[str], None]] = None,
+    extra_scales: Optional[Dict[str, Iterable[int]]] = None,
+) -> Dict[str, Any]:
+    """
+    Ejecuta los benchmarks seleccionados en cada escala y devuelve los resultados.
+    extra_scales añade escalas solo para algunos benchmarks (ver MEMORY_SCALES).
+    """
+    selected = list(only) if only else list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Benchmarks desconocidos: {', '.join(unknown)}")
+
+    # escala -> benchmarks que se ejecutan en ella, en orden de escalas pedidas
+    by_scale: Dict[int, List[str]] = {scale: list(selected) for scale in scales}
+    for name in selected:
+        for scale in (extra_scales or {}).get(name, ()):
+            names = by_scale.setdefault(scale, [])
+            if name not in names:
+                names.append(name)
+
+    results: Dict[str, Any] = {}
+    specs: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        for scale, names in by_scale.items():
+            spec = CatalogSpec(components=scale, **(spec_overrides or {}))
+            scale_dir = Path(tmp) / f"scale_{scale}"
+            ctx = BenchContext(
+                scale=scale,
+                spec=spec,
+                workdir=scale_dir,
+                paths=generate_catalog(scale_dir / "catalog", spec),
+                manifests=synthetic_manifests(spec),
+            )
+            specs[str(scale)] = spec.to_dict()
+            for name in names:
+                func = BENCHMARKS[name](ctx)
+                if func is None:
+                    continue
+                if progress:
+                    progress(result_key(name, scale))
+                results[result_key(name, scale)] = {
+                    "benchmark": name,
+                    "scale": scale,
+                    **_measure(func, repeat),
+                }
+
+    return {
+        "format": RESULTS_FORMAT,
+        "environment": {
+            "sdk_version": SDK_VERSION,
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "catalogs": specs,
+        "results": results,
+    }
+
+
+# ----------------------------------------------------------------------
+# COMPARACIÓN
+# ----------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.key} {self.metric}: {self.baseline:.6g} -> {self.current:.6g} "
+            f"(x{self.ratio:.2f})"
+        )
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.2,
+    metrics: Iterable[str] = ("median", "peak_bytes"),
+) -> List[Regression]:
+    """
+    Devuelve las métricas que empeoran más de `threshold` (0.2 = 20%) respecto
+    al baseline. Solo se comparan los benchmarks presentes en ambos resultados.
+    """
+    if baseline.get("format") != current.get("format"):
+        raise ValueError("Los resultados tienen formatos distintos y no son comparables")
+
+    regressions = []
+    for key, before in baseline["results"].items():
+        after = current["results"].get(key)
+        if after is None:
+            continue
+        for metric in metrics:
+            if after[metric] > before[metric] * (1 + threshold):
+                regressions.append(Regression(key, metric, before[metric], after[metric]))
+    return regressions
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    return json.loads(path.read_text(encoding="utf-8"))
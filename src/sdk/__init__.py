@@ -3,51 +3,133 @@
 ERP NEXUS SDK
 =============
 SDK puro Python para definir y validar componentes compatibles con ERP NEXUS.
+
+Los símbolos públicos se cargan en el primer acceso: `from sdk import
+parse_meta_file` no importa pydantic, el installer ni los registries.
 """
-__version__ = "1.0.0"
+from typing import TYPE_CHECKING
 
+from ._lazy import lazy_exports
 from .exceptions import (
     NexusSDKError,
     ValidationError,
     DependencyError,
     InstallationError,
+    UnavailableComponentError,
+    IncompatibleComponentError,
+    SnapshotError,
 )
-from .contracts import StorageBackend
-from .installer import TransactionalInstaller, InstallResult
-from .registry import ComponentRegistry
-from .dependency.install_plan import InstallPlan, build_install_plan
-from .schemas.meta_schema import (
-    ModuleMetaSchema,
-    AppMetaSchema,
-    BaseMetaSchema,
-)
-from .utils.meta_parser import parse_meta_file
 
-# Exportar clases principales para API pública
-from .validation.component_validator import ComponentValidator
+__version__ = "1.0.0"
 
-# Definir API pública explícita
-__all__ = [
+_EXPORTS = {
     # Validación
-    "ComponentValidator",
-    "parse_meta_file",
+    "ComponentValidator": ".validation.component_validator",
+    "BulkValidator": ".validation.bulk_validator",
+    "BulkValidationReport": ".validation.bulk_validator",
+    "ValidationCache": ".validation.validation_cache",
+    "CatalogValidator": ".validation.catalog_validator",
+    "CatalogReport": ".validation.catalog_validator",
+    "parse_meta_file": ".utils.meta_parser",
 
     # Contratos y registry
-    "StorageBackend",
-    "ComponentRegistry",
-    "TransactionalInstaller",
-    "InstallResult",
-    "InstallPlan",
-    "build_install_plan",
+    "StorageBackend": ".contracts",
+    "ComponentRegistry": ".registry",
+    "RegistrySnapshot": ".registry",
+    "JournaledComponentRegistry": ".journal_registry",
+    "SQLiteComponentRegistry": ".sqlite_registry",
+    "migrate_json_registry": ".sqlite_registry",
+    "TransactionalInstaller": ".installer",
+    "InstallResult": ".installer",
+    "InstallMetrics": ".installer",
+    "InstallBatchSummary": ".installer",
+    "InstallPlan": ".dependency.install_plan",
+    "build_install_plan": ".dependency.install_plan",
+    "PlanRecord": ".dependency.plan_record",
+    "GeoAvailabilityIndex": ".geo_availability",
+    "SearchIndex": ".search_index",
+    "RuntimeProfile": ".compatibility",
+    "CompatibilityChecker": ".compatibility",
+    "PlanEstimate": ".dependency.plan_estimate",
+    "ThroughputModel": ".dependency.plan_estimate",
+    "estimate_install_plan": ".dependency.plan_estimate",
+    "ExternalRequirementsResolver": ".dependency.external_requirements",
+    "aggregate_external_requirements": ".dependency.external_requirements",
+    "ManifestRecord": ".binary_snapshot",
+    "dump_manifests": ".binary_snapshot",
+    "load_manifests": ".binary_snapshot",
+    "dump_payload": ".binary_snapshot",
+    "load_payload": ".binary_snapshot",
 
     # Esquemas
-    "ModuleMetaSchema",
-    "AppMetaSchema",
-    "BaseMetaSchema",
+    "ModuleMetaSchema": ".schemas.meta_schema",
+    "AppMetaSchema": ".schemas.meta_schema",
+    "BaseMetaSchema": ".schemas.meta_schema",
+
+    # Instrumentación
+    "Tracer": ".tracing",
+    "InMemoryExporter": ".tracing",
+    "JsonLinesExporter": ".tracing",
+    "set_tracer": ".tracing",
+    "use_tracer": ".tracing",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+if TYPE_CHECKING:
+    from .contracts import StorageBackend
+    from .installer import (
+        TransactionalInstaller,
+        InstallResult,
+        InstallMetrics,
+        InstallBatchSummary,
+    )
+    from .registry import ComponentRegistry, RegistrySnapshot
+    from .journal_registry import JournaledComponentRegistry
+    from .sqlite_registry import SQLiteComponentRegistry, migrate_json_registry
+    from .dependency.install_plan import InstallPlan, build_install_plan
+    from .dependency.plan_record import PlanRecord
+    from .geo_availability import GeoAvailabilityIndex
+    from .search_index import SearchIndex
+    from .compatibility import RuntimeProfile, CompatibilityChecker
+    from .dependency.plan_estimate import (
+        PlanEstimate,
+        ThroughputModel,
+        estimate_install_plan,
+    )
+    from .dependency.external_requirements import (
+        ExternalRequirementsResolver,
+        aggregate_external_requirements,
+    )
+    from .binary_snapshot import (
+        ManifestRecord,
+        dump_manifests,
+        load_manifests,
+        dump_payload,
+        load_payload,
+    )
+    from .schemas.meta_schema import (
+        ModuleMetaSchema,
+        AppMetaSchema,
+        BaseMetaSchema,
+    )
+    from .tracing import Tracer, InMemoryExporter, JsonLinesExporter, set_tracer, use_tracer
+    from .utils.meta_parser import parse_meta_file
+    from .validation.component_validator import ComponentValidator
+    from .validation.bulk_validator import BulkValidator, BulkValidationReport
+    from .validation.validation_cache import ValidationCache
+    from .validation.catalog_validator import CatalogValidator, CatalogReport
+
+# Definir API pública explícita
+__all__ = [
+    *_EXPORTS,
 
     # Excepciones
     "NexusSDKError",
     "ValidationError",
     "DependencyError",
     "InstallationError",
+    "UnavailableComponentError",
+    "IncompatibleComponentError",
+    "SnapshotError",
 ]
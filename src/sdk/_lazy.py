@@ -0,0 +1,31 @@
+"""
+Exportaciones perezosas para los __init__ de paquetes: cada símbolo público
+se importa desde su módulo en el primer acceso (PEP 562) y queda cacheado en
+el namespace del paquete, así `import sdk` no arrastra pydantic ni el installer.
+"""
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    package_globals: Dict[str, Any],
+    exports: Dict[str, str],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Devuelve (__getattr__, __dir__) para un paquete.
+    exports mapea nombre público -> módulo relativo que lo define (".registry").
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module_name, package), name)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,522 @@
+"""
+Snapshots binarios compactos de manifests validados y payloads del registry.
+
+Formato (little-endian):
+
+    cabecera   MAGIC (4 bytes) | versión de formato (u16) | tipo (u8)
+    secciones  u32 longitud + bytes, en este orden:
+               - versión del schema y columnas de manifests (vacía en payloads)
+               - tabla de strings internados
+               - cuerpo (columnas de manifests o valor genérico)
+
+Cada string distinto se guarda una sola vez; licencias, dominios, nombres de
+dependencias, etc. se referencian por índice. Los manifests se guardan por
+columnas (un array por campo) y se cargan sin validación pydantic en
+ManifestRecord, una namedtuple con la forma de model_dump(mode="json").
+"""
+from __future__ import annotations
+
+import gc
+import struct
+import sys
+from array import array
+from collections import namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
+
+from .constants import DEFAULT_ERP_VERSION, DEFAULT_PYTHON, META_SCHEMA_VERSION
+from .exceptions import SnapshotError
+
+if TYPE_CHECKING:
+    from .schemas.meta_schema import BaseMetaSchema
+
+MAGIC = b"NXSB"
+SNAPSHOT_FORMAT_VERSION = 1
+
+KIND_MANIFESTS = 1
+KIND_PAYLOAD = 2
+
+_HEADER = struct.Struct("<4sHB")
+_SECTION = struct.Struct("<I")
+_SWAP = sys.byteorder != "little"
+
+# Campos de BaseMetaSchema, en su orden de declaración
+MANIFEST_FIELDS = (
+    "technical_name", "display_name", "component_type", "package_type", "domain",
+    "python", "erp_version", "geo_restrictions",
+    "version", "license", "keywords", "description", "website", "authors",
+    "depends", "external_dependencies", "dev_dependencies",
+    "installable", "auto_install", "demo_data", "lifecycle",
+    "migration_version", "load_priority", "registry_flags",
+)
+
+# Columnas del cuerpo de manifests: (ruta, codec). "a.b" es el campo b del submodelo a.
+# - str: índice en la tabla de strings (0 = None)
+# - int / bool: array de enteros
+# - strlist: offsets + índices aplanados
+# - flag_or_strlist: bool | List[str] (auto_install)
+# - authors: offsets + una columna str por campo de AuthorInfo
+MANIFEST_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("technical_name", "str"),
+    ("display_name", "str"),
+    ("component_type", "str"),
+    ("package_type", "str"),
+    ("domain", "str"),
+    ("python", "str"),
+    ("erp_version", "str"),
+    ("geo_restrictions.include", "strlist"),
+    ("geo_restrictions.exclude", "strlist"),
+    ("version", "str"),
+    ("license", "str"),
+    ("keywords", "strlist"),
+    ("description", "str"),
+    ("website", "str"),
+    ("authors", "authors"),
+    ("depends", "strlist"),
+    ("external_dependencies.python", "strlist"),
+    ("external_dependencies.bin", "strlist"),
+    ("dev_dependencies", "strlist"),
+    ("installable", "bool"),
+    ("auto_install", "flag_or_strlist"),
+    ("demo_data", "strlist"),
+    ("lifecycle.pre_install", "str"),
+    ("lifecycle.post_install", "str"),
+    ("lifecycle.post_uninstall", "str"),
+    ("migration_version", "str"),
+    ("load_priority", "int"),
+    ("registry_flags.models", "bool"),
+    ("registry_flags.api", "bool"),
+    ("registry_flags.workers", "bool"),
+    ("registry_flags.tasks", "bool"),
+)
+AUTHOR_FIELDS = ("name", "role", "email", "website")
+
+_DEFAULTS: Dict[str, Any] = {
+    "domain": None, "python": DEFAULT_PYTHON, "erp_version": DEFAULT_ERP_VERSION, "license": "MIT",
+    "description": None, "website": None, "migration_version": None,
+    "installable": True, "auto_install": False, "load_priority": 50,
+    "lifecycle.pre_install": None, "lifecycle.post_install": None,
+    "lifecycle.post_uninstall": None,
+    "registry_flags.models": False, "registry_flags.api": False,
+    "registry_flags.workers": False, "registry_flags.tasks": False,
+    "geo_restrictions.include": ["*"],
+}
+
+Manifest = Union["BaseMetaSchema", Mapping[str, Any]]
+
+
+class ManifestRecord(namedtuple("ManifestRecord", MANIFEST_FIELDS)):
+    """
+    Manifest ya validado, cargado desde un snapshot sin pasar por pydantic.
+    Los submodelos son dicts y las listas, listas de str (forma de model_dump).
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._fields, self))
+
+    def to_model(self) -> BaseMetaSchema:
+        """BaseMetaSchema equivalente, construido sin volver a validar."""
+        from .schemas.meta_schema import BaseMetaSchema
+        from .validation.validation_cache import construct_trusted
+
+        return construct_trusted(BaseMetaSchema, self.to_dict())
+
+
+# ----------------------------------------------------------------------
+# STRINGS
+# ----------------------------------------------------------------------
+
+class _StringTable:
+    """Strings internados: el índice 0 se reserva para None."""
+
+    def __init__(self) -> None:
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def ref(self, value: Any) -> int:
+        if value is None:
+            return 0
+        index = self._index.get(value)
+        if index is None:
+            if not isinstance(value, str):
+                raise SnapshotError(f"Se esperaba str o None, no {type(value).__name__}: {value!r}")
+            self.strings.append(value)
+            index = self._index[value] = len(self.strings)
+        return index
+
+    def encode(self) -> bytes:
+        # Longitudes en caracteres: se decodifica el bloque entero de una vez
+        lengths = array("I", (len(s) for s in self.strings))
+        return _pack_array(lengths) + "".join(self.strings).encode("utf-8", "surrogatepass")
+
+
+def _decode_strings(raw: memoryview) -> List[Any]:
+    lengths, offset = _unpack_array("I", raw, 0)
+    try:
+        text = bytes(raw[offset:]).decode("utf-8", "surrogatepass")
+    except UnicodeDecodeError:
+        raise SnapshotError("Tabla de strings corrupta") from None
+    strings: List[Any] = [None]
+    position = 0
+    for length in lengths:
+        strings.append(text[position:position + length])
+        position += length
+    if position != len(text):
+        raise SnapshotError("Tabla de strings corrupta")
+    return strings
+
+
+# ----------------------------------------------------------------------
+# ARRAYS Y SECCIONES
+# ----------------------------------------------------------------------
+
+def _pack_array(values: array) -> bytes:
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return _SECTION.pack(len(values)) + values.tobytes()
+
+
+def _unpack_array(typecode: str, raw: memoryview, offset: int) -> Tuple[array, int]:
+    (count,) = _SECTION.unpack_from(raw, offset)
+    offset += _SECTION.size
+    values = array(typecode)
+    end = offset + count * values.itemsize
+    if end > len(raw):
+        raise SnapshotError("Snapshot truncado")
+    values.frombytes(raw[offset:end])
+    if _SWAP:
+        values.byteswap()
+    return values, end
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Pausa el GC cíclico mientras se construyen los objetos decodificados: son
+    cientos de miles de listas y dicts sin ciclos, y sus recolecciones
+    intermedias costaban más que la propia decodificación.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _sections(data: bytes, kind: int) -> List[memoryview]:
+    raw = memoryview(data)
+    if len(raw) < _HEADER.size:
+        raise SnapshotError("Snapshot truncado")
+    magic, version, found_kind = _HEADER.unpack_from(raw, 0)
+    if magic != MAGIC:
+        raise SnapshotError("No es un snapshot binario del SDK")
+    if version != SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotError(
+            f"Versión de snapshot {version} no soportada (se esperaba {SNAPSHOT_FORMAT_VERSION})"
+        )
+    if found_kind != kind:
+        raise SnapshotError(f"Tipo de snapshot {found_kind} inesperado (se esperaba {kind})")
+
+    sections: List[memoryview] = []
+    offset = _HEADER.size
+    while offset < len(raw):
+        if offset + _SECTION.size > len(raw):
+            raise SnapshotError("Snapshot truncado")
+        (length,) = _SECTION.unpack_from(raw, offset)
+        offset += _SECTION.size
+        if offset + length > len(raw):
+            raise SnapshotError("Snapshot truncado")
+        sections.append(raw[offset:offset + length])
+        offset += length
+    if len(sections) != 3:
+        raise SnapshotError("Snapshot corrupto: número de secciones inesperado")
+    return sections
+
+
+def _assemble(kind: int, *sections: bytes) -> bytes:
+    parts = [_HEADER.pack(MAGIC, SNAPSHOT_FORMAT_VERSION, kind)]
+    for section in sections:
+        parts.append(_SECTION.pack(len(section)))
+        parts.append(section)
+    return b"".join(parts)
+
+
+# ----------------------------------------------------------------------
+# MANIFESTS
+# ----------------------------------------------------------------------
+
+def _as_dict(manifest: Manifest) -> Mapping[str, Any]:
+    if isinstance(manifest, Mapping):
+        return manifest
+    return manifest.model_dump(mode="json")
+
+
+def _column_values(manifests: List[Mapping[str, Any]], path: str) -> List[Any]:
+    default = _DEFAULTS.get(path)
+    if "." not in path:
+        return [m.get(path, default) for m in manifests]
+    parent, child = path.split(".", 1)
+    return [(m.get(parent) or {}).get(child, default) for m in manifests]
+
+
+def _encode_strlist(values: Iterable[Any], strings: _StringTable) -> bytes:
+    offsets = array("I", [0])
+    flat = array("I")
+    for items in values:
+        flat.extend(strings.ref(item) for item in items or ())
+        offsets.append(len(flat))
+    return _pack_array(offsets) + _pack_array(flat)
+
+
+def dump_manifests(manifests: Iterable[Manifest]) -> bytes:
+    """
+    Serializa manifests ya validados (BaseMetaSchema o su model_dump) en un
+    snapshot por columnas. Solo se guardan los campos de BaseMetaSchema.
+    """
+    rows = [_as_dict(m) for m in manifests]
+    strings = _StringTable()
+    body = [_pack_array(array("I", [len(rows)]))]
+
+    for path, codec in MANIFEST_COLUMNS:
+        values = _column_values(rows, path)
+        if codec == "str":
+            body.append(_pack_array(array("I", map(strings.ref, values))))
+        elif codec == "int":
+            body.append(_pack_array(array("q", values)))
+        elif codec == "bool":
+            body.append(_pack_array(array("B", (bool(v) for v in values))))
+        elif codec == "strlist":
+            body.append(_encode_strlist(values, strings))
+        elif codec == "flag_or_strlist":
+            # 0/1 = False/True, 2 = lista
+            flags = array("B", (2 if isinstance(v, list) else int(bool(v)) for v in values))
+            body.append(_pack_array(flags))
+            body.append(_encode_strlist((v if isinstance(v, list) else () for v in values), strings))
+        elif codec == "authors":
+            offsets = array("I", [0])
+            columns = {name: array("I") for name in AUTHOR_FIELDS}
+            for authors in values:
+                for author in authors or ():
+                    for name in AUTHOR_FIELDS:
+                        columns[name].append(strings.ref(author.get(name)))
+                offsets.append(len(columns["name"]))
+            body.append(_pack_array(offsets))
+            body.extend(_pack_array(columns[name]) for name in AUTHOR_FIELDS)
+
+    layout = ";".join(f"{path}:{codec}" for path, codec in MANIFEST_COLUMNS)
+    return _assemble(
+        KIND_MANIFESTS,
+        f"{META_SCHEMA_VERSION}|{layout}".encode("utf-8"),
+        strings.encode(),
+        b"".join(body),
+    )
+
+
+def _slices(flat: List[Any], offsets: array) -> List[List[Any]]:
+    if not flat:
+        return [[] for _ in range(len(offsets) - 1)]
+    bounds = offsets.tolist()
+    return [flat[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def load_manifests(data: bytes) -> List[ManifestRecord]:
+    """
+    Carga un snapshot de manifests en ManifestRecord, sin validación.
+    SnapshotError si el formato, el schema o la disposición de columnas no coinciden.
+    """
+    with _gc_paused():
+        return _load_manifests(data)
+
+
+def _load_manifests(data: bytes) -> List[ManifestRecord]:
+    header, string_section, body = _sections(data, KIND_MANIFESTS)
+    layout = ";".join(f"{path}:{codec}" for path, codec in MANIFEST_COLUMNS)
+    if bytes(header) != f"{META_SCHEMA_VERSION}|{layout}".encode("utf-8"):
+        raise SnapshotError(
+            "El snapshot se generó con otra versión del schema de manifests; regenéralo"
+        )
+    strings = _decode_strings(string_section)
+    lookup = strings.__getitem__
+
+    columns: Dict[str, List[Any]] = {}
+    try:
+        (count,), offset = _unpack_array("I", body, 0)
+        for path, codec in MANIFEST_COLUMNS:
+            if codec == "str":
+                refs, offset = _unpack_array("I", body, offset)
+                columns[path] = list(map(lookup, refs))
+            elif codec == "int":
+                values, offset = _unpack_array("q", body, offset)
+                columns[path] = values.tolist()
+            elif codec == "bool":
+                values, offset = _unpack_array("B", body, offset)
+                columns[path] = list(map(bool, values))
+            elif codec == "strlist":
+                offsets, offset = _unpack_array("I", body, offset)
+                refs, offset = _unpack_array("I", body, offset)
+                columns[path] = _slices(list(map(lookup, refs)), offsets)
+            elif codec == "flag_or_strlist":
+                flags, offset = _unpack_array("B", body, offset)
+                offsets, offset = _unpack_array("I", body, offset)
+                refs, offset = _unpack_array("I", body, offset)
+                lists = _slices(list(map(lookup, refs)), offsets)
+                columns[path] = [
+                    lists[i] if flag == 2 else bool(flag) for i, flag in enumerate(flags)
+                ]
+            elif codec == "authors":
+                offsets, offset = _unpack_array("I", body, offset)
+                fields = []
+                for _ in AUTHOR_FIELDS:
+                    refs, offset = _unpack_array("I", body, offset)
+                    fields.append(map(lookup, refs))
+                authors = [dict(zip(AUTHOR_FIELDS, values)) for values in zip(*fields)]
+                columns[path] = _slices(authors, offsets)
+    except (IndexError, struct.error):
+        raise SnapshotError("Snapshot corrupto o truncado") from None
+
+    if any(len(values) != count for values in columns.values()):
+        raise SnapshotError("Snapshot corrupto: columnas de distinta longitud")
+
+    # Reagrupar las columnas "a.b" en dicts por submodelo
+    top_level: Dict[str, List[Any]] = {}
+    nested: Dict[str, List[str]] = {}
+    for path, _ in MANIFEST_COLUMNS:
+        if "." in path:
+            nested.setdefault(path.split(".", 1)[0], []).append(path)
+        else:
+            top_level[path] = columns[path]
+    for parent, paths in nested.items():
+        keys = [path.split(".", 1)[1] for path in paths]
+        top_level[parent] = [
+            dict(zip(keys, values)) for values in zip(*(columns[p] for p in paths))
+        ]
+
+    return list(map(
+        ManifestRecord._make,
+        zip(*(top_level[name] for name in MANIFEST_FIELDS)),
+    )) if count else []
+
+
+# ----------------------------------------------------------------------
+# PAYLOADS GENÉRICOS (registry)
+# ----------------------------------------------------------------------
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT = range(8)
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_I64_MIN, _I64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+
+def _encode_value(value: Any, strings: _StringTable, out: bytearray) -> None:
+    if value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, int):
+        if not _I64_MIN <= value <= _I64_MAX:
+            raise SnapshotError(f"Entero fuera del rango de 64 bits del snapshot: {value}")
+        out.append(_INT)
+        out += _I64.pack(value)
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        out.append(_STR)
+        out += _SECTION.pack(strings.ref(value))
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST)
+        out += _SECTION.pack(len(value))
+        for item in value:
+            _encode_value(item, strings, out)
+    elif isinstance(value, Mapping):
+        out.append(_DICT)
+        out += _SECTION.pack(len(value))
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise SnapshotError(f"Las claves deben ser str, no {type(key).__name__}: {key!r}")
+            out += _SECTION.pack(strings.ref(key))
+            _encode_value(item, strings, out)
+    else:
+        raise SnapshotError(f"Tipo no serializable en snapshot: {type(value).__name__}")
+
+
+def _decode_value(raw: memoryview, offset: int, strings: List[Any]) -> Tuple[Any, int]:
+    tag = raw[offset]
+    offset += 1
+    if tag == _STR:
+        return strings[_SECTION.unpack_from(raw, offset)[0]], offset + 4
+    if tag == _DICT:
+        (count,) = _SECTION.unpack_from(raw, offset)
+        offset += 4
+        result: Dict[str, Any] = {}
+        for _ in range(count):
+            key = strings[_SECTION.unpack_from(raw, offset)[0]]
+            result[key], offset = _decode_value(raw, offset + 4, strings)
+        return result, offset
+    if tag == _LIST:
+        (count,) = _SECTION.unpack_from(raw, offset)
+        offset += 4
+        items = []
+        for _ in range(count):
+            item, offset = _decode_value(raw, offset, strings)
+            items.append(item)
+        return items, offset
+    if tag == _NONE:
+        return None, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _INT:
+        return _I64.unpack_from(raw, offset)[0], offset + 8
+    if tag == _FLOAT:
+        return _F64.unpack_from(raw, offset)[0], offset + 8
+    raise SnapshotError(f"Snapshot corrupto: etiqueta de valor desconocida {tag}")
+
+
+def dump_payload(value: Any) -> bytes:
+    """
+    Serializa un valor JSON (dicts con claves str, listas, str, números, bool,
+    None), p. ej. los payloads del registry, con sus strings internados.
+    """
+    strings = _StringTable()
+    body = bytearray()
+    _encode_value(value, strings, body)
+    return _assemble(KIND_PAYLOAD, b"", strings.encode(), bytes(body))
+
+
+def load_payload(data: bytes) -> Any:
+    _, string_section, body = _sections(data, KIND_PAYLOAD)
+    strings = _decode_strings(string_section)
+    try:
+        with _gc_paused():
+            value, offset = _decode_value(body, 0, strings)
+    except (IndexError, struct.error):
+        raise SnapshotError("Snapshot corrupto o truncado") from None
+    if offset != len(body):
+        raise SnapshotError("Snapshot corrupto: datos sobrantes tras el valor")
+    return value
+
+
+# ----------------------------------------------------------------------
+# ARCHIVOS
+# ----------------------------------------------------------------------
+
+def write_snapshot(path: Path, data: bytes) -> None:
+    """Escribe un snapshot de forma atómica (archivo temporal + replace)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+def read_manifests(path: Path) -> List[ManifestRecord]:
+    return load_manifests(path.read_bytes())
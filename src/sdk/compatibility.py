@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from semantic_version import SimpleSpec, Version
+
+from .constants import DEFAULT_ERP_VERSION, DEFAULT_PYTHON
+from .schemas.meta_schema import BaseMetaSchema
+
+Manifest = Union[BaseMetaSchema, Mapping[str, Any]]
+
+
+@dataclass(frozen=True)
+class RuntimeProfile:
+    """Runtime destino: versión de Python y del core ERP ("3.12", "1.4.0")."""
+    python: str
+    erp_version: str
+
+    @classmethod
+    def current(cls, erp_version: str) -> "RuntimeProfile":
+        """Perfil del intérprete actual para la versión de ERP indicada."""
+        info = sys.version_info
+        return cls(f"{info.major}.{info.minor}.{info.micro}", erp_version)
+
+
+@dataclass(frozen=True)
+class CompatibilityIssue:
+    component: str
+    field: str  # "python" | "erp_version"
+    spec: str
+    runtime: str
+    message: str
+
+
+@dataclass(frozen=True)
+class CompatibilityReport:
+    profile: RuntimeProfile
+    compatible: List[str] = field(default_factory=list)
+    issues: Dict[str, List[CompatibilityIssue]] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    @property
+    def incompatible(self) -> List[str]:
+        return list(self.issues)
+
+
+# ----------------------------------------------------------------------
+# EVALUACIÓN MEMOIZADA (compartida por todo el proceso)
+# ----------------------------------------------------------------------
+
+@lru_cache(maxsize=4096)
+def _version(raw: str) -> Optional[Version]:
+    try:
+        return Version.coerce(raw)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _spec(raw: str) -> Optional[SimpleSpec]:
+    try:
+        return SimpleSpec(raw)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=65536)
+def spec_matches(spec: str, version: str) -> Optional[bool]:
+    """True/False según el spec acepte la versión; None si alguno es inválido."""
+    parsed_spec, parsed_version = _spec(spec), _version(version)
+    if parsed_spec is None or parsed_version is None:
+        return None
+    return parsed_spec.match(parsed_version)
+
+
+def _check_field(name: str, field_name: str, spec: Any, runtime: str) -> Optional[CompatibilityIssue]:
+    label = "Python" if field_name == "python" else "ERP"
+    if not isinstance(spec, str):
+        # Manifest sin validar (p. ej. python = [">=3.11"]): no llega a spec_matches
+        return CompatibilityIssue(
+            name, field_name, repr(spec), runtime,
+            f"{name}: especificación de {label} inválida {spec!r}; se esperaba un texto",
+        )
+    matches = spec_matches(spec, runtime)
+    if matches:
+        return None
+    message = (
+        f"{name} requiere {label} {spec}; el runtime tiene {runtime}"
+        if matches is False
+        else f"{name}: especificación de {label} inválida '{spec}' o versión de runtime inválida '{runtime}'"
+    )
+    return CompatibilityIssue(name, field_name, spec, runtime, message)
+
+
+def check_specs(
+    name: str,
+    python_spec: Optional[str],
+    erp_spec: Optional[str],
+    profile: RuntimeProfile,
+) -> List[CompatibilityIssue]:
+    """Problemas de compatibilidad de un componente con un perfil (vacío si es compatible)."""
+    issues = [
+        _check_field(name, "python", python_spec or DEFAULT_PYTHON, profile.python),
+        _check_field(name, "erp_version", erp_spec or DEFAULT_ERP_VERSION, profile.erp_version),
+    ]
+    return [issue for issue in issues if issue is not None]
+
+
+def _specs_of(manifest: Manifest) -> Tuple[str, Optional[str], Optional[str]]:
+    if isinstance(manifest, BaseMetaSchema):
+        return manifest.technical_name, manifest.python, manifest.erp_version
+    return manifest["technical_name"], manifest.get("python"), manifest.get("erp_version")
+
+
+class CompatibilityChecker:
+    """
+    Filtro de compatibilidad de un catálogo con perfiles de runtime.
+    La evaluación de cada par (spec, versión) se memoiza para todo el proceso y
+    el reporte de cada perfil se cachea hasta el siguiente cambio del catálogo:
+    todos los tenants con el mismo perfil comparten una única evaluación.
+    """
+
+    def __init__(self, manifests: Iterable[Manifest] = ()):
+        self._specs: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._reports: Dict[RuntimeProfile, CompatibilityReport] = {}
+        for manifest in manifests:
+            self.add(manifest)
+
+    def add(self, manifest: Manifest) -> None:
+        name, python_spec, erp_spec = _specs_of(manifest)
+        self._specs[name] = (python_spec, erp_spec)
+        self._reports.clear()
+
+    def remove(self, name: str) -> None:
+        if self._specs.pop(name, None) is not None:
+            self._reports.clear()
+
+    def evaluate(self, profile: RuntimeProfile) -> CompatibilityReport:
+        """Evalúa todo el catálogo contra un perfil en una sola pasada (cacheada)."""
+        report = self._reports.get(profile)
+        if report is not None:
+            return report
+
+        compatible: List[str] = []
+        issues: Dict[str, List[CompatibilityIssue]] = {}
+        for name, (python_spec, erp_spec) in self._specs.items():
+            found = check_specs(name, python_spec, erp_spec, profile)
+            if found:
+                issues[name] = found
+            else:
+                compatible.append(name)
+
+        report = CompatibilityReport(profile=profile, compatible=compatible, issues=issues)
+        self._reports[profile] = report
+        return report
+
+    def is_compatible(self, name: str, profile: RuntimeProfile) -> bool:
+        return name not in self.evaluate(profile).issues
+
+    def __len__(self) -> int:
+        return len(self._specs)
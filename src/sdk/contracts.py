@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional, Protocol
+from typing import Any, ContextManager, Optional, Protocol
 
 
 class StorageBackend(Protocol):
@@ -33,3 +34,10 @@ class StorageBackend(Protocol):
     def get_default_install_path(self, component_name: str) -> Path:
         """Devuelve la ruta por defecto de instalación."""
         ...
+
+    def batch(self) -> ContextManager[Any]:
+        """
+        Agrupa los registros de varias instalaciones en una sola escritura (opcional).
+        Por defecto no agrupa nada.
+        """
+        return nullcontext()
@@ -1,5 +1,17 @@
-from .resolver import DependencyResolver
-from .version_resolver import VersionResolver
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    "DependencyResolver": ".resolver",
+    "VersionResolver": ".version_resolver",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+if TYPE_CHECKING:
+    from .resolver import DependencyResolver
+    from .version_resolver import VersionResolver
 
 __all__ = [
     "DependencyResolver",
@@ -0,0 +1,388 @@
+"""
+Agregación de dependencias externas (PyPI y binarios) de todo un plan.
+
+Los requisitos Python se interpretan con un subconjunto de PEP 508 / PEP 440
+implementado con la biblioteca estándar: nombre, extras, especificadores
+(==, !=, <=, >=, <, >, ~=, ===, comodines ==X.*), marcador y "nombre @ url".
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .install_plan import InstallPlan
+from ..utils.meta_parser import parse_meta_file
+
+_NAME_RE = re.compile(r"^\s*([A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*(?:\[([^\]]*)\])?\s*")
+_CLAUSE_RE = re.compile(r"^\s*(===|==|!=|<=|>=|~=|<|>)\s*([A-Za-z0-9.*+!_-]+)\s*$")
+_VERSION_RE = re.compile(
+    r"^v?(?:(\d+)!)?(\d+(?:\.\d+)*)"
+    r"(?:[-_.]?(a|alpha|b|beta|c|rc|pre|preview)[-_.]?(\d*))?"
+    r"(?:[-_.]?post[-_.]?(\d*))?"
+    r"(?:[-_.]?dev[-_.]?(\d*))?$",
+    re.IGNORECASE,
+)
+_PRE_ORDER = {"a": 0, "alpha": 0, "b": 1, "beta": 1, "c": 2, "rc": 2, "pre": 2, "preview": 2}
+
+VersionKey = Tuple
+
+
+def canonical_name(name: str) -> str:
+    """Nombre normalizado según PEP 503 ("Django_REST.framework" -> "django-rest-framework")."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def version_key(raw: str) -> VersionKey:
+    """Clave ordenable de una versión PEP 440. ValueError si no es válida."""
+    match = _VERSION_RE.match(raw.strip())
+    if not match:
+        raise ValueError(f"Versión inválida: '{raw}'")
+    epoch, release, pre_kind, pre_n, post, dev = match.groups()
+    parts = [int(p) for p in release.split(".")]
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    if pre_kind:
+        pre: Tuple = (_PRE_ORDER[pre_kind.lower()], int(pre_n or 0))
+    elif dev is not None and post is None:
+        pre = (-1,)  # 1.0.dev1 < 1.0a1
+    else:
+        pre = (3,)
+    post_key = (int(post or 0),) if post is not None else (-1,)
+    dev_key = (int(dev or 0),) if dev is not None else (float("inf"),)
+    return (int(epoch or 0), tuple(parts), pre, post_key, dev_key)
+
+
+@dataclass(frozen=True)
+class Bound:
+    version: str
+    key: VersionKey
+    inclusive: bool
+
+
+@dataclass(frozen=True)
+class ExternalRequirement:
+    """Un requisito Python tal como lo declara un componente."""
+    component: str
+    raw: str
+    name: str
+    extras: Tuple[str, ...] = ()
+    clauses: Tuple[Tuple[str, str], ...] = ()
+    marker: Optional[str] = None
+    url: Optional[str] = None
+
+
+def parse_requirement(raw: str, component: str = "") -> ExternalRequirement:
+    """Parsea un requisito PEP 508 (subconjunto). ValueError si está mal formado."""
+    text, _, marker = raw.partition(";")
+    match = _NAME_RE.match(text)
+    if not match:
+        raise ValueError(f"Requisito inválido: '{raw}'")
+    name, extras = match.group(1), match.group(2)
+    rest = text[match.end():].strip()
+
+    url = None
+    clauses: List[Tuple[str, str]] = []
+    if rest.startswith("@"):
+        url = rest[1:].strip()
+        if not url:
+            raise ValueError(f"Requisito inválido (URL vacía): '{raw}'")
+    elif rest:
+        if rest.startswith("(") and rest.endswith(")"):
+            rest = rest[1:-1]
+        for clause in rest.split(","):
+            clause_match = _CLAUSE_RE.match(clause)
+            if not clause_match:
+                raise ValueError(f"Especificador inválido '{clause.strip()}' en '{raw}'")
+            op, version = clause_match.groups()
+            if op != "===":
+                version_key(version.rstrip(".*") if version.endswith(".*") else version)
+                if version.endswith(".*") and op not in ("==", "!="):
+                    raise ValueError(f"Comodín no permitido con '{op}' en '{raw}'")
+            clauses.append((op, version))
+
+    return ExternalRequirement(
+        component=component,
+        raw=raw,
+        name=canonical_name(name),
+        extras=tuple(sorted({e.strip().lower() for e in (extras or "").split(",") if e.strip()})),
+        clauses=tuple(clauses),
+        marker=_normalize_marker(marker),
+        url=url,
+    )
+
+
+def _normalize_marker(marker: str) -> Optional[str]:
+    """Marcador con espaciado canónico, para agrupar 'a<"1"' y 'a < "1"' juntos."""
+    marker = re.sub(r"\s*(<=|>=|==|!=|~=|<|>)\s*", r" \1 ", marker)
+    return " ".join(marker.split()).replace("'", '"') or None
+
+
+def _next_release(version: str, depth: int) -> str:
+    """Primera versión fuera del prefijo: ("1.4.2", 2) -> "1.5"."""
+    parts = [int(p) for p in re.match(r"\d+(?:\.\d+)*", version).group(0).split(".")]
+    parts = (parts + [0] * depth)[:depth]
+    parts[-1] += 1
+    return ".".join(str(p) for p in parts)
+
+
+@dataclass(frozen=True)
+class MergedRequirement:
+    """Restricción combinada de una distribución para todo el plan."""
+    name: str
+    specifier: str
+    extras: Tuple[str, ...]
+    marker: Optional[str]
+    components: Tuple[str, ...]
+    url: Optional[str] = None
+
+    def __str__(self) -> str:
+        extras = f"[{','.join(self.extras)}]" if self.extras else ""
+        requirement = f"{self.name}{extras}"
+        if self.url:
+            requirement += f" @ {self.url}"
+        elif self.specifier:
+            requirement += self.specifier
+        if self.marker:
+            requirement += f" ; {self.marker}"
+        return requirement
+
+
+@dataclass(frozen=True)
+class RequirementConflict:
+    name: str
+    marker: Optional[str]
+    message: str
+    requirements: Tuple[ExternalRequirement, ...]
+
+
+@dataclass(frozen=True)
+class BinaryRequirement:
+    name: str
+    components: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ExternalRequirementsReport:
+    fingerprint: str
+    requirements: List[MergedRequirement] = field(default_factory=list)
+    binaries: List[BinaryRequirement] = field(default_factory=list)
+    conflicts: List[RequirementConflict] = field(default_factory=list)
+    invalid: List[Tuple[str, str, str]] = field(default_factory=list)  # (componente, requisito, error)
+
+    @property
+    def ok(self) -> bool:
+        return not self.conflicts and not self.invalid
+
+    def requirements_txt(self) -> str:
+        """Un requisito por línea, deduplicado y ordenado, con su origen como comentario."""
+        return "".join(
+            f"{requirement}  # {', '.join(requirement.components)}\n"
+            for requirement in self.requirements
+        )
+
+    def binary_checklist(self) -> List[str]:
+        return [
+            f"[ ] {binary.name} ({', '.join(binary.components)})" for binary in self.binaries
+        ]
+
+
+def _merge(name: str, marker: Optional[str], group: List[ExternalRequirement]) -> Tuple[MergedRequirement, Optional[RequirementConflict]]:
+    lower: Optional[Bound] = None
+    upper: Optional[Bound] = None
+    pins: Dict[str, VersionKey] = {}
+    arbitrary: set = set()
+    excluded: Dict[str, VersionKey] = {}
+    passthrough: set = set()
+    urls = {r.url for r in group if r.url}
+
+    def raise_lower(bound: Bound) -> None:
+        nonlocal lower
+        if lower is None or bound.key > lower.key or (bound.key == lower.key and not bound.inclusive):
+            lower = bound
+
+    def cut_upper(bound: Bound) -> None:
+        nonlocal upper
+        if upper is None or bound.key < upper.key or (bound.key == upper.key and not bound.inclusive):
+            upper = bound
+
+    for requirement in group:
+        for op, version in requirement.clauses:
+            if op == "===":
+                arbitrary.add(version)
+            elif version.endswith(".*"):
+                prefix = version[:-2]
+                if op == "==":
+                    depth = prefix.count(".") + 1
+                    raise_lower(Bound(prefix, version_key(prefix), True))
+                    ceiling = _next_release(prefix, depth)
+                    cut_upper(Bound(ceiling, version_key(ceiling), False))
+                else:
+                    passthrough.add(f"!={version}")
+            elif op == "==":
+                pins[version] = version_key(version)
+            elif op == "!=":
+                excluded[version] = version_key(version)
+            elif op == ">=":
+                raise_lower(Bound(version, version_key(version), True))
+            elif op == ">":
+                raise_lower(Bound(version, version_key(version), False))
+            elif op == "<=":
+                cut_upper(Bound(version, version_key(version), True))
+            elif op == "<":
+                cut_upper(Bound(version, version_key(version), False))
+            elif op == "~=":
+                depth = max(1, version.count("."))
+                raise_lower(Bound(version, version_key(version), True))
+                ceiling = _next_release(version, depth)
+                cut_upper(Bound(ceiling, version_key(ceiling), False))
+
+    problem: Optional[str] = None
+    distinct_pins = set(pins.values())
+    if len(urls) > 1:
+        problem = f"URLs distintas: {', '.join(sorted(urls))}"
+    elif len(distinct_pins) > 1 or len(arbitrary) > 1:
+        problem = f"versiones fijadas incompatibles: {', '.join(sorted(pins) + sorted(arbitrary))}"
+    elif lower is not None and upper is not None and (
+        lower.key > upper.key
+        or (lower.key == upper.key and not (lower.inclusive and upper.inclusive))
+    ):
+        problem = f"rango vacío: >{'=' if lower.inclusive else ''}{lower.version} y <{'=' if upper.inclusive else ''}{upper.version}"
+    elif lower is not None and upper is not None and lower.key == upper.key and lower.key in excluded.values():
+        problem = f"rango vacío: solo admite {lower.version}, excluida con !="
+    elif pins:
+        pin_version, pin_key = next(iter(pins.items()))
+        if lower is not None and (pin_key < lower.key or (pin_key == lower.key and not lower.inclusive)):
+            problem = f"=={pin_version} por debajo de {lower.version}"
+        elif upper is not None and (pin_key > upper.key or (pin_key == upper.key and not upper.inclusive)):
+            problem = f"=={pin_version} por encima de {upper.version}"
+        elif pin_key in excluded.values():
+            problem = f"=={pin_version} excluida con !="
+
+    if arbitrary:
+        clauses = [f"==={next(iter(arbitrary))}"]
+    elif pins:
+        clauses = [f"=={min(pins, key=pins.get)}"]
+    else:
+        clauses = []
+        if lower is not None:
+            clauses.append(f">{'=' if lower.inclusive else ''}{lower.version}")
+        if upper is not None:
+            clauses.append(f"<{'=' if upper.inclusive else ''}{upper.version}")
+        clauses += [f"!={v}" for v in sorted(excluded, key=excluded.get)]
+        clauses += sorted(passthrough)
+
+    merged = MergedRequirement(
+        name=name,
+        specifier=",".join(clauses),
+        extras=tuple(sorted({e for r in group for e in r.extras})),
+        marker=marker,
+        components=tuple(dict.fromkeys(r.component for r in group)),
+        url=next(iter(urls)) if len(urls) == 1 else None,
+    )
+    conflict = RequirementConflict(name, marker, problem, tuple(group)) if problem else None
+    return merged, conflict
+
+
+def aggregate_external_requirements(
+    manifests: List[Tuple[str, Dict]],
+    fingerprint: str = "",
+) -> ExternalRequirementsReport:
+    """
+    Combina los external_dependencies de varios manifests (nombre, dict crudo).
+    Agrupa por distribución y marcador, e interseca las restricciones de cada grupo;
+    las de la misma distribución sin marcador se suman a cada grupo con marcador.
+    """
+    groups: "OrderedDict[Tuple[str, Optional[str]], List[ExternalRequirement]]" = OrderedDict()
+    binaries: Dict[str, List[str]] = {}
+    invalid: List[Tuple[str, str, str]] = []
+
+    for component, manifest in manifests:
+        external = manifest.get("external_dependencies") or {}
+        for raw in external.get("python") or []:
+            try:
+                requirement = parse_requirement(str(raw), component)
+            except ValueError as e:
+                invalid.append((component, str(raw), str(e)))
+                continue
+            groups.setdefault((requirement.name, requirement.marker), []).append(requirement)
+        for raw in external.get("bin") or []:
+            key = str(raw).strip()
+            if key:
+                users = binaries.setdefault(key.lower(), [key])
+                if component not in users[1:]:
+                    users.append(component)
+
+    requirements: List[MergedRequirement] = []
+    conflicts: List[RequirementConflict] = []
+    unmarked_conflicts: set = set()
+    # El grupo sin marcador de cada distribución se procesa antes que los marcados
+    for (name, marker), group in sorted(groups.items(), key=lambda item: (item[0][0], item[0][1] or "")):
+        # Las restricciones sin marcador se aplican siempre: también se intersecan
+        # con cada grupo con marcador de la misma distribución
+        if marker is not None:
+            group = groups.get((name, None), []) + group
+        merged, conflict = _merge(name, marker, group)
+        requirements.append(merged)
+        if conflict is None:
+            continue
+        if marker is None:
+            unmarked_conflicts.add(name)
+        elif name in unmarked_conflicts:
+            # Conflicto heredado del grupo sin marcador: ya está reportado una vez
+            continue
+        conflicts.append(conflict)
+
+    return ExternalRequirementsReport(
+        fingerprint=fingerprint,
+        requirements=requirements,
+        binaries=[
+            BinaryRequirement(users[0], tuple(users[1:]))
+            for _, users in sorted(binaries.items())
+        ],
+        conflicts=conflicts,
+        invalid=invalid,
+    )
+
+
+def plan_fingerprint(plan: InstallPlan) -> str:
+    """Huella del plan: componentes en orden y contenido de sus __meta__.py."""
+    digest = hashlib.sha256()
+    for name in plan.install_order:
+        digest.update(name.encode())
+        digest.update(b"\0")
+        digest.update(hashlib.sha256((plan.paths_by_name[name] / "__meta__.py").read_bytes()).digest())
+    return digest.hexdigest()
+
+
+class ExternalRequirementsResolver:
+    """
+    Requisitos externos agregados de un plan, cacheados por huella del plan:
+    volver a pedir el mismo plan (mismos componentes y manifests) no parsea nada.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, ExternalRequirementsReport]" = OrderedDict()
+
+    def resolve(self, plan: InstallPlan) -> ExternalRequirementsReport:
+        fingerprint = plan_fingerprint(plan)
+        report = self._cache.get(fingerprint)
+        if report is not None:
+            self._cache.move_to_end(fingerprint)
+            return report
+
+        report = aggregate_external_requirements(
+            [
+                (name, parse_meta_file(Path(plan.paths_by_name[name]) / "__meta__.py"))
+                for name in plan.install_order
+            ],
+            fingerprint=fingerprint,
+        )
+        self._cache[fingerprint] = report
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return report
@@ -1,31 +1,61 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
+from .plan_record import PlanRecord
+from ..compatibility import RuntimeProfile, check_specs
 from .resolver import DependencyResolver
 from ..schemas.meta_schema import BaseMetaSchema
 from ..utils.meta_parser import parse_meta_file
-from ..exceptions import ValidationError
+from ..exceptions import IncompatibleComponentError, UnavailableComponentError, ValidationError
 
 
 @dataclass(frozen=True)
 class InstallPlan:
     install_order: List[str]
-    components: Dict[str, BaseMetaSchema]
+    # BaseMetaSchema completos, o PlanRecord compactos en planes lean
+    components: Dict[str, Union[BaseMetaSchema, PlanRecord]]
     optional_skipped: List[str]
     total: int
     paths_by_name: Dict[str, Path]
+    # Componentes podados del plan -> motivo (incompatibles y sus dependientes)
+    excluded: Dict[str, str] = field(default_factory=dict)
 
+    @property
+    def lean(self) -> bool:
+        return any(isinstance(entry, PlanRecord) for entry in self.components.values())
 
-def build_install_plan(component_paths: List[Path]) -> InstallPlan:
+    def meta(self, name: str) -> BaseMetaSchema:
+        """Manifest completo de un componente; en planes lean se carga en este momento."""
+        entry = self.components[name]
+        return entry.load_meta() if isinstance(entry, PlanRecord) else entry
+
+
+def build_install_plan(
+    component_paths: List[Path],
+    lean: bool = False,
+    country: Optional[str] = None,
+    runtime: Optional[RuntimeProfile] = None,
+    on_incompatible: Literal["reject", "prune"] = "reject",
+) -> InstallPlan:
     """
     Construye un plan de instalación ordenado por dependencias.
     Requiere que todas las dependencias estén incluidas en component_paths.
+    Con lean=True los componentes se guardan como PlanRecord (__slots__, sin
+    autores, descripciones ni keywords): pensado para catálogos muy grandes.
+    Con country, rechaza el plan antes de resolverlo si algún componente no
+    está disponible en ese país según sus geo_restrictions.
+    Con runtime, evalúa python / erp_version de cada componente: "reject" lanza
+    IncompatibleComponentError y "prune" los quita del plan (junto con sus
+    dependientes) y los anota en InstallPlan.excluded.
     """
-    resolver = DependencyResolver()
-    paths_by_name: Dict[str, Path] = {}
+    from ..geo_availability import is_available
+
+    manifests: List[Tuple[Path, str, Dict[str, Any]]] = []
+    unavailable: List[str] = []
+    incompatible: Dict[str, List[Any]] = {}
 
     for path in component_paths:
         path = path.resolve()
@@ -33,8 +63,40 @@ def build_install_plan(component_paths: List[Path]) -> InstallPlan:
         name = meta.get("technical_name")
         if not name:
             raise ValidationError(f"Falta technical_name en {path / '__meta__.py'}")
-        paths_by_name[name] = path
+        if country is not None:
+            try:
+                available = is_available(meta.get("geo_restrictions"), country)
+            except ValidationError as e:
+                raise ValidationError(f"{path / '__meta__.py'}: {e}") from None
+            if not available:
+                unavailable.append(name)
+        if runtime is not None:
+            issues = check_specs(name, meta.get("python"), meta.get("erp_version"), runtime)
+            if issues:
+                incompatible[name] = issues
+        manifests.append((path, name, meta))
+
+    if unavailable:
+        raise UnavailableComponentError(unavailable, country)
+    if incompatible and on_incompatible == "reject":
+        raise IncompatibleComponentError(
+            issue for issues in incompatible.values() for issue in issues
+        )
+
+    excluded = _prune(manifests, {
+        name: "; ".join(issue.message for issue in issues)
+        for name, issues in incompatible.items()
+    })
+
+    resolver = DependencyResolver(lean=lean)
+    paths_by_name: Dict[str, Path] = {}
+    for path, name, _ in manifests:
+        if name in excluded:
+            continue
         resolver.load_component(path)
+        entry = resolver.components.get(name)
+        # En planes lean la ruta se comparte con el PlanRecord
+        paths_by_name[name] = entry.path if isinstance(entry, PlanRecord) else path
 
     result = resolver.resolve()
 
@@ -44,4 +106,29 @@ def build_install_plan(component_paths: List[Path]) -> InstallPlan:
         optional_skipped=result["optional_skipped"],
         total=result["total"],
         paths_by_name=paths_by_name,
+        excluded=excluded,
     )
+
+
+def _prune(
+    manifests: List[Tuple[Path, str, Dict[str, Any]]],
+    removed: Dict[str, str],
+) -> Dict[str, str]:
+    """Añade a removed, transitivamente, los componentes que dependen de uno eliminado."""
+    if not removed:
+        return removed
+    dependents: Dict[str, List[str]] = {}
+    for _, name, meta in manifests:
+        for dep in meta.get("depends") or []:
+            dep_name = dep.get("name") if isinstance(dep, dict) else dep
+            if isinstance(dep_name, str):
+                dependents.setdefault(dep_name, []).append(name)
+
+    pending = list(removed)
+    while pending:
+        current = pending.pop()
+        for dependent in dependents.get(current, []):
+            if dependent not in removed:
+                removed[dependent] = f"depende de '{current}', excluido del plan"
+                pending.append(dependent)
+    return removed
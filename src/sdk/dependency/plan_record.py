@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from ..schemas.meta_schema import BaseMetaSchema
+from ..utils.meta_parser import parse_meta_file
+
+# (nombre, especificación de versión, opcional)
+Requirement = Tuple[str, Optional[str], bool]
+
+
+class PlanRecord:
+    """
+    Registro compacto de un componente dentro de un plan de instalación.
+    Solo conserva lo necesario para ordenar, estimar e instalar; el
+    BaseMetaSchema completo se vuelve a cargar bajo demanda con load_meta().
+    Los nombres se internan: cada dependencia comparte la cadena de su destino.
+    """
+
+    __slots__ = ("name", "version", "path", "requires", "pre_install", "post_install")
+
+    def __init__(
+        self,
+        name: str,
+        version: str,
+        path: Path,
+        requires: Tuple[Requirement, ...] = (),
+        pre_install: Optional[str] = None,
+        post_install: Optional[str] = None,
+    ):
+        self.name = sys.intern(name)
+        self.version = version
+        self.path = path
+        self.requires = requires
+        self.pre_install = pre_install
+        self.post_install = post_install
+
+    @classmethod
+    def from_meta(cls, meta: BaseMetaSchema, path: Path, dependencies: Iterable = ()) -> "PlanRecord":
+        """dependencies: DependencySchema ya normalizados del componente."""
+        requires = tuple(
+            (sys.intern(dep.name), dep.version, dep.optional) for dep in dependencies
+        )
+        return cls(
+            name=meta.technical_name,
+            version=meta.version,
+            path=path,
+            requires=requires,
+            pre_install=meta.lifecycle.pre_install,
+            post_install=meta.lifecycle.post_install,
+        )
+
+    @property
+    def technical_name(self) -> str:
+        return self.name
+
+    @property
+    def depends(self) -> Tuple[str, ...]:
+        return tuple(name for name, _, _ in self.requires)
+
+    @property
+    def hooks(self) -> Tuple[str, ...]:
+        return tuple(hook for hook in (self.pre_install, self.post_install) if hook)
+
+    def load_meta(self) -> BaseMetaSchema:
+        """Carga y valida el manifest completo. No se cachea: el llamador decide cuánto vive."""
+        return BaseMetaSchema(**parse_meta_file(self.path / "__meta__.py"))
+
+    def __repr__(self) -> str:
+        return f"PlanRecord({self.name!r}, {self.version!r})"
+
+
+def dependency_names(entry: Union[BaseMetaSchema, PlanRecord]) -> List[str]:
+    """Nombres de las dependencias declaradas por un componente de un plan."""
+    if isinstance(entry, PlanRecord):
+        return list(entry.depends)
+    names: List[str] = []
+    for dep in entry.depends:
+        if isinstance(dep, str):
+            names.append(dep)
+        elif isinstance(dep, dict) and dep.get("name"):
+            names.append(dep["name"])
+    return names
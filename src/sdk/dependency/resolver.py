@@ -1,13 +1,15 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from .dependency_graph import DependencyGraph
 from .errors import MissingDependencyError
+from .plan_record import PlanRecord
 from .version_resolver import VersionResolver
 
 from ..exceptions import ValidationError
 from ..schemas.meta_schema import BaseMetaSchema
 from ..schemas.dependency_schema import DependencySchema
+from ..tracing import span
 from ..utils.meta_parser import parse_meta_file
 
 
@@ -16,15 +18,22 @@ class DependencyResolver:
     Resuelve dependencias entre componentes ERP Nexus
     """
 
-    def __init__(self):
+    def __init__(self, lean: bool = False):
+        # lean: guarda un PlanRecord por componente en lugar del BaseMetaSchema
+        # completo; el schema se valida al cargar y se descarta.
+        self.lean = lean
         self.graph = DependencyGraph()
-        self.components: Dict[str, BaseMetaSchema] = {}
+        self.components: Dict[str, Union[BaseMetaSchema, PlanRecord]] = {}
 
     # ------------------------------------------------------------------
     # LOAD
     # ------------------------------------------------------------------
 
     def load_component(self, path: Path) -> None:
+        with span("resolver.load_component", component=path.name):
+            self._load_component(path)
+
+    def _load_component(self, path: Path) -> None:
         path = path.resolve()
         meta_path = path / "__meta__.py"
 
@@ -39,10 +48,14 @@ class DependencyResolver:
                 f"El directorio '{path.name}' no coincide con technical_name '{meta.technical_name}'"
             )
 
-        self.components[meta.technical_name] = meta
+        dependencies = self._normalize_dependencies(meta)
+        if self.lean:
+            self.components[meta.technical_name] = PlanRecord.from_meta(meta, path, dependencies)
+        else:
+            self.components[meta.technical_name] = meta
         self.graph.add_node(meta.technical_name)
 
-        for dep in self._normalize_dependencies(meta):
+        for dep in dependencies:
             self.graph.add_dependency(dep.name, meta.technical_name)
 
     # ------------------------------------------------------------------
@@ -67,6 +80,13 @@ class DependencyResolver:
 
         return normalized
 
+    def _requirements(
+        self, entry: Union[BaseMetaSchema, PlanRecord]
+    ) -> Iterator[Tuple[str, Optional[str], bool]]:
+        if isinstance(entry, PlanRecord):
+            return iter(entry.requires)
+        return ((d.name, d.version, d.optional) for d in self._normalize_dependencies(entry))
+
     # ------------------------------------------------------------------
     # RESOLVE
     # ------------------------------------------------------------------
@@ -75,29 +95,34 @@ class DependencyResolver:
         """
         Devuelve un Install Plan (NO instala nada)
         """
+        with span("resolver.resolve", components=len(self.components)):
+            return self._resolve()
+
+    def _resolve(self) -> Dict:
 
         optional_skipped: List[str] = []
 
         # Validar dependencias
         for name, meta in self.components.items():
-            for dep in self._normalize_dependencies(meta):
+            for dep_name, dep_version, dep_optional in self._requirements(meta):
 
-                if dep.name not in self.components:
-                    if dep.optional:
-                        optional_skipped.append(dep.name)
+                if dep_name not in self.components:
+                    if dep_optional:
+                        optional_skipped.append(dep_name)
                         continue
                     raise MissingDependencyError(
-                        f"{name} depende de '{dep.name}' que no está cargado"
+                        f"{name} depende de '{dep_name}' que no está cargado"
                     )
 
-                if dep.version:
+                if dep_version:
                     VersionResolver.validate(
-                        self.components[dep.name].version,
-                        dep.version,
-                        dep.name
+                        self.components[dep_name].version,
+                        dep_version,
+                        dep_name
                     )
 
-        order = self.graph.topological_sort()
+        with span("resolver.topological_sort"):
+            order = self.graph.topological_sort()
 
         return {
             "install_order": order,
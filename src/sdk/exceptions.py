@@ -6,10 +6,56 @@ class ValidationError(NexusSDKError):
     """Error durante la validación de un componente."""
     pass
 
+class SourceSyntaxError(ValidationError):
+    """Uno o más archivos Python del componente tienen errores de sintaxis."""
+
+    def __init__(self, issues):
+        self.issues = list(issues)
+        details = "\n".join(f"  - {issue}" for issue in self.issues)
+        super().__init__(
+            f"{len(self.issues)} archivo(s) con errores de sintaxis:\n{details}"
+        )
+
+class UnavailableComponentError(ValidationError):
+    """Componentes no disponibles en el país indicado (geo_restrictions)."""
+
+    def __init__(self, components, country):
+        self.components = list(components)
+        self.country = country
+        super().__init__(
+            f"No disponibles en {country}: {', '.join(self.components)}"
+        )
+
+class IncompatibleComponentError(ValidationError):
+    """Componentes cuyos specs python / erp_version no admiten el runtime destino."""
+
+    def __init__(self, issues):
+        self.issues = list(issues)
+        details = "\n".join(f"  - {issue.message}" for issue in self.issues)
+        super().__init__(
+            f"{len(self.issues)} incompatibilidad(es) con el runtime:\n{details}"
+        )
+
 class DependencyError(NexusSDKError):
     """Error relacionado con la resolución de dependencias."""
     pass
 
 class InstallationError(NexusSDKError):
-    """Error durante la instalación de un componente."""
+    """
+    Error durante la instalación de un componente.
+    metrics: InstallMetrics de la instalación fallida (fase, rollback), si se conoce.
+    summary: InstallBatchSummary del lote hasta el fallo, en install_many.
+    """
+
+    def __init__(self, message="", metrics=None, summary=None):
+        super().__init__(message)
+        self.metrics = metrics
+        self.summary = summary
+
+class SnapshotError(NexusSDKError):
+    """Snapshot binario ilegible: formato, versión o schema distintos, o datos corruptos."""
+    pass
+
+class TemplateError(NexusSDKError):
+    """Error al renderizar un template (placeholders sin valor o desconocidos)."""
     pass
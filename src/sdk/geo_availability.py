@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from pydantic import ValidationError as PydanticValidationError
+
+from .dependency.install_plan import InstallPlan
+from .exceptions import ValidationError
+from .dependency.plan_record import dependency_names
+from .schemas.meta_schema import BaseMetaSchema, GeoRestrictions
+
+WILDCARD = "*"
+
+Restrictions = Union[GeoRestrictions, Mapping[str, Any], None]
+
+
+def normalize_country(country: str) -> str:
+    return country.strip().upper()
+
+
+def _rules(restrictions: Restrictions) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    (include, exclude) normalizados. Sin restricciones: disponible en todas partes.
+    Los valores crudos (p. ej. de parse_meta_file) se validan contra GeoRestrictions:
+    un include "ES" no se recorre letra a letra, se rechaza con ValidationError.
+    """
+    if restrictions is None:
+        return frozenset({WILDCARD}), frozenset()
+    if not isinstance(restrictions, GeoRestrictions):
+        try:
+            restrictions = GeoRestrictions.model_validate(restrictions)
+        except PydanticValidationError as e:
+            details = "; ".join(
+                f"{'.'.join(str(p) for p in item['loc']) or 'geo_restrictions'}: {item['msg']}"
+                for item in e.errors()
+            )
+            raise ValidationError(f"geo_restrictions inválido ({restrictions!r}): {details}") from None
+    include, exclude = restrictions.include, restrictions.exclude
+    return (
+        frozenset(WILDCARD if c == WILDCARD else normalize_country(c) for c in include),
+        frozenset(WILDCARD if c == WILDCARD else normalize_country(c) for c in exclude),
+    )
+
+
+def is_available(restrictions: Restrictions, country: str) -> bool:
+    """
+    Evalúa geo_restrictions para un país: disponible si include contiene "*" o
+    el país, y exclude no contiene ni "*" ni el país. exclude tiene prioridad.
+    """
+    include, exclude = _rules(restrictions)
+    country = normalize_country(country)
+    if WILDCARD in exclude or country in exclude:
+        return False
+    return WILDCARD in include or country in include
+
+
+class GeoAvailabilityIndex:
+    """
+    Índice invertido país -> componentes disponibles.
+
+    Los conjuntos por país se materializan una vez (y tras cada cambio, en la
+    siguiente consulta) para todos los países mencionados en algún include o
+    exclude; cualquier otro país solo ve los componentes con include "*", un
+    conjunto compartido. Así available() es O(1) y recorrer su resultado O(resultado).
+    """
+
+    def __init__(self, restrictions: Optional[Mapping[str, Restrictions]] = None):
+        self._rules: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        self._by_country: Optional[Dict[str, FrozenSet[str]]] = None
+        self._everywhere: FrozenSet[str] = frozenset()
+        for name, value in (restrictions or {}).items():
+            self.add(name, value)
+
+    @classmethod
+    def from_manifests(
+        cls, manifests: Iterable[Union[BaseMetaSchema, Mapping[str, Any]]]
+    ) -> "GeoAvailabilityIndex":
+        index = cls()
+        for manifest in manifests:
+            if isinstance(manifest, BaseMetaSchema):
+                index.add(manifest.technical_name, manifest.geo_restrictions)
+            else:
+                index.add(manifest["technical_name"], manifest.get("geo_restrictions"))
+        return index
+
+    # ------------------------------------------------------------------
+    # MANTENIMIENTO
+    # ------------------------------------------------------------------
+
+    def add(self, name: str, restrictions: Restrictions) -> None:
+        self._rules[name] = _rules(restrictions)
+        self._by_country = None
+
+    def remove(self, name: str) -> None:
+        if self._rules.pop(name, None) is not None:
+            self._by_country = None
+
+    def _build(self) -> Dict[str, FrozenSet[str]]:
+        everywhere: Set[str] = set()
+        explicit: Dict[str, Set[str]] = {}
+        excluded: Dict[str, Set[str]] = {}
+
+        for name, (include, exclude) in self._rules.items():
+            if WILDCARD in exclude:
+                continue
+            if WILDCARD in include:
+                everywhere.add(name)
+            for country in include - {WILDCARD}:
+                explicit.setdefault(country, set()).add(name)
+            for country in exclude:
+                excluded.setdefault(country, set()).add(name)
+
+        by_country: Dict[str, FrozenSet[str]] = {}
+        for country in explicit.keys() | excluded.keys():
+            blocked = excluded.get(country, set())
+            by_country[country] = frozenset(
+                (everywhere - blocked) | (explicit.get(country, set()) - blocked)
+            )
+
+        self._everywhere = frozenset(everywhere)
+        self._by_country = by_country
+        return by_country
+
+    # ------------------------------------------------------------------
+    # CONSULTAS
+    # ------------------------------------------------------------------
+
+    def available(self, country: str) -> FrozenSet[str]:
+        """Componentes disponibles en el país."""
+        by_country = self._by_country if self._by_country is not None else self._build()
+        return by_country.get(normalize_country(country), self._everywhere)
+
+    def is_available(self, name: str, country: str) -> bool:
+        """Los componentes desconocidos para el índice no tienen restricciones."""
+        if name not in self._rules:
+            return True
+        return name in self.available(country)
+
+    def filter(self, names: Iterable[str], country: str) -> List[str]:
+        """Nombres disponibles en el país, conservando el orden de entrada."""
+        return [name for name in names if self.is_available(name, country)]
+
+    def countries(self) -> List[str]:
+        """Países con reglas explícitas (el resto solo ve los componentes con "*")."""
+        by_country = self._by_country if self._by_country is not None else self._build()
+        return sorted(by_country)
+
+    def filter_plan(self, plan: InstallPlan, country: str) -> InstallPlan:
+        """
+        Plan reducido a lo instalable en el país: se quitan los componentes no
+        disponibles y, transitivamente, los que dependen de ellos.
+        """
+        removed: Dict[str, str] = {}
+        for name in plan.install_order:
+            if not self.is_available(name, country):
+                removed[name] = f"no disponible en {normalize_country(country)}"
+                continue
+            blocked = next(
+                (dep for dep in dependency_names(plan.components[name]) if dep in removed), None
+            )
+            if blocked is not None:
+                removed[name] = f"depende de '{blocked}', excluido del plan"
+
+        order = [name for name in plan.install_order if name not in removed]
+        return InstallPlan(
+            install_order=order,
+            components={name: plan.components[name] for name in order},
+            optional_skipped=plan.optional_skipped,
+            total=len(order),
+            paths_by_name={
+                name: path for name, path in plan.paths_by_name.items() if name not in removed
+            },
+            excluded={**plan.excluded, **removed},
+        )
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._rules
@@ -1,25 +1,146 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Literal, Optional, Tuple
 
+from .compatibility import RuntimeProfile
 from .contracts import StorageBackend
 from .exceptions import InstallationError
 from .schemas.meta_schema import BaseMetaSchema
 from .validation.component_validator import ComponentValidator
 from .dependency.install_plan import build_install_plan, InstallPlan
+from .dependency.plan_estimate import (
+    estimate_install_plan,
+    scan_source,
+    PlanEstimate,
+    SourceStats,
+    ThroughputModel,
+)
+from .tracing import span
 from .utils.meta_parser import parse_meta_file
 
 
 HookRunner = Callable[[str, Path, BaseMetaSchema], None]
 
 
+# Fases medidas de cada instalación, en orden de ejecución
+INSTALL_PHASES = ("validate", "pre_hook", "copy", "register", "post_hook")
+
+
+@dataclass(frozen=True)
+class InstallMetrics:
+    """
+    Métricas de una instalación.
+    - timings: segundos por fase ejecutada (ver INSTALL_PHASES).
+    - files / bytes: contenido copiado del componente.
+    - attempts: intentos de copy_files (1 + reintentos).
+    - rolled_back / failed_phase: solo en instalaciones fallidas.
+    """
+    timings: Dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+    files: int = 0
+    bytes: int = 0
+    attempts: int = 1
+    rolled_back: bool = False
+    failed_phase: Optional[str] = None
+
+
 @dataclass(frozen=True)
 class InstallResult:
     name: str
     version: str
     installed_path: Path
+    metrics: InstallMetrics = field(default_factory=InstallMetrics)
+
+
+@dataclass(frozen=True)
+class InstallBatchSummary:
+    """
+    Totales de un install_many.
+    - duration: tiempo de pared del lote, incluida la planificación (plan_seconds).
+    - mb_per_second: bytes copiados / tiempo total de la fase copy (rendimiento del storage).
+    - components_per_second: componentes instalados / duration.
+    - slowest: (nombre, segundos) de las instalaciones más lentas.
+    """
+    components: int
+    duration: float
+    plan_seconds: float
+    files: int
+    bytes: int
+    retries: int
+    phase_totals: Dict[str, float]
+    slowest: List[Tuple[str, float]]
+    failed: Optional[str] = None
+
+    @property
+    def mb_per_second(self) -> float:
+        copy_seconds = self.phase_totals.get("copy", 0.0)
+        return self.bytes / 1_000_000 / copy_seconds if copy_seconds else 0.0
+
+    @property
+    def components_per_second(self) -> float:
+        return self.components / self.duration if self.duration else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "components": self.components,
+            "duration": self.duration,
+            "plan_seconds": self.plan_seconds,
+            "files": self.files,
+            "bytes": self.bytes,
+            "retries": self.retries,
+            "phase_totals": dict(self.phase_totals),
+            "mb_per_second": self.mb_per_second,
+            "components_per_second": self.components_per_second,
+            "slowest": [list(item) for item in self.slowest],
+            "failed": self.failed,
+        }
+
+
+class InstallBatch(List[InstallResult]):
+    """Resultados de install_many (una lista, como antes) con su resumen agregado."""
+
+    def __init__(self, results: List[InstallResult], summary: InstallBatchSummary):
+        super().__init__(results)
+        self.summary = summary
+
+
+def _summarize(
+    results: List[InstallResult],
+    started: float,
+    plan_seconds: float,
+    failed: Optional[str] = None,
+    slowest: int = 5,
+) -> InstallBatchSummary:
+    phase_totals = {phase: 0.0 for phase in INSTALL_PHASES}
+    for result in results:
+        for phase, seconds in result.metrics.timings.items():
+            phase_totals[phase] += seconds
+    ranked = sorted(results, key=lambda r: r.metrics.total, reverse=True)[:slowest]
+    return InstallBatchSummary(
+        components=len(results),
+        duration=time.perf_counter() - started,
+        plan_seconds=plan_seconds,
+        files=sum(r.metrics.files for r in results),
+        bytes=sum(r.metrics.bytes for r in results),
+        retries=sum(r.metrics.attempts - 1 for r in results),
+        phase_totals=phase_totals,
+        slowest=[(r.name, r.metrics.total) for r in ranked],
+        failed=failed,
+    )
+
+
+@contextmanager
+def _phase(timings: Dict[str, float], phase: str, span_name: str, **attributes: Any) -> Iterator[Any]:
+    started = time.perf_counter()
+    try:
+        with span(span_name, **attributes) as phase_span:
+            yield phase_span
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - started
 
 
 class TransactionalInstaller:
@@ -31,81 +152,201 @@ class TransactionalInstaller:
     - Rollback automático ante fallos.
     """
 
-    def __init__(self, storage: StorageBackend, hook_runner: Optional[HookRunner] = None):
+    def __init__(
+        self,
+        storage: StorageBackend,
+        hook_runner: Optional[HookRunner] = None,
+        copy_retries: int = 0,
+        syntax_cache_path: Optional[Path] = None,
+    ):
         self.storage = storage
         self.hook_runner = hook_runner
-        self.validator = ComponentValidator()
+        # Reintentos de copy_files ante errores de E/S (OSError) transitorios
+        self.copy_retries = copy_retries
+        # syntax_cache_path: caché persistente de sintaxis de las fuentes instaladas
+        self.validator = ComponentValidator(syntax_cache_path=syntax_cache_path)
 
     def install(self, source_path: Path, target_path: Optional[Path] = None) -> InstallResult:
         source_path = source_path.resolve()
+        with span("installer.install", component=source_path.name) as install_span:
+            return self._install(source_path, target_path, install_span)
+
+    def _install(self, source_path: Path, target_path: Optional[Path], install_span: Any) -> InstallResult:
         if not source_path.exists():
             raise InstallationError(f"Fuente no encontrada: {source_path}")
 
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+
         # Validación de manifest y estructura
-        meta = self.validator.validate_component(source_path)
-        manifest = parse_meta_file(source_path / "__meta__.py")
+        with _phase(timings, "validate", "installer.validate"):
+            meta = self.validator.validate_component(source_path)
+            manifest = parse_meta_file(source_path / "__meta__.py")
+        install_span.set_attributes(component=meta.technical_name, version=meta.version)
 
         install_path = target_path or self.storage.get_default_install_path(meta.technical_name)
         install_path = install_path.resolve()
 
+        stats = SourceStats(files=0, bytes=0)
+        attempts = 0
+        phase = "pre_hook"
         registered = False
         try:
             # Hook pre_install (opcional)
             if self.hook_runner and meta.lifecycle.pre_install:
-                self.hook_runner(meta.lifecycle.pre_install, source_path, meta)
+                with _phase(timings, "pre_hook", "installer.hook", hook="pre_install"):
+                    self.hook_runner(meta.lifecycle.pre_install, source_path, meta)
 
             # Copiar archivos
-            self.storage.copy_files(source_path, install_path)
+            phase = "copy"
+            stats = scan_source(source_path)
+            with _phase(
+                timings, "copy", "installer.copy_files", files=stats.files, bytes=stats.bytes
+            ) as copy_span:
+                while True:
+                    attempts += 1
+                    try:
+                        self.storage.copy_files(source_path, install_path)
+                        break
+                    except OSError:
+                        if attempts > self.copy_retries:
+                            raise
+                        # Copia parcial: se limpia el destino antes de reintentar
+                        self.storage.remove_files(install_path)
+                copy_span.set_attribute("attempts", attempts)
 
             # Registrar componente
-            self.storage.register_component(install_path, manifest)
+            phase = "register"
+            with _phase(timings, "register", "installer.register"):
+                self.storage.register_component(install_path, manifest)
             registered = True
 
             # Hook post_install (opcional)
+            phase = "post_hook"
             if self.hook_runner and meta.lifecycle.post_install:
-                self.hook_runner(meta.lifecycle.post_install, install_path, meta)
+                with _phase(timings, "post_hook", "installer.hook", hook="post_install"):
+                    self.hook_runner(meta.lifecycle.post_install, install_path, meta)
 
             return InstallResult(
                 name=meta.technical_name,
                 version=meta.version,
                 installed_path=install_path,
+                metrics=InstallMetrics(
+                    timings=timings,
+                    total=time.perf_counter() - started,
+                    files=stats.files,
+                    bytes=stats.bytes,
+                    attempts=attempts,
+                ),
             )
         except Exception as e:
             # Rollback defensivo
             try:
-                if registered:
-                    self.storage.unregister_component(meta.technical_name)
-                self.storage.remove_files(install_path)
+                with span("installer.rollback", registered=registered):
+                    if registered:
+                        self.storage.unregister_component(meta.technical_name)
+                    self.storage.remove_files(install_path)
             except Exception as rollback_error:
                 raise InstallationError(
                     f"Error al instalar '{meta.technical_name}': {e}. "
                     f"Además falló el rollback: {rollback_error}"
                 ) from rollback_error
 
-            raise InstallationError(f"Error al instalar '{meta.technical_name}': {e}") from e
+            metrics = InstallMetrics(
+                timings=timings,
+                total=time.perf_counter() - started,
+                attempts=max(attempts, 1),
+                rolled_back=True,
+                failed_phase=phase,
+            )
+            raise InstallationError(
+                f"Error al instalar '{meta.technical_name}': {e}", metrics=metrics
+            ) from e
 
-    def install_plan(self, component_paths: list[Path]) -> InstallPlan:
+    def install_plan(
+        self,
+        component_paths: list[Path],
+        lean: bool = False,
+        country: Optional[str] = None,
+        runtime: Optional[RuntimeProfile] = None,
+        on_incompatible: Literal["reject", "prune"] = "reject",
+    ) -> InstallPlan:
         """
         Construye y devuelve un plan de instalación con orden de dependencias.
         """
-        return build_install_plan(component_paths)
+        return build_install_plan(
+            component_paths,
+            lean=lean,
+            country=country,
+            runtime=runtime,
+            on_incompatible=on_incompatible,
+        )
 
-    def install_many(self, component_paths: list[Path]) -> list[InstallResult]:
+    def dry_run(
+        self,
+        component_paths: list[Path],
+        model: Optional[ThroughputModel] = None,
+    ) -> PlanEstimate:
         """
-        Instala múltiples componentes respetando el orden de dependencias.
+        Estima archivos, bytes, hooks y duración de un install_many sin instalar nada.
         """
-        plan = build_install_plan(component_paths)
-        results: list[InstallResult] = []
+        return estimate_install_plan(build_install_plan(component_paths, lean=True), model)
 
-        for name in plan.install_order:
-            source_path = plan.paths_by_name.get(name)
-            if source_path is None:
-                raise InstallationError(
-                    f"Plan inválido: no se encontró ruta para '{name}'"
+    def install_many(
+        self,
+        component_paths: list[Path],
+        country: Optional[str] = None,
+        runtime: Optional[RuntimeProfile] = None,
+    ) -> InstallBatch:
+        """
+        Instala múltiples componentes respetando el orden de dependencias.
+        Con country, no instala nada si algún componente no está disponible allí;
+        con runtime, tampoco si alguno es incompatible con ese perfil.
+        Devuelve la lista de resultados con un resumen agregado en `.summary`;
+        ante un fallo, el resumen de lo instalado viaja en InstallationError.summary.
+        """
+        started = time.perf_counter()
+        with span("installer.install_many", components=len(component_paths)) as many_span:
+            with span("installer.plan"):
+                # Solo se usan orden y rutas: install() vuelve a validar cada componente
+                plan = build_install_plan(
+                    component_paths, lean=True, country=country, runtime=runtime
                 )
-            results.append(self.install(source_path))
+            plan_seconds = time.perf_counter() - started
+            results: list[InstallResult] = []
+            failure: Optional[Exception] = None
+            failed: Optional[str] = None
+
+            # Un solo guardado del registry para todo el lote. El error se relanza
+            # fuera del batch para conservar los componentes ya instalados.
+            with self._storage_batch():
+                for name in plan.install_order:
+                    source_path = plan.paths_by_name.get(name)
+                    if source_path is None:
+                        failure = InstallationError(
+                            f"Plan inválido: no se encontró ruta para '{name}'"
+                        )
+                        failed = name
+                        break
+                    try:
+                        results.append(self.install(source_path))
+                    except Exception as e:
+                        failure = e
+                        failed = name
+                        break
+
+            many_span.set_attribute("installed", len(results))
+            summary = _summarize(results, started, plan_seconds, failed)
+            if failure is not None:
+                if isinstance(failure, InstallationError):
+                    failure.summary = summary
+                raise failure
+
+        return InstallBatch(results, summary)
 
-        return results
+    def _storage_batch(self) -> ContextManager[Any]:
+        batch = getattr(self.storage, "batch", None)
+        return batch() if batch is not None else nullcontext()
 
     def uninstall(self, component_name: str, installed_path: Optional[Path] = None) -> None:
         """
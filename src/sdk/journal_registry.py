@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+from .exceptions import ValidationError
+from .registry import ComponentRegistry, FsyncPolicy, RegistrySnapshot
+from .tracing import span
+
+
+def _well_formed(record: Any) -> bool:
+    """Registro del journal con la forma {"seq": int, "ops": [[acción, nombre, payload], ...]}."""
+    if not isinstance(record, dict):
+        return False
+    seq, ops = record.get("seq"), record.get("ops")
+    if not isinstance(seq, int) or isinstance(seq, bool) or not isinstance(ops, list):
+        return False
+    return all(
+        isinstance(op, list) and len(op) == 3
+        and op[0] in ("register", "unregister") and isinstance(op[1], str)
+        for op in ops
+    )
+
+
+class JournaledComponentRegistry(ComponentRegistry):
+    """
+    Registry con snapshot JSON + journal append-only (JSONL).
+
+    - Cada mutación (o cada batch) añade un único registro al journal: O(1).
+    - Al cargar se reproduce el journal sobre el último snapshot.
+    - Un registro final incompleto (escritura cortada por un crash) se ignora y se
+      trunca; cualquier otro registro ilegible se considera corrupción.
+    - Cuando el journal supera compact_threshold bytes se pliega en un nuevo
+      snapshot, por defecto en un hilo en segundo plano.
+
+    Pensado para un único proceso escritor por journal.
+    """
+
+    def __init__(
+        self,
+        registry_path: Path,
+        fsync: FsyncPolicy = "never",
+        compact_threshold: int = 1024 * 1024,
+        background_compaction: bool = True,
+    ):
+        self.journal_path = registry_path.with_name(registry_path.name + ".log")
+        self.compact_threshold = compact_threshold
+        self.background_compaction = background_compaction
+        self._seq = 0
+        self._journal_size = 0
+        self._journal: Optional[BinaryIO] = None
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        super().__init__(registry_path, fsync=fsync)
+
+    # ------------------------------------------------------------------
+    # IO
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        self._data = {"components": {}}
+        self._seq = 0
+
+        if self.registry_path.exists():
+            raw = self.registry_path.read_text(encoding="utf-8")
+            if raw.strip():
+                try:
+                    self._data = json.loads(raw)
+                except json.JSONDecodeError as e:
+                    # El snapshot se escribe siempre de forma atómica: si no se
+                    # puede leer es corrupción real, no un crash a medio escribir.
+                    raise ValidationError(
+                        f"Snapshot del registry corrupto en {self.registry_path} "
+                        f"línea {e.lineno}: {e.msg}"
+                    ) from e
+            self._seq = self._data.pop("journal_seq", 0)
+        else:
+            self._save()
+
+        if "components" not in self._data:
+            self._data["components"] = {}
+
+        self._replay_journal()
+        self._index = None
+        self._snapshot = None
+
+    def _replay_journal(self) -> None:
+        self._journal_size = 0
+        if not self.journal_path.exists():
+            return
+
+        raw = self.journal_path.read_bytes()
+        lines = raw.split(b"\n")
+        # lines[-1] es lo que sigue al último salto de línea: vacío si el
+        # journal termina limpio, un registro cortado en caso contrario.
+        complete, tail = lines[:-1], lines[-1]
+        valid_size = 0
+
+        for index, line in enumerate(complete):
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                if index == len(complete) - 1 and not tail:
+                    break
+                raise ValidationError(
+                    f"Journal del registry corrupto en {self.journal_path} "
+                    f"registro {index + 1}"
+                ) from e
+
+            if not _well_formed(record):
+                raise ValidationError(
+                    f"Journal del registry corrupto en {self.journal_path} "
+                    f"registro {index + 1}: se esperaba {{'seq': int, 'ops': [...]}}"
+                )
+
+            if record["seq"] > self._seq:
+                for op in record["ops"]:
+                    self._apply_op(self._data, tuple(op))
+                self._seq = record["seq"]
+            valid_size += len(line) + 1
+
+        if valid_size != len(raw):
+            # Descartar la cola cortada para que los próximos appends queden limpios
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(valid_size)
+        self._journal_size = valid_size
+
+    # El archivo de snapshot no incluye el journal: no se comparte su parseo
+    _SHARE_SNAPSHOTS = False
+
+    def _refresh_if_stale(self) -> bool:
+        # El snapshot solo lo reescribe la compactación de esta misma instancia
+        return False
+
+    def _save(self) -> None:
+        with self._lock:
+            data = dict(self._data)
+            data["journal_seq"] = self._seq
+            self._write_atomic(data)
+
+    def _flush(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            with span("registry.flush", ops=len(self._pending), journal=True) as flush_span:
+                self._seq += 1
+                record = {"seq": self._seq, "ops": [list(op) for op in self._pending]}
+                line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+                journal = self._open_journal()
+                journal.write(line)
+                journal.flush()
+                if self.fsync != "never":
+                    os.fsync(journal.fileno())
+                flush_span.set_attributes(seq=self._seq, bytes=len(line))
+
+            self._journal_size += len(line)
+            self._pending.clear()
+            needs_compaction = self._journal_size >= self.compact_threshold
+
+        if needs_compaction:
+            self._schedule_compaction()
+
+    def _open_journal(self) -> BinaryIO:
+        if self._journal is None:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_path, "ab")
+        return self._journal
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _apply(self, op: Any) -> None:
+        with self._lock:
+            super()._apply(op)
+
+    @contextmanager
+    def batch(self) -> Iterator["JournaledComponentRegistry"]:
+        # El lock cubre todo el bloque: la compactación nunca ve cambios sin confirmar
+        with self._lock:
+            with super().batch():
+                yield self
+
+    # ------------------------------------------------------------------
+    # COMPACTACIÓN
+    # ------------------------------------------------------------------
+
+    def _schedule_compaction(self) -> None:
+        if not self.background_compaction:
+            self.compact()
+            return
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(
+            target=self.compact, name="registry-compaction", daemon=True
+        )
+        self._compactor.start()
+
+    def compact(self) -> None:
+        """
+        Pliega el journal en un nuevo snapshot.
+        El snapshot se escribe sin bloquear las mutaciones; solo el recorte final
+        del journal (registros añadidos durante la compactación) toma el lock.
+        """
+        with self._compaction_lock:
+            with self._lock:
+                data = dict(self._data)
+                data["components"] = dict(self._data["components"])
+                data["journal_seq"] = self._seq
+                folded_size = self._journal_size
+
+            # Si hay un crash aquí, el journal aún contiene registros con
+            # seq <= journal_seq y se ignoran al reproducirlo.
+            self._write_atomic(data)
+
+            with self._lock:
+                self._close_journal()
+                tail = b""
+                if self.journal_path.exists():
+                    with open(self.journal_path, "rb") as f:
+                        f.seek(folded_size)
+                        tail = f.read()
+                tmp_path = self.journal_path.with_suffix(".tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(tail)
+                    if self.fsync != "never":
+                        f.flush()
+                        os.fsync(f.fileno())
+                tmp_path.replace(self.journal_path)
+                self._journal_size = len(tail)
+
+    def wait_for_compaction(self) -> None:
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def close(self) -> None:
+        self.wait_for_compaction()
+        with self._lock:
+            self._close_journal()
+
+    def __enter__(self) -> "JournaledComponentRegistry":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return super().get(name)
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return super().list()
+
+    def query(self, **criteria: Any) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return super().query(**criteria)
+
+    def snapshot(self) -> RegistrySnapshot:
+        with self._lock:
+            return super().snapshot()
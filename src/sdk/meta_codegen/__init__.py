@@ -1,9 +1,35 @@
-from .meta_generator import MetaGenerator
-from .meta_writer import MetaWriter
-from .template_engine import TemplateEngine
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    "MetaGenerator": ".meta_generator",
+    "BulkGenerationReport": ".meta_generator",
+    "MetaWriter": ".meta_writer",
+    "WriteStats": ".meta_writer",
+    "MetaEditor": ".meta_editor",
+    "BulkEditReport": ".meta_editor",
+    "edit_meta_source": ".meta_editor",
+    "TemplateEngine": ".template_engine",
+    "CompiledTemplate": ".template_engine",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+if TYPE_CHECKING:
+    from .meta_generator import MetaGenerator, BulkGenerationReport
+    from .meta_writer import MetaWriter, WriteStats
+    from .meta_editor import MetaEditor, BulkEditReport, edit_meta_source
+    from .template_engine import TemplateEngine, CompiledTemplate
 
 __all__ = [
     "MetaGenerator",
+    "BulkGenerationReport",
     "MetaWriter",
+    "WriteStats",
+    "MetaEditor",
+    "BulkEditReport",
+    "edit_meta_source",
     "TemplateEngine",
+    "CompiledTemplate",
 ]
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from ..exceptions import ValidationError
+from ..utils.meta_parser import MetaField, parse_meta_fields
+from ..validation.bulk_validator import BulkValidationReport, BulkValidator
+from .meta_writer import MetaWriter
+
+# Valor nuevo de un campo, o función que lo calcula a partir del valor actual
+# (None si el campo no existe en el archivo)
+FieldChange = Union[Any, Callable[[Any], Any]]
+ChangeSet = Mapping[str, FieldChange]
+
+
+def format_meta_value(value: Any) -> str:
+    """Representa un literal con el estilo de los __meta__.py generados (comillas dobles)."""
+    if value is None or isinstance(value, bool):
+        return repr(value)
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(format_meta_value(v) for v in value) + "]"
+    if isinstance(value, dict):
+        return "{" + ", ".join(
+            f"{format_meta_value(k)}: {format_meta_value(v)}" for k, v in value.items()
+        ) + "}"
+    raise ValidationError(
+        f"Tipo no soportado en __meta__.py: {type(value).__name__} "
+        f"(solo literales permitidos: str, int, float, bool, None, list, dict)"
+    )
+
+
+def _line_offsets(data: bytes) -> List[int]:
+    # Offset en bytes del inicio de cada línea; bytes.splitlines usa los mismos
+    # saltos de línea que el tokenizer (\n, \r\n, \r)
+    offsets = [0]
+    for line in data.splitlines(keepends=True):
+        offsets.append(offsets[-1] + len(line))
+    return offsets
+
+
+def edit_meta_source(source: str, changes: ChangeSet, meta_path: Path = Path("__meta__.py")) -> str:
+    """
+    Aplica un conjunto de cambios a un __meta__.py reescribiendo solo el valor de
+    las asignaciones afectadas: comentarios, orden, formato y campos propios se
+    conservan byte a byte. Los campos inexistentes se añaden al final del archivo.
+    """
+    fields: Dict[str, MetaField] = parse_meta_fields(source, meta_path)
+    data = source.encode("utf-8")
+    offsets = _line_offsets(data)
+
+    replacements: List[Tuple[int, int, bytes]] = []
+    appended: List[str] = []
+    for name, change in changes.items():
+        if name.startswith("_") or not name.isidentifier():
+            raise ValidationError(f"Campo no editable en __meta__.py: '{name}'")
+        current = fields.get(name)
+        value = change(current.value if current else None) if callable(change) else change
+        if current is not None and value == current.value and type(value) is type(current.value):
+            continue
+        literal = format_meta_value(value)
+        if current is None:
+            appended.append(f"{name} = {literal}\n")
+            continue
+        start = offsets[current.lineno - 1] + current.col_offset
+        end = offsets[current.end_lineno - 1] + current.end_col_offset
+        replacements.append((start, end, literal.encode("utf-8")))
+
+    for start, end, literal in sorted(replacements, reverse=True):
+        data = data[:start] + literal + data[end:]
+
+    if appended:
+        if data and not data.endswith((b"\n", b"\r")):
+            data += b"\n"
+        data += "".join(appended).encode("utf-8")
+
+    return data.decode("utf-8")
+
+
+@dataclass(frozen=True)
+class EditResult:
+    path: Path
+    status: str  # "written" | "unchanged" | "error"
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BulkEditReport:
+    results: List[EditResult] = field(default_factory=list)
+    validation: Optional[BulkValidationReport] = None
+    duration: float = 0.0
+
+    def _count(self, status: str) -> int:
+        return sum(1 for r in self.results if r.status == status)
+
+    @property
+    def written(self) -> int:
+        return self._count("written")
+
+    @property
+    def unchanged(self) -> int:
+        return self._count("unchanged")
+
+    @property
+    def failed(self) -> int:
+        return self._count("error")
+
+    @property
+    def ok(self) -> bool:
+        return self.failed == 0 and (self.validation is None or self.validation.ok)
+
+    def touched(self) -> List[Path]:
+        return [r.path for r in self.results if r.status == "written"]
+
+    def errors(self) -> List[EditResult]:
+        return [r for r in self.results if r.status == "error"]
+
+
+class MetaEditor:
+    """
+    Edición in situ de __meta__.py que preserva el formato.
+    En modo batch aplica el mismo conjunto de cambios a muchos componentes en
+    una pasada y revalida después solo los que realmente se modificaron.
+    """
+
+    def __init__(self, validator: Optional[BulkValidator] = None):
+        self.validator = validator or BulkValidator()
+
+    @staticmethod
+    def edit_file(meta_path: Path, changes: ChangeSet) -> bool:
+        """Edita un __meta__.py; devuelve False si el contenido no cambió."""
+        if not meta_path.exists():
+            raise FileNotFoundError(f"Archivo no encontrado: {meta_path}")
+        source = meta_path.read_bytes().decode("utf-8")
+        edited = edit_meta_source(source, changes, meta_path)
+        if edited == source:
+            return False
+        return MetaWriter.write_meta_file(meta_path, edited)
+
+    def edit_many(
+        self,
+        component_paths: Iterable[Path],
+        changes: ChangeSet,
+        revalidate: bool = True,
+    ) -> BulkEditReport:
+        started = time.perf_counter()
+        results: List[EditResult] = []
+
+        for component_path in component_paths:
+            component_path = Path(component_path)
+            try:
+                written = self.edit_file(component_path / "__meta__.py", changes)
+            except (ValidationError, OSError, UnicodeDecodeError) as e:
+                results.append(EditResult(component_path, "error", str(e)))
+                continue
+            results.append(EditResult(component_path, "written" if written else "unchanged"))
+
+        validation = None
+        touched = [r.path for r in results if r.status == "written"]
+        if revalidate and touched:
+            validation = self.validator.validate_many(touched)
+
+        return BulkEditReport(
+            results=results,
+            validation=validation,
+            duration=time.perf_counter() - started,
+        )
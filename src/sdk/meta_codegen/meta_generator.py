@@ -1,5 +1,12 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from .template_engine import TemplateEngine
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from pydantic import ValidationError as PydanticValidationError
+
+from .template_engine import CompiledTemplate, TemplateEngine
 from .meta_writer import MetaWriter
 from ..constants import (
     DEFAULT_PYTHON,
@@ -9,6 +16,63 @@ from ..constants import (
 )
 from ..schemas.meta_schema import BaseMetaSchema
 
+META_TEMPLATE = "meta_v2.py.tpl"
+
+# Ruta de salida: directorio base (<base>/<technical_name>/__meta__.py) o función
+OutputTarget = Union[Path, Callable[[BaseMetaSchema], Path]]
+
+
+@dataclass(frozen=True)
+class GenerationResult:
+    index: int
+    technical_name: Optional[str]
+    path: Optional[Path]
+    status: str  # "written" | "unchanged" | "error"
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BulkGenerationReport:
+    results: List[GenerationResult] = field(default_factory=list)
+    duration: float = 0.0
+
+    def _count(self, status: str) -> int:
+        return sum(1 for r in self.results if r.status == status)
+
+    @property
+    def written(self) -> int:
+        return self._count("written")
+
+    @property
+    def unchanged(self) -> int:
+        return self._count("unchanged")
+
+    @property
+    def failed(self) -> int:
+        return self._count("error")
+
+    def errors(self) -> List[GenerationResult]:
+        return [r for r in self.results if r.status == "error"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": len(self.results),
+            "written": self.written,
+            "unchanged": self.unchanged,
+            "failed": self.failed,
+            "duration": self.duration,
+            "results": [
+                {
+                    "index": r.index,
+                    "technical_name": r.technical_name,
+                    "path": str(r.path) if r.path else None,
+                    "status": r.status,
+                    "error": r.error,
+                }
+                for r in self.results
+            ],
+        }
+
 
 class MetaGenerator:
 
@@ -17,7 +81,10 @@ class MetaGenerator:
 
     def build_context(self, data: dict) -> dict:
 
-        validated = BaseMetaSchema(**data)
+        return self._context(BaseMetaSchema(**data))
+
+    def _context(self, validated: BaseMetaSchema) -> dict:
+
         data = validated.model_dump()
 
         context = {
@@ -44,7 +111,7 @@ class MetaGenerator:
         context = self.build_context(data)
 
         return self.engine.render(
-            "meta_v2.py.tpl",
+            META_TEMPLATE,
             context
         )
 
@@ -52,11 +119,110 @@ class MetaGenerator:
         self,
         output_path: Path,
         data: dict
-    ):
+    ) -> bool:
 
         content = self.generate(data)
 
-        MetaWriter.write_meta_file(
+        return MetaWriter.write_meta_file(
             output_path,
             content
         )
+
+    # ------------------------------------------------------------------
+    # BULK
+    # ------------------------------------------------------------------
+
+    def generate_many(
+        self,
+        items: Iterable[dict],
+        output: OutputTarget,
+        max_workers: int = 8,
+        batch_size: int = 256,
+    ) -> BulkGenerationReport:
+        """
+        Genera y escribe muchos __meta__.py desde un iterable (o stream) de dicts.
+        - Valida por lotes de batch_size a medida que consume el iterable.
+        - Renderiza todo desde un único template compilado.
+        - Renderiza y escribe en un pool de hilos con a lo sumo 2 * max_workers
+          tareas en vuelo, de modo que nunca se retienen todos los archivos en memoria.
+        - Un error en un elemento no detiene el resto: queda en el reporte.
+        """
+        started = time.perf_counter()
+        template = self.engine.compile(META_TEMPLATE)
+        resolve_path = self._output_resolver(output)
+        results: List[GenerationResult] = []
+        seen: Set[str] = set()
+        in_flight: Set[Future] = set()
+        max_in_flight = max(1, max_workers) * 2
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+
+            def dispatch(jobs: List[tuple]) -> None:
+                nonlocal in_flight
+                for job in jobs:
+                    while len(in_flight) >= max_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        results.extend(f.result() for f in done)
+                    in_flight.add(pool.submit(self._write_one, template, *job))
+
+            batch: List[tuple] = []
+            for index, data in enumerate(items):
+                batch.append((index, data))
+                if len(batch) >= batch_size:
+                    dispatch(self._validate_batch(batch, resolve_path, seen, results))
+                    batch = []
+            dispatch(self._validate_batch(batch, resolve_path, seen, results))
+
+            results.extend(f.result() for f in wait(in_flight).done)
+
+        results.sort(key=lambda r: r.index)
+        return BulkGenerationReport(results=results, duration=time.perf_counter() - started)
+
+    @staticmethod
+    def _output_resolver(output: OutputTarget) -> Callable[[BaseMetaSchema], Path]:
+        if callable(output):
+            return output
+        base = Path(output)
+        return lambda meta: base / meta.technical_name / "__meta__.py"
+
+    def _validate_batch(
+        self,
+        batch: List[tuple],
+        resolve_path: Callable[[BaseMetaSchema], Path],
+        seen: Set[str],
+        results: List[GenerationResult],
+    ) -> List[tuple]:
+        """
+        Valida un lote; los errores se añaden a results y se devuelven los
+        trabajos (index, nombre, ruta, contexto) listos para escribir.
+        """
+        jobs: List[tuple] = []
+        for index, data in batch:
+            name = data.get("technical_name") if isinstance(data, dict) else None
+            try:
+                validated = BaseMetaSchema(**data)
+                name = validated.technical_name
+                if name in seen:
+                    raise ValueError(f"technical_name duplicado: '{name}'")
+                path = resolve_path(validated)
+                context = self._context(validated)
+            except (PydanticValidationError, ValueError, TypeError) as e:
+                results.append(GenerationResult(index, name, None, "error", str(e)))
+                continue
+            seen.add(name)
+            jobs.append((index, name, path, context))
+        return jobs
+
+    @staticmethod
+    def _write_one(
+        template: CompiledTemplate,
+        index: int,
+        name: str,
+        path: Path,
+        context: dict,
+    ) -> GenerationResult:
+        try:
+            changed = MetaWriter.write_meta_file(path, template.render(context))
+        except Exception as e:
+            return GenerationResult(index, name, path, "error", str(e))
+        return GenerationResult(index, name, path, "written" if changed else "unchanged")
@@ -1,15 +1,90 @@
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, Tuple
+
+
+@dataclass(frozen=True)
+class WriteStats:
+    written: int = 0
+    unchanged: int = 0
+
+
+def _read_umask() -> int:
+    """
+    Umask del proceso. En Linux se lee de /proc sin modificarla; si no, se
+    consulta con os.umask, que solo es seguro aquí, al importar el módulo y
+    antes de que existan los hilos de generate_many.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+# Modo que tendría un archivo nuevo creado con open(): 0o666 sin la umask.
+# Se calcula una sola vez: la umask es global al proceso y no se toca después.
+DEFAULT_FILE_MODE = 0o666 & ~_read_umask()
 
 
 class MetaWriter:
 
     @staticmethod
-    def write_meta_file(path: Path, content: str):
+    def write_meta_file(path: Path, content: str) -> bool:
+        """
+        Escribe el archivo de forma atómica (temporal + replace) solo si su
+        contenido cambia. Devuelve False si ya era idéntico: en ese caso no se
+        toca el archivo y su mtime se conserva.
+        """
+        data = content.encode("utf-8")
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            stat = None
+
+        # Con distinto tamaño no hace falta leer ni hashear el archivo existente
+        if stat is not None and stat.st_size == len(data):
+            current = hashlib.sha256(path.read_bytes()).digest()
+            if current == hashlib.sha256(data).digest():
+                return False
 
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        path.write_text(
-            content,
-            encoding="utf-8",
-            newline="\n"
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
         )
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            # mkstemp crea el temporal con 0600: se conserva el modo del archivo
+            # existente o, si es nuevo, el que le daría la umask
+            os.chmod(tmp_name, stat.st_mode & 0o7777 if stat is not None else DEFAULT_FILE_MODE)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
+
+        return True
+
+    @staticmethod
+    def write_many(files: Iterable[Tuple[Path, str]]) -> WriteStats:
+        """Escribe varios archivos con write_meta_file y cuenta escritos / sin cambios."""
+        written = unchanged = 0
+        for path, content in files:
+            if MetaWriter.write_meta_file(path, content):
+                written += 1
+            else:
+                unchanged += 1
+        return WriteStats(written=written, unchanged=unchanged)
@@ -1,26 +1,99 @@
+import os
+import re
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, FrozenSet, Mapping, Tuple
+
+from ..exceptions import TemplateError
+
+_PLACEHOLDER_RE = re.compile(r"\{\{ ([A-Za-z_][A-Za-z0-9_]*) \}\}")
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """
+    Template precompilado: literales intercalados con placeholders.
+    literals siempre tiene un elemento más que placeholders.
+    """
+    name: str
+    literals: Tuple[str, ...]
+    placeholders: Tuple[str, ...]
+    signature: Tuple[int, int]
+
+    @property
+    def fields(self) -> FrozenSet[str]:
+        return frozenset(self.placeholders)
+
+    @classmethod
+    def compile(cls, name: str, source: str, signature: Tuple[int, int] = (0, 0)) -> "CompiledTemplate":
+        parts = _PLACEHOLDER_RE.split(source)
+        return cls(
+            name=name,
+            literals=tuple(parts[0::2]),
+            placeholders=tuple(parts[1::2]),
+            signature=signature,
+        )
+
+    def render(self, context: Mapping[str, object], strict: bool = False) -> str:
+        """
+        Renderiza en una sola pasada. Los valores sustituidos nunca se vuelven
+        a examinar, aunque contengan texto con forma de placeholder.
+        - Falta algún placeholder en el contexto: TemplateError.
+        - strict=True: también es error pasar claves que el template no usa.
+        """
+        missing = self.fields.difference(context)
+        if missing:
+            raise TemplateError(
+                f"Faltan valores para placeholders en {self.name}: {', '.join(sorted(missing))}"
+            )
+        if strict:
+            unknown = set(context).difference(self.fields)
+            if unknown:
+                raise TemplateError(
+                    f"Claves desconocidas para {self.name}: {', '.join(sorted(unknown))}"
+                )
+
+        values = {key: str(context[key]) for key in self.fields}
+        literals = self.literals
+        parts = [literals[0]]
+        for index, key in enumerate(self.placeholders, start=1):
+            parts.append(values[key])
+            parts.append(literals[index])
+        return "".join(parts)
 
 
 class TemplateEngine:
 
     def __init__(self, templates_dir: Path):
         self.templates_dir = templates_dir
+        self._compiled: Dict[str, CompiledTemplate] = {}
 
-    def render(self, template_name: str, context: dict) -> str:
-
+    def compile(self, template_name: str) -> CompiledTemplate:
+        """
+        Devuelve el template compilado, recompilándolo solo si el archivo
+        cambió (mtime o tamaño) desde la última vez.
+        """
         template_path = self.templates_dir / template_name
 
-        if not template_path.exists():
+        try:
+            st = os.stat(template_path)
+        except FileNotFoundError:
+            self._compiled.pop(template_name, None)
             raise FileNotFoundError(
                 f"Template no encontrado: {template_path}"
             )
 
-        content = template_path.read_text(encoding="utf-8")
-
-        for key, value in context.items():
-            content = content.replace(
-                "{{ " + key + " }}",
-                str(value)
+        signature = (st.st_mtime_ns, st.st_size)
+        compiled = self._compiled.get(template_name)
+        if compiled is None or compiled.signature != signature:
+            compiled = CompiledTemplate.compile(
+                template_name,
+                template_path.read_text(encoding="utf-8"),
+                signature,
             )
+            self._compiled[template_name] = compiled
+        return compiled
+
+    def render(self, template_name: str, context: dict, strict: bool = False) -> str:
 
-        return content
+        return self.compile(template_name).render(context, strict=strict)
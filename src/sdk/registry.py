@@ -1,18 +1,198 @@
 from __future__ import annotations
 
 import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Mapping, Optional, Tuple
+
+from .registry_index import RegistryIndex
+from .tracing import span
+from .utils.file_lock import FileLock, lock_path_for
+
+FsyncPolicy = Literal["never", "commit", "full"]
+
+# (operación, nombre, payload) pendiente de persistir
+RegistryOp = Tuple[str, str, Optional[Dict[str, Any]]]
+
+# (mtime_ns, size, inode) del archivo del registry
+FileSignature = Tuple[int, int, int]
+
+# "generation" se escribe siempre como primera clave para poder leerla sin parsear todo
+_GENERATION_RE = re.compile(rb'^\{\s*"generation":\s*(\d+)')
+
+
+def _freeze(value: Any) -> Any:
+    """Copia profunda de solo lectura: dicts -> MappingProxyType, listas -> tuplas."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Copia profunda mutable de un valor congelado con _freeze."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class RegistrySnapshot:
+    """
+    Vista inmutable del registry en una generación concreta.
+    Se construye una vez por cambio y se comparte entre hilos sin copiarla.
+    Los payloads se congelan en profundidad al construirla: ni los cambios del
+    registry ni los de quien lea el snapshot pueden alterarlo.
+    """
+
+    __slots__ = ("generation", "signature", "_data")
+
+    def __init__(
+        self,
+        generation: int,
+        signature: Optional[FileSignature],
+        data: Dict[str, Any],
+    ):
+        self.generation = generation
+        self.signature = signature
+        # Nunca se modifica tras la construcción
+        self._data = dict(data)
+        self._data["components"] = {
+            name: _freeze(payload) for name, payload in data["components"].items()
+        }
+
+    @property
+    def components(self) -> Mapping[str, Mapping[str, Any]]:
+        return MappingProxyType(self._data["components"])
+
+    def get(self, name: str) -> Optional[Mapping[str, Any]]:
+        return self._data["components"].get(name)
+
+    def list(self) -> List[Mapping[str, Any]]:
+        return list(self._data["components"].values())
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._data["components"]
+
+    def __len__(self) -> int:
+        return len(self._data["components"])
+
+
+# Caché de parseo compartida por proceso: {ruta: snapshot}. Un registry que se
+# construye muchas veces sobre el mismo archivo sin cambios no vuelve a parsear JSON.
+# LRU acotada: se descartan los registries usados menos recientemente.
+_SHARED_SNAPSHOTS: "OrderedDict[str, RegistrySnapshot]" = OrderedDict()
+_SHARED_LOCK = threading.Lock()
+MAX_SHARED_SNAPSHOTS = 32
+
+
+def _signature_of(path: Path) -> Optional[FileSignature]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _parse_registry(path: Path, signature: Optional[FileSignature]) -> RegistrySnapshot:
+    try:
+        raw = path.read_text(encoding="utf-8")
+        if raw.strip():
+            data = json.loads(raw)
+        else:
+            data = {"components": {}}
+    except FileNotFoundError:
+        data = {"components": {}}
+    except json.JSONDecodeError:
+        # Archivo corrupto: reiniciar estructura básica
+        data = {"components": {}}
+
+    generation = data.pop("generation", 0)
+    if "components" not in data:
+        data["components"] = {}
+    return RegistrySnapshot(generation, signature, data)
+
+
+def _shared_snapshot(path: Path) -> RegistrySnapshot:
+    key = os.path.abspath(path)
+    # stat antes de leer: si el archivo cambia durante la lectura, la firma
+    # quedará desactualizada y la próxima comprobación recargará de nuevo.
+    signature = _signature_of(path)
+    with _SHARED_LOCK:
+        cached = _SHARED_SNAPSHOTS.get(key)
+        if cached is not None:
+            _SHARED_SNAPSHOTS.move_to_end(key)
+    if cached is not None and signature is not None and cached.signature == signature:
+        return cached
+
+    snapshot = _parse_registry(path, signature)
+    _remember_snapshot(key, snapshot)
+    return snapshot
+
+
+def _remember_snapshot(key: str, snapshot: RegistrySnapshot) -> None:
+    with _SHARED_LOCK:
+        _SHARED_SNAPSHOTS[key] = snapshot
+        _SHARED_SNAPSHOTS.move_to_end(key)
+        while len(_SHARED_SNAPSHOTS) > MAX_SHARED_SNAPSHOTS:
+            _SHARED_SNAPSHOTS.popitem(last=False)
+
+
+def _publish_snapshot(path: Path, snapshot: RegistrySnapshot) -> None:
+    _remember_snapshot(os.path.abspath(path), snapshot)
 
 
 class ComponentRegistry:
     """
     Registry minimalista en JSON para componentes instalados.
+
+    Política de fsync (velocidad vs durabilidad):
+    - "never": confía en la caché del sistema operativo (más rápido).
+    - "commit": fsync del archivo antes de reemplazar el registry.
+    - "full": además fsync del directorio para persistir el rename.
+
+    Concurrencia entre procesos:
+    - Las escrituras toman un lock de archivo solo durante la lectura+escritura
+      del registry, nunca durante una instalación completa.
+    - Cada escritura incrementa "generation". Si otro proceso escribió desde nuestra
+      última lectura, se recarga el archivo y se reaplican nuestras operaciones
+      pendientes (merge por componente) antes de guardar.
+    - Las lecturas comparan un stat barato con la última firma conocida y solo
+      recargan cuando el archivo cambió.
+
+    Los índices secundarios (RegistryIndex) se construyen en la primera consulta
+    y después se mantienen en cada escritura, de modo que query() cuesta
+    O(resultado) y no O(registry).
+
+    Lecturas baratas:
+    - reload_if_changed() recarga solo si un stat indica que el archivo cambió.
+    - snapshot() devuelve una vista inmutable compartible entre hilos, que solo
+      se reconstruye cuando cambia la generación.
+    - El parseo del JSON se comparte en el proceso: construir otra instancia
+      sobre un archivo sin cambios no vuelve a parsearlo.
     """
 
-    def __init__(self, registry_path: Path):
+    # Las subclases cuyo archivo no representa el estado completo lo desactivan
+    _SHARE_SNAPSHOTS = True
+
+    def __init__(self, registry_path: Path, fsync: FsyncPolicy = "never"):
         self.registry_path = registry_path
+        self.fsync = fsync
         self._data: Dict[str, Dict[str, Any]] = {"components": {}}
+        self._generation = 0
+        self._signature: Optional[FileSignature] = None
+        self._file_lock = FileLock(lock_path_for(registry_path))
+        self._index: Optional[RegistryIndex] = None
+        self._snapshot: Optional[RegistrySnapshot] = None
+        self._batch_depth = 0
+        self._pending: List[RegistryOp] = []
         self._load()
 
     # ------------------------------------------------------------------
@@ -21,42 +201,251 @@ class ComponentRegistry:
 
     def _load(self) -> None:
         if not self.registry_path.exists():
-            self._save()
-            return
+            with self._file_lock:
+                if not self.registry_path.exists():
+                    self._save()
+                    return
+        self._read()
 
+    def _read(self) -> None:
+        with span("registry.read"):
+            self._read_shared()
+
+    def _read_shared(self) -> None:
+        snapshot = _shared_snapshot(self.registry_path)
+        self._signature = snapshot.signature
+        self._generation = snapshot.generation
+        # Copia propia y mutable en profundidad; el snapshot compartido queda intacto
+        data = dict(snapshot._data)
+        data["components"] = {
+            name: _thaw(payload) for name, payload in snapshot._data["components"].items()
+        }
+        self._data = data
+        self._index = None
+        self._snapshot = snapshot
+
+    def _disk_signature(self) -> Optional[FileSignature]:
+        return _signature_of(self.registry_path)
+
+    def _disk_generation(self) -> Optional[int]:
         try:
-            raw = self.registry_path.read_text(encoding="utf-8")
-            if raw.strip():
-                self._data = json.loads(raw)
-            else:
-                self._data = {"components": {}}
-        except json.JSONDecodeError:
-            # Archivo corrupto: reiniciar estructura básica
-            self._data = {"components": {}}
-
-        if "components" not in self._data:
-            self._data["components"] = {}
+            with open(self.registry_path, "rb") as f:
+                head = f.read(64)
+        except FileNotFoundError:
+            return None
+        match = _GENERATION_RE.match(head)
+        return int(match.group(1)) if match else None
+
+    def _changed_on_disk(self) -> bool:
+        """
+        True si otro proceso escribió el registry desde nuestra última lectura.
+        La generación cubre el caso (raro) de una firma de stat idéntica.
+        """
+        return (
+            self._disk_signature() != self._signature
+            or self._disk_generation() != self._generation
+        )
+
+    def _refresh_if_stale(self) -> bool:
+        if self._batch_depth or self._disk_signature() == self._signature:
+            return False
+        self._read()
+        return True
 
     def _save(self) -> None:
+        data = {"generation": self._generation}
+        data.update(self._data)
+        self._write_atomic(data)
+        self._signature = self._disk_signature()
+
+    def _write_atomic(self, data: Dict[str, Any]) -> None:
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self.registry_path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(data, indent=2))
+            if self.fsync != "never":
+                f.flush()
+                os.fsync(f.fileno())
         tmp_path.replace(self.registry_path)
+        if self.fsync == "full":
+            self._fsync_dir()
+
+    def _fsync_dir(self) -> None:
+        try:
+            fd = os.open(self.registry_path.parent, os.O_RDONLY)
+        except OSError:
+            # Plataformas sin soporte para abrir directorios (Windows)
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _flush(self) -> None:
+        """
+        Persiste las operaciones pendientes bajo el lock de archivo,
+        fusionándolas con lo que otros procesos hayan escrito.
+        """
+        with span("registry.flush", ops=len(self._pending)) as flush_span:
+            with self._file_lock:
+                if self._changed_on_disk():
+                    flush_span.set_attribute("merged", True)
+                    self._read()
+                    for op in self._pending:
+                        self._apply_op(self._data, op)
+                    self._index = None
+                    self._snapshot = None
+                self._generation += 1
+                self._save()
+            flush_span.set_attributes(
+                generation=self._generation, components=len(self._data["components"])
+            )
+        self._pending.clear()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    # ------------------------------------------------------------------
+    # LECTURAS
+    # ------------------------------------------------------------------
+
+    def reload_if_changed(self) -> bool:
+        """
+        Recarga el registry solo si otro proceso lo modificó (comprobación por stat).
+        Devuelve True si hubo recarga.
+        """
+        return self._refresh_if_stale()
+
+    def snapshot(self) -> RegistrySnapshot:
+        """
+        Vista inmutable y actual del registry. Mientras no haya cambios devuelve
+        siempre el mismo objeto, por lo que su coste por petición es un stat.
+        """
+        self._refresh_if_stale()
+        if self._snapshot is None:
+            self._snapshot = RegistrySnapshot(self._generation, self._signature, self._data)
+            if self._SHARE_SNAPSHOTS and not self._pending:
+                _publish_snapshot(self.registry_path, self._snapshot)
+        return self._snapshot
+
+    @classmethod
+    def read_snapshot(cls, registry_path: Path) -> RegistrySnapshot:
+        """
+        Snapshot de solo lectura sin construir un registry.
+        Se comparte en el proceso y solo se vuelve a parsear si el archivo cambió.
+        """
+        return _shared_snapshot(registry_path)
+
+    # ------------------------------------------------------------------
+    # OPERACIONES
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _apply_op(data: Dict[str, Any], op: RegistryOp) -> None:
+        action, name, payload = op
+        if action == "register":
+            data["components"][name] = payload
+        else:
+            data["components"].pop(name, None)
+
+    def _apply(self, op: RegistryOp) -> None:
+        action, name, payload = op
+        if self._index is not None:
+            previous = self._data["components"].get(name)
+            if previous is not None:
+                self._index.remove(name, previous)
+            if action == "register" and payload is not None:
+                self._index.add(name, payload)
+        self._apply_op(self._data, op)
+        self._snapshot = None
+        self._pending.append(op)
+        if not self._batch_depth:
+            self._flush()
+
+    # ------------------------------------------------------------------
+    # TRANSACCIONES
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def batch(self) -> Iterator["ComponentRegistry"]:
+        """
+        Agrupa varias mutaciones en una única escritura atómica al salir del bloque.
+        Ante una excepción se descartan los cambios del bloque y no se escribe nada.
+        Los bloques anidados se integran en el exterior.
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            return
+
+        backup = dict(self._data)
+        backup["components"] = dict(self._data["components"])
+        self._batch_depth = 1
+        try:
+            yield self
+        except BaseException:
+            self._data = backup
+            self._pending.clear()
+            self._index = None
+            self._snapshot = None
+            raise
+        else:
+            if self._pending:
+                self._flush()
+        finally:
+            self._batch_depth = 0
 
     # ------------------------------------------------------------------
     # API
     # ------------------------------------------------------------------
 
     def register(self, name: str, payload: Dict[str, Any]) -> None:
-        self._data["components"][name] = payload
-        self._save()
+        self._apply(("register", name, payload))
 
     def unregister(self, name: str) -> None:
-        self._data["components"].pop(name, None)
-        self._save()
+        self._apply(("unregister", name, None))
 
     def get(self, name: str) -> Optional[Dict[str, Any]]:
+        self._refresh_if_stale()
         return self._data["components"].get(name)
 
     def list(self) -> List[Dict[str, Any]]:
+        self._refresh_if_stale()
         return list(self._data["components"].values())
+
+    def query(
+        self,
+        *,
+        domain: Optional[str] = None,
+        package_type: Optional[str] = None,
+        component_type: Optional[str] = None,
+        keywords: Iterable[str] = (),
+        flags: Iterable[str] = (),
+        version_spec: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Consulta por índices secundarios. Todos los criterios se combinan con AND.
+        Ej: registry.query(domain="hospitality", package_type="integration")
+            registry.query(flags=["workers"], version_spec=">=1.0.0,<2.0.0")
+        Devuelve {nombre: payload} ordenado por nombre.
+        """
+        self._refresh_if_stale()
+        components = self._data["components"]
+        if self._index is None:
+            self._index = RegistryIndex()
+            self._index.rebuild(components)
+        names = self._index.query(
+            domain=domain,
+            package_type=package_type,
+            component_type=component_type,
+            keywords=keywords,
+            flags=flags,
+            version_spec=version_spec,
+        )
+        if names is None:
+            names = set(components)
+        return {name: components[name] for name in sorted(names)}
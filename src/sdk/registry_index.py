@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import bisect
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from semantic_version import SimpleSpec, Version
+
+# Cláusulas que se pueden resolver con bisect sobre el índice ordenado de versiones
+_CLAUSE_RE = re.compile(r"^\s*(>=|<=|==|>|<|=)?\s*(\d+\.\d+\.\d+\S*)\s*$")
+
+
+class RegistryIndex:
+    """
+    Índices secundarios sobre los payloads de un registry.
+
+    Se indexan los campos de manifest presentes en cada payload:
+    domain, package_type, component_type, keywords, registry_flags (los flags a True)
+    y version (lista ordenada para consultas por rango).
+    Las consultas cuestan O(resultado) salvo especificaciones de versión que no
+    se reducen a cotas simples, que se filtran sobre los candidatos.
+    """
+
+    EQUALITY_FIELDS = ("domain", "package_type", "component_type")
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self._by_field: Dict[str, Dict[str, Set[str]]] = {
+            field: {} for field in self.EQUALITY_FIELDS
+        }
+        self._by_keyword: Dict[str, Set[str]] = {}
+        self._by_flag: Dict[str, Set[str]] = {}
+        self._versions: List[Tuple[Version, str]] = []
+        self._version_of: Dict[str, Version] = {}
+
+    # ------------------------------------------------------------------
+    # MANTENIMIENTO
+    # ------------------------------------------------------------------
+
+    def rebuild(self, components: Dict[str, Dict[str, Any]]) -> None:
+        self._reset()
+        for name, payload in components.items():
+            self.add(name, payload)
+
+    def add(self, name: str, payload: Dict[str, Any]) -> None:
+        for field in self.EQUALITY_FIELDS:
+            value = payload.get(field)
+            if value is not None:
+                self._by_field[field].setdefault(str(value), set()).add(name)
+
+        for keyword in self._keywords(payload):
+            self._by_keyword.setdefault(keyword, set()).add(name)
+
+        for flag in self._flags(payload):
+            self._by_flag.setdefault(flag, set()).add(name)
+
+        version = self._version(payload)
+        if version is not None:
+            bisect.insort(self._versions, (version, name))
+            self._version_of[name] = version
+
+    def remove(self, name: str, payload: Dict[str, Any]) -> None:
+        for field in self.EQUALITY_FIELDS:
+            value = payload.get(field)
+            if value is not None:
+                self._discard(self._by_field[field], str(value), name)
+
+        for keyword in self._keywords(payload):
+            self._discard(self._by_keyword, keyword, name)
+
+        for flag in self._flags(payload):
+            self._discard(self._by_flag, flag, name)
+
+        version = self._version_of.pop(name, None)
+        if version is not None:
+            position = bisect.bisect_left(self._versions, (version, name))
+            del self._versions[position]
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, name: str) -> None:
+        names = index.get(key)
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del index[key]
+
+    @staticmethod
+    def _keywords(payload: Dict[str, Any]) -> Set[str]:
+        keywords = payload.get("keywords") or []
+        return {str(k).lower() for k in keywords}
+
+    @staticmethod
+    def _flags(payload: Dict[str, Any]) -> List[str]:
+        flags = payload.get("registry_flags") or {}
+        if not isinstance(flags, dict):
+            return []
+        return [flag for flag, enabled in flags.items() if enabled is True]
+
+    @staticmethod
+    def _version(payload: Dict[str, Any]) -> Optional[Version]:
+        raw = payload.get("version")
+        if not raw:
+            return None
+        try:
+            return Version(str(raw))
+        except ValueError:
+            return None
+
+    # ------------------------------------------------------------------
+    # CONSULTAS
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        *,
+        domain: Optional[str] = None,
+        package_type: Optional[str] = None,
+        component_type: Optional[str] = None,
+        keywords: Iterable[str] = (),
+        flags: Iterable[str] = (),
+        version_spec: Optional[str] = None,
+    ) -> Optional[Set[str]]:
+        """
+        Devuelve los nombres que cumplen todos los criterios,
+        o None si no se indicó ningún criterio (todos los componentes).
+        """
+        candidates: List[Set[str]] = []
+        for field, value in (
+            ("domain", domain),
+            ("package_type", package_type),
+            ("component_type", component_type),
+        ):
+            if value is not None:
+                candidates.append(self._by_field[field].get(value, set()))
+        for keyword in keywords:
+            candidates.append(self._by_keyword.get(keyword.lower(), set()))
+        for flag in flags:
+            candidates.append(self._by_flag.get(flag, set()))
+
+        if not candidates:
+            if version_spec is None:
+                return None
+            # Solo rango de versiones: el tramo bisect ya es ~ el resultado
+            candidates.append(self._version_range(version_spec))
+
+        candidates.sort(key=len)
+        result = set(candidates[0])
+        for names in candidates[1:]:
+            if not result:
+                break
+            result &= names
+
+        if version_spec is not None and result:
+            # Con otros criterios se filtra el conjunto (menor) ya intersectado
+            spec = SimpleSpec(version_spec)
+            version_of = self._version_of
+            result = {
+                name for name in result
+                if name in version_of and spec.match(version_of[name])
+            }
+        return result
+
+    def _version_range(self, version_spec: str) -> Set[str]:
+        """
+        Acota con bisect usando las cláusulas simples (>=, >, <=, <, ==) del spec.
+        Las cláusulas restantes (^, ~, !=...) se aplican después sobre el resultado.
+        """
+        SimpleSpec(version_spec)  # valida el formato completo
+
+        low, high = 0, len(self._versions)
+        for clause in version_spec.split(","):
+            match = _CLAUSE_RE.match(clause)
+            if not match:
+                continue
+            op, raw = match.group(1) or "==", match.group(2)
+            try:
+                version = Version(raw)
+            except ValueError:
+                continue
+            if op in (">=", "==", "="):
+                low = max(low, bisect.bisect_left(self._versions, (version,)))
+            if op in ("<=", "==", "="):
+                high = min(high, self._upper_bound(version))
+            if op == ">":
+                low = max(low, self._upper_bound(version))
+            if op == "<":
+                high = min(high, bisect.bisect_left(self._versions, (version,)))
+
+        return {name for _, name in self._versions[low:high]}
+
+    def _upper_bound(self, version: Version) -> int:
+        # Primera posición con versión > version
+        lo, hi = 0, len(self._versions)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._versions[mid][0] <= version:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
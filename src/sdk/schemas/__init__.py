@@ -1,10 +1,24 @@
 # src/sdk/schemas/__init__.py
-from .meta_schema import ModuleMetaSchema, AppMetaSchema, BaseMetaSchema
-from .dependency_schema import DependencySchema
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    "ModuleMetaSchema": ".meta_schema",
+    "AppMetaSchema": ".meta_schema",
+    "BaseMetaSchema": ".meta_schema",
+    "DependencySchema": ".dependency_schema",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+if TYPE_CHECKING:
+    from .meta_schema import ModuleMetaSchema, AppMetaSchema, BaseMetaSchema
+    from .dependency_schema import DependencySchema
 
 __all__ = [
     "ModuleMetaSchema",
     "AppMetaSchema",
     "DependencySchema",
     "BaseMetaSchema",
-]
\ No newline at end of file
+]
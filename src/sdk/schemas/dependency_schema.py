@@ -1,5 +1,5 @@
 # src/sdk/schemas/dependency_schema.py
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
@@ -7,6 +7,8 @@ class DependencySchema(BaseModel):
     """
     Representa una dependencia declarada por un componente.
     """
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(..., min_length=2)
     version: Optional[str] = None
     optional: bool = False
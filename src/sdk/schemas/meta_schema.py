@@ -1,11 +1,16 @@
 # src/sdk/schemas/meta_schema.py
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing import List, Dict, Optional, Literal, Any
-from semantic_version import Version as SemVer, SimpleSpec
+
+# Los esquemas de validación se construyen en la primera validación y no al
+# importar el módulo; semantic_version también se importa solo al validar.
+_LAZY_MODEL = ConfigDict(defer_build=True)
 
 
 class AuthorInfo(BaseModel):
     """Información de un autor/contribuyente"""
+    model_config = _LAZY_MODEL
+
     name: str = Field(..., min_length=2)
     role: Literal["author", "maintainer", "contributor"] = "contributor"
     email: Optional[str] = None
@@ -14,18 +19,24 @@ class AuthorInfo(BaseModel):
 
 class GeoRestrictions(BaseModel):
     """Restricciones geográficas de disponibilidad"""
+    model_config = _LAZY_MODEL
+
     include: List[str] = Field(default_factory=lambda: ["*"])
     exclude: List[str] = Field(default_factory=list)
 
 
 class ExternalDependencies(BaseModel):
     """Dependencias externas (PyPI/binarios)"""
+    model_config = _LAZY_MODEL
+
     python: List[str] = Field(default_factory=list)
     bin: List[str] = Field(default_factory=list)
 
 
 class LifecycleHooks(BaseModel):
     """Hooks de ciclo de vida del componente"""
+    model_config = _LAZY_MODEL
+
     pre_install: Optional[str] = None
     post_install: Optional[str] = None
     post_uninstall: Optional[str] = None
@@ -33,6 +44,8 @@ class LifecycleHooks(BaseModel):
 
 class RegistryFlags(BaseModel):
     """Flags de registro en el sistema ERP"""
+    model_config = _LAZY_MODEL
+
     models: bool = False
     api: bool = False
     workers: bool = False
@@ -41,6 +54,8 @@ class RegistryFlags(BaseModel):
 
 class BaseMetaSchema(BaseModel):
     """Esquema base minimalista para todos los componentes"""
+    model_config = _LAZY_MODEL
+
 
     # ===== IDENTIDAD (OBLIGATORIO) =====
     technical_name: str = Field(
@@ -85,6 +100,8 @@ class BaseMetaSchema(BaseModel):
     @field_validator("version")
     @classmethod
     def validate_version(cls, v: str) -> str:
+        from semantic_version import Version as SemVer
+
         try:
             SemVer(v)
             return v
@@ -95,6 +112,8 @@ class BaseMetaSchema(BaseModel):
     @classmethod
     def validate_erp_version(cls, v: str) -> str:
         # Validar que sea especificación semver válida
+        from semantic_version import SimpleSpec
+
         try:
             SimpleSpec(v)
             return v
@@ -105,6 +124,8 @@ class BaseMetaSchema(BaseModel):
     @classmethod
     def validate_python_version(cls, v: str) -> str:
         # Validar especificación semver de Python (>=3.11, ~=3.12, etc.)
+        from semantic_version import SimpleSpec
+
         try:
             SimpleSpec(v)
             return v
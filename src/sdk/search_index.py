@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+import re
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .schemas.meta_schema import BaseMetaSchema
+from .utils.meta_parser import parse_meta_file
+
+Manifest = Union[BaseMetaSchema, Mapping[str, Any]]
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Peso de cada campo en la puntuación: un keyword pesa más que una mención en la descripción
+FIELD_WEIGHTS = {
+    "keywords": 3.0,
+    "technical_name": 2.0,
+    "display_name": 2.0,
+    "domain": 2.0,
+    "description": 1.0,
+}
+
+STOPWORDS = frozenset({
+    "a", "al", "con", "de", "del", "el", "en", "la", "las", "lo", "los", "para",
+    "por", "un", "una", "y", "and", "for", "of", "the", "to", "with",
+})
+
+
+def normalize_text(text: str) -> str:
+    """Minúsculas y sin tildes ni diacríticos: "Contabilidad Básica" -> "contabilidad basica"."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall(normalize_text(text)) if t not in STOPWORDS]
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    name: str
+    score: float
+
+
+class SearchIndex:
+    """
+    Índice invertido de texto sobre keywords, technical_name, display_name,
+    domain y description de un conjunto de manifests.
+    - Normalización sin tildes ni mayúsculas ("educación" encuentra "educacion").
+    - Ranking por suma de peso de campo x idf de cada término.
+    - El último término de la consulta también se busca como prefijo ("conta").
+    - add() de un componente existente lo reemplaza; remove() lo quita.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._documents: Dict[str, Dict[str, float]] = {}
+        self._vocabulary: Optional[List[str]] = None
+        self._prefix_cache: Dict[str, Tuple[Dict[str, float], float]] = {}
+
+    @classmethod
+    def from_manifests(cls, manifests: Iterable[Manifest]) -> "SearchIndex":
+        index = cls()
+        for manifest in manifests:
+            index.add(manifest)
+        return index
+
+    @classmethod
+    def from_paths(cls, component_paths: Iterable[Path]) -> "SearchIndex":
+        """Indexa leyendo solo los __meta__.py (sin validación pydantic)."""
+        return cls.from_manifests(
+            parse_meta_file(Path(p) / "__meta__.py") for p in component_paths
+        )
+
+    # ------------------------------------------------------------------
+    # MANTENIMIENTO
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _field_values(manifest: Manifest) -> Dict[str, Any]:
+        if isinstance(manifest, BaseMetaSchema):
+            return {field: getattr(manifest, field) for field in FIELD_WEIGHTS}
+        return {field: manifest.get(field) for field in FIELD_WEIGHTS}
+
+    def add(self, manifest: Manifest) -> None:
+        values = self._field_values(manifest)
+        name = values["technical_name"]
+        if not isinstance(name, str) or not name:
+            raise ValueError("El manifest no tiene technical_name")
+
+        weights: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            value = values[field]
+            if not value:
+                continue
+            texts = value if isinstance(value, list) else [value]
+            for text in texts:
+                for token in tokenize(str(text)):
+                    weights[token] = weights.get(token, 0.0) + weight
+
+        self.remove(name)
+        self._prefix_cache.clear()
+        self._documents[name] = weights
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                self._postings[token] = {name: weight}
+                self._vocabulary = None
+            else:
+                postings[name] = weight
+
+    def remove(self, name: str) -> None:
+        weights = self._documents.pop(name, None)
+        if weights is None:
+            return
+        self._prefix_cache.clear()
+        for token in weights:
+            postings = self._postings[token]
+            del postings[name]
+            if not postings:
+                del self._postings[token]
+                self._vocabulary = None
+
+    # ------------------------------------------------------------------
+    # CONSULTAS
+    # ------------------------------------------------------------------
+
+    def _prefix_postings(self, prefix: str) -> Tuple[Dict[str, float], float]:
+        """
+        (postings, idf) de los términos que empiezan por prefix. Con un solo
+        término se devuelven sus postings tal cual; con varios, la mejor
+        puntuación de cada componente (idf incluido) y se cachea hasta el próximo cambio.
+        """
+        cached = self._prefix_cache.get(prefix)
+        if cached is not None:
+            return cached
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        start = bisect.bisect_left(vocabulary, prefix)
+        end = start
+        while end < len(vocabulary) and vocabulary[end].startswith(prefix):
+            end += 1
+
+        if end - start == 1:
+            token = vocabulary[start]
+            result = (self._postings[token], self._idf(token))
+        else:
+            merged: Dict[str, float] = {}
+            for token in vocabulary[start:end]:
+                idf = self._idf(token)
+                for name, weight in self._postings[token].items():
+                    score = weight * idf
+                    if score > merged.get(name, 0.0):
+                        merged[name] = score
+            result = (merged, 1.0)
+        self._prefix_cache[prefix] = result
+        return result
+
+    def _idf(self, token: str) -> float:
+        return math.log(1.0 + len(self._documents) / len(self._postings[token]))
+
+    def search(self, query: str, limit: Optional[int] = 20, prefix: bool = True) -> List[SearchHit]:
+        """
+        Componentes que contienen todos los términos de la consulta, ordenados
+        por relevancia (y por nombre a igual puntuación).
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        # (postings, idf) por término; en el prefijo el idf ya va incluido
+        terms: List[Tuple[Dict[str, float], float]] = []
+        for position, token in enumerate(tokens):
+            if prefix and position == len(tokens) - 1:
+                postings, idf = self._prefix_postings(token)
+            else:
+                postings = self._postings.get(token, {})
+                idf = self._idf(token) if postings else 0.0
+            if not postings:
+                return []
+            terms.append((postings, idf))
+
+        # Se recorre la lista más corta y se consulta el resto por nombre
+        terms.sort(key=lambda term: len(term[0]))
+        (smallest, first_idf), rest = terms[0], terms[1:]
+        ranked: List[Tuple[float, str]] = []
+        for name, weight in smallest.items():
+            score = weight * first_idf
+            for postings, idf in rest:
+                other = postings.get(name)
+                if other is None:
+                    break
+                score += other * idf
+            else:
+                ranked.append((-score, name))
+
+        top = sorted(ranked) if limit is None else heapq.nsmallest(limit, ranked)
+        return [SearchHit(name, -score) for score, name in top]
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._documents
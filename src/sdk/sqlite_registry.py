@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .exceptions import ValidationError
+
+
+class SQLiteComponentRegistry:
+    """
+    Registry de componentes sobre sqlite3 (modo WAL).
+    Misma API que ComponentRegistry (register/unregister/get/list), pero cada
+    mutación escribe solo la fila afectada y las búsquedas usan índices.
+    """
+
+    INDEXED_FIELDS = ("version", "path", "domain", "package_type", "component_type")
+
+    def __init__(self, registry_path: Path, timeout: float = 30.0):
+        self.registry_path = registry_path
+        self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._conn = sqlite3.connect(
+            str(registry_path),
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._init_schema()
+
+    # ------------------------------------------------------------------
+    # SCHEMA
+    # ------------------------------------------------------------------
+
+    def _init_schema(self) -> None:
+        columns = ", ".join(f"{field} TEXT" for field in self.INDEXED_FIELDS)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS components ("
+                f"name TEXT PRIMARY KEY, payload TEXT NOT NULL, {columns})"
+            )
+            for field in self.INDEXED_FIELDS:
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS ix_components_{field} "
+                    f"ON components({field})"
+                )
+
+    def _row(self, name: str, payload: Dict[str, Any]) -> Tuple[Any, ...]:
+        indexed = tuple(
+            None if payload.get(field) is None else str(payload[field])
+            for field in self.INDEXED_FIELDS
+        )
+        return (name, json.dumps(payload)) + indexed
+
+    # ------------------------------------------------------------------
+    # TRANSACCIONES
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def batch(self) -> Iterator["SQLiteComponentRegistry"]:
+        """
+        Agrupa varias mutaciones en una única transacción.
+        Se confirma al salir del bloque y se revierte ante cualquier excepción.
+        Los bloques anidados se integran en la transacción exterior.
+        """
+        with self._lock:
+            if self._batch_depth:
+                self._batch_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._batch_depth -= 1
+                return
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._batch_depth = 1
+            try:
+                yield self
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._conn.execute("COMMIT")
+            finally:
+                self._batch_depth = 0
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def register(self, name: str, payload: Dict[str, Any]) -> None:
+        self.register_many([(name, payload)])
+
+    def register_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        placeholders = ", ".join("?" * (len(self.INDEXED_FIELDS) + 2))
+        updates = ", ".join(
+            f"{column} = excluded.{column}"
+            for column in ("payload",) + self.INDEXED_FIELDS
+        )
+        with self.batch():
+            self._conn.executemany(
+                f"INSERT INTO components VALUES ({placeholders}) "
+                f"ON CONFLICT(name) DO UPDATE SET {updates}",
+                (self._row(name, payload) for name, payload in items),
+            )
+
+    def unregister(self, name: str) -> None:
+        self.unregister_many([name])
+
+    def unregister_many(self, names: Iterable[str]) -> None:
+        with self.batch():
+            self._conn.executemany(
+                "DELETE FROM components WHERE name = ?",
+                ((name,) for name in names),
+            )
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM components WHERE name = ?", (name,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT payload FROM components ORDER BY rowid"
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def find(self, **criteria: Any) -> List[Dict[str, Any]]:
+        """
+        Búsqueda indexada por igualdad sobre INDEXED_FIELDS.
+        Ej: registry.find(domain="hospitality", package_type="integration")
+        """
+        unknown = set(criteria) - set(self.INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(
+                f"Campos no indexados: {', '.join(sorted(unknown))}. "
+                f"Disponibles: {', '.join(self.INDEXED_FIELDS)}"
+            )
+
+        clauses = " AND ".join(f"{field} = ?" for field in criteria) or "1"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT payload FROM components WHERE {clauses} ORDER BY rowid",
+                tuple(str(value) for value in criteria.values()),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM components").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "SQLiteComponentRegistry":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def migrate_json_registry(json_path: Path, sqlite_path: Path) -> int:
+    """
+    Copia todos los componentes de un registry JSON a un registry SQLite
+    en una sola transacción. Devuelve el número de componentes migrados.
+    """
+    if not json_path.exists():
+        raise FileNotFoundError(f"Registry no encontrado: {json_path}")
+
+    raw = json_path.read_text(encoding="utf-8")
+    try:
+        data = json.loads(raw) if raw.strip() else {}
+    except json.JSONDecodeError as e:
+        raise ValidationError(
+            f"Registry JSON corrupto en {json_path} línea {e.lineno}: {e.msg}"
+        ) from e
+
+    components = data.get("components", {})
+    with SQLiteComponentRegistry(sqlite_path) as registry:
+        registry.register_many(components.items())
+    return len(components)
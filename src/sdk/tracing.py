@@ -0,0 +1,222 @@
+"""
+Instrumentación por spans anidados del pipeline de instalación.
+
+Por defecto no hay tracer activo y `span()` devuelve un objeto no-op compartido:
+el coste con la instrumentación desactivada es una comprobación de None.
+
+    from sdk.tracing import InMemoryExporter, Tracer, use_tracer
+
+    exporter = InMemoryExporter()
+    with use_tracer(Tracer(exporter)):
+        installer.install_many(paths)
+    for recorded in exporter.spans:
+        print(recorded.name, recorded.duration, recorded.attributes)
+"""
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Protocol
+
+
+@dataclass
+class Span:
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    start: float  # epoch (time.time)
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    duration: float = 0.0
+    error: Optional[str] = None
+
+    recording = True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "duration": self.duration,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None:
+        ...
+
+
+class _NoopSpan:
+    """Span y context manager a la vez; se comparte entre todas las llamadas."""
+
+    recording = False
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("sdk_current_span", default=None)
+
+
+class _SpanScope:
+    __slots__ = ("_tracer", "_span", "_token", "_started")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        parent = _current_span.get()
+        self._tracer = tracer
+        self._span = Span(
+            name=name,
+            span_id=next(tracer._ids),
+            parent_id=parent.span_id if parent is not None else None,
+            start=time.time(),
+            attributes=attributes,
+        )
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        self._started = time.perf_counter()
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self._span.duration = time.perf_counter() - self._started
+        if exc_type is not None:
+            self._span.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self._tracer._export(self._span)
+
+
+class Tracer:
+    """
+    Registra spans anidados (el padre es el span activo del contexto actual,
+    por hilo / tarea) y los entrega a los exporters al cerrarse.
+    """
+
+    def __init__(self, *exporters: SpanExporter):
+        self.exporters = list(exporters)
+        self._ids = itertools.count(1)
+
+    def span(self, name: str, **attributes: Any) -> _SpanScope:
+        return _SpanScope(self, name, attributes)
+
+    def _export(self, span: Span) -> None:
+        for exporter in self.exporters:
+            exporter.export(span)
+
+
+class InMemoryExporter:
+    """Guarda los spans cerrados en memoria (tests, diagnósticos puntuales)."""
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def by_name(self, name: str) -> List[Span]:
+        return [s for s in self.spans if s.name == name]
+
+    def children(self, parent: Span) -> List[Span]:
+        return [s for s in self.spans if s.parent_id == parent.span_id]
+
+    def totals(self) -> Dict[str, float]:
+        """Duración acumulada por nombre de span."""
+        totals: Dict[str, float] = {}
+        for s in self.spans:
+            totals[s.name] = totals.get(s.name, 0.0) + s.duration
+        return totals
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class JsonLinesExporter:
+    """Añade un objeto JSON por span cerrado a un archivo (una línea por span)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "JsonLinesExporter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+# ----------------------------------------------------------------------
+# TRACER GLOBAL
+# ----------------------------------------------------------------------
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> Optional[Tracer]:
+    """Activa un tracer para todo el proceso (None lo desactiva). Devuelve el anterior."""
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+
+@contextmanager
+def use_tracer(tracer: Optional[Tracer]) -> Iterator[Optional[Tracer]]:
+    """Activa un tracer durante el bloque y restaura el anterior al salir."""
+    previous = set_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        set_tracer(previous)
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """
+    Abre un span en el tracer activo. Sin tracer devuelve NOOP_SPAN.
+    Los atributos costosos de calcular deben condicionarse a `s.recording`.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return NOOP_SPAN
+    return _SpanScope(tracer, name, attributes)
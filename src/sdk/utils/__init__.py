@@ -1,6 +1,19 @@
-from .file_utils import FileUtils
-from .version_utils import VersionUtils
-from .meta_validator import validate_meta
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    "FileUtils": ".file_utils",
+    "VersionUtils": ".version_utils",
+    "validate_meta": ".meta_validator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+if TYPE_CHECKING:
+    from .file_utils import FileUtils
+    from .version_utils import VersionUtils
+    from .meta_validator import validate_meta
 
 __all__ = [
     "FileUtils",
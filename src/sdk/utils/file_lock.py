@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+class FileLock:
+    """
+    Lock exclusivo entre procesos basado en un archivo auxiliar (flock / msvcrt).
+    Es reentrante dentro del mismo hilo y serializa hilos del mismo proceso.
+    """
+
+    def __init__(self, path: Path, timeout: Optional[float] = None, poll_interval: float = 0.01):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._handle: Optional[IO[bytes]] = None
+
+    def acquire(self) -> None:
+        self._thread_lock.acquire()
+        if self._depth:
+            self._depth += 1
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(self.path, "a+b")
+            try:
+                self._lock_handle(handle)
+            except BaseException:
+                handle.close()
+                raise
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+        self._handle = handle
+        self._depth = 1
+
+    def release(self) -> None:
+        if not self._depth:
+            raise RuntimeError(f"FileLock no adquirido: {self.path}")
+        self._depth -= 1
+        if not self._depth and self._handle is not None:
+            try:
+                self._unlock_handle(self._handle)
+            finally:
+                self._handle.close()
+                self._handle = None
+        self._thread_lock.release()
+
+    def _lock_handle(self, handle: IO[bytes]) -> None:
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    flags = fcntl.LOCK_EX if deadline is None else fcntl.LOCK_EX | fcntl.LOCK_NB
+                    fcntl.flock(handle.fileno(), flags)
+                else:
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"No se pudo adquirir el lock {self.path}")
+                time.sleep(self.poll_interval)
+
+    @staticmethod
+    def _unlock_handle(handle: IO[bytes]) -> None:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+
+def lock_path_for(path: Path) -> Path:
+    return path.with_name(path.name + ".lock")
+
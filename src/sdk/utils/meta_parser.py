@@ -1,11 +1,26 @@
 # src/sdk/utils/meta_parser.py
 import ast
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
 
 from ..exceptions import ValidationError
 
 
+@dataclass(frozen=True)
+class MetaField:
+    """
+    Asignación top-level de __meta__.py con su valor y la posición del valor
+    en el archivo (líneas 1-based, columnas en bytes UTF-8 como en el AST).
+    """
+    name: str
+    value: Any
+    lineno: int
+    col_offset: int
+    end_lineno: int
+    end_col_offset: int
+
+
 def parse_meta_file(meta_path: Path) -> Dict[str, Any]:
     """
     Extrae variables top-level de __meta__.py usando AST (100% seguro, sin ejecutar código)
@@ -19,28 +34,46 @@ def parse_meta_file(meta_path: Path) -> Dict[str, Any]:
     if not meta_path.exists():
         raise FileNotFoundError(f"Archivo no encontrado: {meta_path}")
 
+    fields = parse_meta_fields(meta_path.read_text(encoding="utf-8"), meta_path)
+    metadata = {name: field.value for name, field in fields.items()}
+
+    if not metadata:
+        raise ValidationError(f"__meta__.py no contiene variables top-level válidas")
+
+    return metadata
+
+
+def parse_meta_fields(source: str, meta_path: Path) -> Dict[str, MetaField]:
+    """
+    Igual que parse_meta_file pero sobre el código fuente, conservando la
+    posición de cada valor para poder reescribirlo sin tocar el resto del archivo.
+    """
     try:
-        tree = ast.parse(meta_path.read_text(encoding="utf-8"), filename=str(meta_path))
+        tree = ast.parse(source, filename=str(meta_path))
     except SyntaxError as e:
         raise ValidationError(
             f"Error de sintaxis en __meta__.py línea {e.lineno}: {e.msg}"
         )
 
-    metadata = {}
+    fields: Dict[str, MetaField] = {}
     for node in ast.iter_child_nodes(tree):
         if isinstance(node, ast.Assign) and len(node.targets) == 1:
             target = node.targets[0]
             if isinstance(target, ast.Name) and not target.id.startswith("_"):
                 try:
                     value = _ast_node_to_safe_value(node.value, meta_path, target.id)
-                    metadata[target.id] = value
                 except ValueError as e:
                     raise ValidationError(f"Error en __meta__.py línea {node.lineno}: {e}")
+                fields[target.id] = MetaField(
+                    name=target.id,
+                    value=value,
+                    lineno=node.value.lineno,
+                    col_offset=node.value.col_offset,
+                    end_lineno=node.value.end_lineno,
+                    end_col_offset=node.value.end_col_offset,
+                )
 
-    if not metadata:
-        raise ValidationError(f"__meta__.py no contiene variables top-level válidas")
-
-    return metadata
+    return fields
 
 
 def _ast_node_to_safe_value(node: ast.AST, meta_path: Path, var_name: str) -> Any:
@@ -1,26 +1,189 @@
 import ast
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SyntaxIssue:
+    """Error de sintaxis en un archivo Python."""
+    path: Path
+    lineno: Optional[int]
+    message: str
+
+    def __str__(self) -> str:
+        line = f":{self.lineno}" if self.lineno else ""
+        return f"{self.path}{line}: {self.message}"
+
+
+def _compile_check(source: bytes, filename: str) -> Optional[Tuple[Optional[int], str]]:
+    try:
+        compile(source, filename, "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+        return None
+    except SyntaxError as e:
+        return e.lineno, e.msg
+    except (UnicodeDecodeError, ValueError) as e:
+        return None, str(e)
+
+
+def _compile_check_item(item: Tuple[str, bytes]) -> Optional[Tuple[Optional[int], str]]:
+    return _compile_check(item[1], item[0])
+
+
+class SyntaxCheckCache:
+    """
+    Resultados de comprobaciones de sintaxis por archivo, persistidos en JSON.
+    Un archivo se vuelve a compilar solo si cambió su (mtime, tamaño) y además
+    su hash de contenido.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = False
+        if cache_path is not None and cache_path.exists():
+            try:
+                self._entries = json.loads(cache_path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                self._entries = {}
+
+    def lookup(self, path: str, stat: os.stat_result) -> Optional[Dict]:
+        entry = self._entries.get(path)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry
+        return None
+
+    def lookup_hash(self, path: str, digest: str) -> Optional[Dict]:
+        entry = self._entries.get(path)
+        return entry if entry and entry["sha256"] == digest else None
+
+    def store(
+        self,
+        path: str,
+        stat: os.stat_result,
+        digest: str,
+        issue: Optional[Tuple[Optional[int], str]],
+    ) -> None:
+        self._entries[path] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "issue": list(issue) if issue else None,
+        }
+        self._dirty = True
+
+    def prune(self, directory: str, seen: set) -> None:
+        prefix = directory.rstrip(os.sep) + os.sep
+        stale = [p for p in self._entries if p.startswith(prefix) and p not in seen]
+        for path in stale:
+            del self._entries[path]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        if self.cache_path is None or not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._entries), encoding="utf-8")
+        tmp_path.replace(self.cache_path)
+        self._dirty = False
+
 
 class ValidationUtils:
     """Utilidades de validación estática."""
 
+    # Por debajo de este número de archivos a compilar no compensa arrancar un pool
+    PARALLEL_THRESHOLD = 64
+
     @staticmethod
     def validate_python_syntax(file_path: Path) -> bool:
         """Valida la sintaxis de un archivo Python sin ejecutarlo."""
+        return ValidationUtils.check_python_syntax(file_path) is None
+
+    @staticmethod
+    def check_python_syntax(file_path: Path) -> Optional[SyntaxIssue]:
+        """Devuelve el error de sintaxis de un archivo (con línea) o None si es válido."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-            ast.parse(source)
-            return True
-        except (SyntaxError, UnicodeDecodeError):
-            return False
+            source = file_path.read_bytes()
+        except OSError as e:
+            return SyntaxIssue(file_path, None, str(e))
+        issue = _compile_check(source, str(file_path))
+        return SyntaxIssue(file_path, issue[0], issue[1]) if issue else None
+
+    @staticmethod
+    def iter_python_files(directory: Path) -> Iterator[os.DirEntry]:
+        """Recorre los .py de un árbol con scandir, omitiendo __pycache__ y directorios ocultos."""
+        stack = [os.fspath(directory)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != "__pycache__" and not entry.name.startswith("."):
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield entry
+
+    @staticmethod
+    def scan_syntax(
+        directory: Path,
+        cache: Optional[SyntaxCheckCache] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[SyntaxIssue]:
+        """
+        Comprueba la sintaxis de todos los .py de un árbol y devuelve cada error.
+        - Con cache, omite los archivos sin cambios desde la pasada anterior.
+        - Compila en un pool de procesos cuando hay muchos archivos pendientes.
+        """
+        cache = cache or SyntaxCheckCache()
+        directory_key = os.path.abspath(directory)
+        results: Dict[str, Optional[Tuple[Optional[int], str]]] = {}
+        pending: List[Tuple[str, bytes, os.stat_result, str]] = []
+
+        for entry in ValidationUtils.iter_python_files(directory):
+            path = os.path.abspath(entry.path)
+            stat = entry.stat()
+            cached = cache.lookup(path, stat)
+            if cached is not None:
+                results[path] = cached["issue"]
+                continue
+
+            source = Path(path).read_bytes()
+            digest = hashlib.sha256(source).hexdigest()
+            cached = cache.lookup_hash(path, digest)
+            if cached is not None:
+                # Solo cambió el mtime (touch, checkout): se reutiliza el resultado
+                results[path] = cached["issue"]
+                cache.store(path, stat, digest, cached["issue"])
+                continue
+            pending.append((path, source, stat, digest))
+
+        items = [(path, source) for path, source, _, _ in pending]
+        workers = max_workers or os.cpu_count() or 1
+        if workers > 1 and len(items) >= ValidationUtils.PARALLEL_THRESHOLD:
+            chunksize = max(1, len(items) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(_compile_check_item, items, chunksize=chunksize))
+        else:
+            outcomes = [_compile_check_item(item) for item in items]
+
+        for (path, _, stat, digest), issue in zip(pending, outcomes):
+            results[path] = issue
+            cache.store(path, stat, digest, issue)
+
+        cache.prune(directory_key, set(results))
+        cache.save()
+
+        return [
+            SyntaxIssue(Path(path), issue[0], issue[1])
+            for path, issue in sorted(results.items())
+            if issue
+        ]
 
     @staticmethod
     def scan_directory_for_syntax_errors(directory: Path) -> List[Path]:
         """Escanea un directorio buscando archivos Python con errores de sintaxis."""
-        errors = []
-        for file_path in directory.rglob("*.py"):
-            if not ValidationUtils.validate_python_syntax(file_path):
-                errors.append(file_path)
-        return errors
+        return [issue.path for issue in ValidationUtils.scan_syntax(directory)]
@@ -1,9 +1,35 @@
-from .component_validator import ComponentValidator
-from .structure_validator import StructureValidator
-from .dependency_validator import DependencyValidator
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    "ComponentValidator": ".component_validator",
+    "StructureValidator": ".structure_validator",
+    "DependencyValidator": ".dependency_validator",
+    "BulkValidator": ".bulk_validator",
+    "BulkValidationReport": ".bulk_validator",
+    "ValidationCache": ".validation_cache",
+    "CatalogValidator": ".catalog_validator",
+    "CatalogReport": ".catalog_validator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+if TYPE_CHECKING:
+    from .component_validator import ComponentValidator
+    from .structure_validator import StructureValidator
+    from .dependency_validator import DependencyValidator
+    from .bulk_validator import BulkValidator, BulkValidationReport
+    from .validation_cache import ValidationCache
+    from .catalog_validator import CatalogValidator, CatalogReport
 
 __all__ = [
     "ComponentValidator",
     "StructureValidator",
     "DependencyValidator",
+    "BulkValidator",
+    "BulkValidationReport",
+    "ValidationCache",
+    "CatalogValidator",
+    "CatalogReport",
 ]
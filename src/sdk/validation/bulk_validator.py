@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import ValidationError as PydanticValidationError
+
+from ..exceptions import SourceSyntaxError
+from ..schemas.meta_schema import BaseMetaSchema
+from ..utils.meta_parser import parse_meta_file
+from .component_validator import ComponentValidator
+from .validation_cache import ValidationCache, component_fingerprint
+
+# Categorías de error del reporte, en el orden en que se ejecutan las etapas
+CATEGORY_NOT_FOUND = "not_found"
+CATEGORY_PARSE = "parse"
+CATEGORY_SCHEMA = "schema"
+CATEGORY_STRUCTURE = "structure"
+CATEGORY_SYNTAX = "syntax"
+CATEGORY_DEPENDENCY = "dependency"
+CATEGORY_INTERNAL = "internal"
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    category: str
+    message: str
+    location: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ComponentValidationResult:
+    path: str
+    name: Optional[str]
+    valid: bool
+    duration: float
+    errors: List[ValidationIssue] = field(default_factory=list)
+    cached: bool = False
+
+
+@dataclass(frozen=True)
+class BulkValidationReport:
+    results: List[ComponentValidationResult]
+    duration: float
+    workers: int
+
+    @property
+    def total(self) -> int:
+        return len(self.results)
+
+    @property
+    def valid(self) -> int:
+        return sum(1 for r in self.results if r.valid)
+
+    @property
+    def invalid(self) -> int:
+        return self.total - self.valid
+
+    @property
+    def cached(self) -> int:
+        return sum(1 for r in self.results if r.cached)
+
+    @property
+    def ok(self) -> bool:
+        return self.invalid == 0
+
+    def failures(self) -> List[ComponentValidationResult]:
+        return [r for r in self.results if not r.valid]
+
+    def by_category(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for result in self.results:
+            for issue in result.errors:
+                counts[issue.category] = counts.get(issue.category, 0) + 1
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "cached": self.cached,
+            "duration": self.duration,
+            "workers": self.workers,
+            "by_category": self.by_category(),
+            "results": [asdict(r) for r in self.results],
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+
+
+# ----------------------------------------------------------------------
+# WORKER
+# ----------------------------------------------------------------------
+
+_worker_validator: Optional[ComponentValidator] = None
+
+
+def _validator() -> ComponentValidator:
+    # Un validador por proceso del pool
+    global _worker_validator
+    if _worker_validator is None:
+        _worker_validator = ComponentValidator()
+    return _worker_validator
+
+
+def _schema_issues(error: PydanticValidationError) -> List[ValidationIssue]:
+    return [
+        ValidationIssue(
+            category=CATEGORY_SCHEMA,
+            message=item["msg"],
+            location=".".join(str(part) for part in item["loc"]) or None,
+        )
+        for item in error.errors()
+    ]
+
+
+def validate_one(component_path: Path) -> ComponentValidationResult:
+    """
+    Valida un componente recogiendo todos los errores posibles en lugar de
+    detenerse en el primero. Las etapas que dependen de otra fallida se omiten.
+    """
+    return _validate(component_path)[0]
+
+
+def _validate(component_path: Path) -> Tuple[ComponentValidationResult, Optional[BaseMetaSchema]]:
+    started = time.perf_counter()
+    validator = _validator()
+    errors: List[ValidationIssue] = []
+    name: Optional[str] = None
+    meta_model: Optional[BaseMetaSchema] = None
+    meta_path = component_path / "__meta__.py"
+
+    def done() -> Tuple[ComponentValidationResult, Optional[BaseMetaSchema]]:
+        result = ComponentValidationResult(
+            path=str(component_path),
+            name=name,
+            valid=not errors,
+            duration=time.perf_counter() - started,
+            errors=errors,
+        )
+        return result, meta_model if not errors else None
+
+    if not meta_path.exists():
+        errors.append(ValidationIssue(CATEGORY_NOT_FOUND, f"Archivo no encontrado: {meta_path}"))
+        return done()
+
+    try:
+        metadata = parse_meta_file(meta_path)
+    except Exception as e:
+        errors.append(ValidationIssue(CATEGORY_PARSE, str(e)))
+        return done()
+
+    raw_name = metadata.get("technical_name")
+    name = raw_name if isinstance(raw_name, str) else None
+
+    try:
+        meta_model = BaseMetaSchema(**metadata)
+    except PydanticValidationError as e:
+        errors.extend(_schema_issues(e))
+    except Exception as e:
+        errors.append(ValidationIssue(CATEGORY_INTERNAL, f"{type(e).__name__}: {e}"))
+
+    try:
+        validator.structure_validator.validate_structure(component_path)
+    except SourceSyntaxError as e:
+        errors.extend(
+            ValidationIssue(
+                CATEGORY_SYNTAX,
+                issue.message,
+                f"{issue.path}:{issue.lineno}" if issue.lineno else str(issue.path),
+            )
+            for issue in e.issues
+        )
+    except Exception as e:
+        errors.append(ValidationIssue(CATEGORY_STRUCTURE, str(e)))
+
+    if meta_model is not None:
+        try:
+            validator.dependency_validator.validate_dependencies(meta_model)
+        except PydanticValidationError as e:
+            errors.extend(
+                ValidationIssue(CATEGORY_DEPENDENCY, issue.message, issue.location)
+                for issue in _schema_issues(e)
+            )
+        except Exception as e:
+            errors.append(ValidationIssue(CATEGORY_DEPENDENCY, str(e)))
+
+    return done()
+
+
+def _validate_path(raw_path: str) -> Tuple[ComponentValidationResult, Optional[Dict[str, Any]]]:
+    result, meta_model = _validate(Path(raw_path))
+    return result, meta_model.model_dump(mode="json") if meta_model is not None else None
+
+
+# ----------------------------------------------------------------------
+# BULK
+# ----------------------------------------------------------------------
+
+class BulkValidator:
+    """
+    Valida muchos componentes en un pool de procesos sin detenerse ante fallos.
+    Por debajo de min_parallel componentes valida en el proceso actual, donde
+    arrancar el pool costaría más que la propia validación.
+    Con una ValidationCache, los componentes sin cambios no llegan al pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        min_parallel: int = 16,
+        cache: Optional[ValidationCache] = None,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel = min_parallel
+        self.cache = cache
+
+    def validate_many(self, component_paths: Iterable[Path]) -> BulkValidationReport:
+        started = time.perf_counter()
+        paths = [str(Path(p)) for p in component_paths]
+        results: Dict[str, ComponentValidationResult] = {}
+        fingerprints: Dict[str, Optional[str]] = {}
+
+        if self.cache is not None:
+            for raw_path in paths:
+                lookup_started = time.perf_counter()
+                fingerprint = component_fingerprint(Path(raw_path))
+                fingerprints[raw_path] = fingerprint
+                cached = (
+                    self.cache.get(Path(raw_path), fingerprint)
+                    if fingerprint is not None else None
+                )
+                if cached is not None:
+                    results[raw_path] = ComponentValidationResult(
+                        path=raw_path,
+                        name=cached.get("technical_name"),
+                        valid=True,
+                        duration=time.perf_counter() - lookup_started,
+                        cached=True,
+                    )
+
+        pending = [p for p in paths if p not in results]
+        workers = min(self.max_workers, len(pending)) or 1
+
+        if workers == 1 or len(pending) < self.min_parallel:
+            workers = 1
+            outcomes = [_validate_path(p) for p in pending]
+        else:
+            chunksize = max(1, len(pending) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(_validate_path, pending, chunksize=chunksize))
+
+        for raw_path, (result, dump) in zip(pending, outcomes):
+            results[raw_path] = result
+            fingerprint = fingerprints.get(raw_path)
+            if self.cache is not None and dump is not None and fingerprint is not None:
+                self.cache.put(Path(raw_path), fingerprint, dump)
+
+        if self.cache is not None:
+            self.cache.save()
+
+        return BulkValidationReport(
+            results=[results[p] for p in paths],
+            duration=time.perf_counter() - started,
+            workers=workers,
+        )
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from semantic_version import SimpleSpec, Version
+
+from ..schemas.meta_schema import BaseMetaSchema
+from ..utils.meta_parser import parse_meta_file
+
+Manifest = Union[BaseMetaSchema, Mapping[str, Any]]
+
+
+@dataclass(frozen=True)
+class DependencyEdge:
+    source: str
+    source_version: str
+    target: str
+    spec: Optional[str] = None
+    optional: bool = False
+
+
+@dataclass(frozen=True)
+class CatalogIssue:
+    edge: DependencyEdge
+    message: str
+
+
+@dataclass(frozen=True)
+class CatalogReport:
+    """
+    Resultado de validar las dependencias de todo un catálogo.
+    - unsatisfiable: el destino existe pero ninguna de sus versiones cumple el spec.
+    - dangling: el destino no existe en el catálogo (dependencias obligatorias).
+    - redundant: dependencia declarada más de una vez por el mismo componente.
+    - invalid: declaración mal formada (spec inválido, formato no soportado).
+    """
+    components: int
+    edges: int
+    duration: float
+    unsatisfiable: List[CatalogIssue] = field(default_factory=list)
+    dangling: List[CatalogIssue] = field(default_factory=list)
+    redundant: List[CatalogIssue] = field(default_factory=list)
+    invalid: List[CatalogIssue] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.unsatisfiable or self.dangling or self.invalid)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _manifest_fields(manifest: Manifest) -> Tuple[Optional[str], str, Any]:
+    if isinstance(manifest, BaseMetaSchema):
+        return manifest.technical_name, manifest.version, list(manifest.depends)
+    return (
+        manifest.get("technical_name"),
+        str(manifest.get("version", "")),
+        manifest.get("depends") or [],
+    )
+
+
+class CatalogValidator:
+    """
+    Valida las dependencias declaradas por todos los componentes de un catálogo
+    en una sola pasada lineal sobre un índice nombre -> versiones.
+    Las versiones y los specs se parsean una vez por cadena distinta y el
+    resultado de cada par (spec, destino) se memoriza.
+    """
+
+    def __init__(self) -> None:
+        self._versions: Dict[str, Optional[Version]] = {}
+        self._specs: Dict[str, Optional[SimpleSpec]] = {}
+
+    def _version(self, raw: Any) -> Optional[Version]:
+        # Valores no textuales (manifests sin validar) no son versiones ni claves memorizables
+        if not isinstance(raw, str):
+            return None
+        if raw not in self._versions:
+            try:
+                self._versions[raw] = Version(raw)
+            except ValueError:
+                self._versions[raw] = None
+        return self._versions[raw]
+
+    def _spec(self, raw: Any) -> Optional[SimpleSpec]:
+        if not isinstance(raw, str):
+            return None
+        if raw not in self._specs:
+            try:
+                self._specs[raw] = SimpleSpec(raw)
+            except ValueError:
+                self._specs[raw] = None
+        return self._specs[raw]
+
+    def validate(self, manifests: Iterable[Manifest]) -> CatalogReport:
+        started = time.perf_counter()
+        entries = [_manifest_fields(m) for m in manifests]
+
+        # Índice nombre -> versiones disponibles
+        catalog: Dict[str, List[Version]] = {}
+        for name, version, _ in entries:
+            if not isinstance(name, str) or not name:
+                continue
+            versions = catalog.setdefault(name, [])
+            parsed = self._version(version)
+            if parsed is not None:
+                versions.append(parsed)
+
+        satisfiable: Dict[Tuple[str, str], bool] = {}
+        unsatisfiable: List[CatalogIssue] = []
+        dangling: List[CatalogIssue] = []
+        redundant: List[CatalogIssue] = []
+        invalid: List[CatalogIssue] = []
+        edge_count = 0
+
+        for name, version, depends in entries:
+            source = name or "<sin technical_name>"
+            seen: set = set()
+            if not isinstance(depends, (list, tuple)):
+                invalid.append(CatalogIssue(
+                    DependencyEdge(source, version, str(depends)),
+                    f"depends debe ser una lista: {depends!r}",
+                ))
+                continue
+            for dep in depends:
+                edge_count += 1
+                if isinstance(dep, str):
+                    edge = DependencyEdge(source, version, dep)
+                elif isinstance(dep, Mapping) and isinstance(dep.get("name"), str):
+                    # Solo "" equivale a sin spec: 0 o [] se reportan como inválidos
+                    spec = dep.get("version")
+                    edge = DependencyEdge(
+                        source,
+                        version,
+                        dep["name"],
+                        None if spec == "" else spec,
+                        bool(dep.get("optional", False)),
+                    )
+                else:
+                    invalid.append(CatalogIssue(
+                        DependencyEdge(source, version, str(dep)),
+                        f"Dependencia inválida: {dep!r}",
+                    ))
+                    continue
+
+                # Una declaración repetida se marca como redundante, pero su spec
+                # se comprueba igualmente: puede ser la que no se satisface
+                duplicate = edge.target in seen
+                seen.add(edge.target)
+                self._check_edge(edge, catalog.get(edge.target), duplicate,
+                                 satisfiable, unsatisfiable, dangling, invalid)
+                if duplicate:
+                    redundant.append(CatalogIssue(
+                        edge, f"{source} declara '{edge.target}' más de una vez"
+                    ))
+
+        return CatalogReport(
+            components=len(entries),
+            edges=edge_count,
+            duration=time.perf_counter() - started,
+            unsatisfiable=unsatisfiable,
+            dangling=dangling,
+            redundant=redundant,
+            invalid=invalid,
+        )
+
+    def _check_edge(
+        self,
+        edge: DependencyEdge,
+        available: Optional[List[Version]],
+        duplicate: bool,
+        satisfiable: Dict[Tuple[str, str], bool],
+        unsatisfiable: List[CatalogIssue],
+        dangling: List[CatalogIssue],
+        invalid: List[CatalogIssue],
+    ) -> None:
+        if available is None:
+            # El destino inexistente ya se reportó en la primera declaración
+            if not edge.optional and not duplicate:
+                dangling.append(CatalogIssue(
+                    edge, f"{edge.source} depende de '{edge.target}' que no existe en el catálogo"
+                ))
+            return
+
+        if edge.spec is None:
+            return
+        if not isinstance(edge.spec, str):
+            invalid.append(CatalogIssue(
+                edge, f"Especificación de versión inválida: {edge.spec!r}; se esperaba un texto"
+            ))
+            return
+
+        key = (edge.spec, edge.target)
+        if key not in satisfiable:
+            spec = self._spec(edge.spec)
+            if spec is None:
+                invalid.append(CatalogIssue(
+                    edge, f"Especificación de versión inválida: '{edge.spec}'"
+                ))
+                return
+            satisfiable[key] = any(spec.match(v) for v in available)
+
+        if not satisfiable[key]:
+            unsatisfiable.append(CatalogIssue(
+                edge,
+                f"{edge.source} requiere {edge.target} {edge.spec}; "
+                f"disponibles: {', '.join(str(v) for v in available) or 'ninguna'}",
+            ))
+
+    def validate_paths(self, component_paths: Iterable[Path]) -> CatalogReport:
+        """
+        Valida un catálogo leyendo solo los __meta__.py (sin validación pydantic).
+        """
+        return self.validate(parse_meta_file(Path(p) / "__meta__.py") for p in component_paths)
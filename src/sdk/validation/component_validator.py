@@ -1,31 +1,67 @@
 from pathlib import Path
+from typing import Optional
 
 from ..utils.meta_parser import parse_meta_file
 from ..schemas.meta_schema import BaseMetaSchema
+from ..tracing import span
 from .structure_validator import StructureValidator
 from .dependency_validator import DependencyValidator
+from .validation_cache import ValidationCache, component_fingerprint, construct_trusted
 
 
 class ComponentValidator:
 
-    def __init__(self):
-        self.structure_validator = StructureValidator()
+    def __init__(
+        self,
+        cache: Optional[ValidationCache] = None,
+        syntax_cache_path: Optional[Path] = None,
+    ):
+        # Con una ValidationCache, la caché de sintaxis se guarda a su lado por defecto:
+        # un componente modificado solo recompila los .py que cambiaron
+        if syntax_cache_path is None and cache is not None:
+            syntax_cache_path = cache.cache_path.with_name(f"{cache.cache_path.stem}.syntax.json")
+        self.structure_validator = StructureValidator(syntax_cache_path=syntax_cache_path)
         self.dependency_validator = DependencyValidator()
+        self.cache = cache
 
     def validate_component(self, component_path: Path) -> BaseMetaSchema:
 
+        with span("validator.validate", component=component_path.name) as validate_span:
+
+            if self.cache is None:
+                return self._validate(component_path)
+
+            # Componente sin cambios (misma huella y mismas reglas): se omite la validación
+            fingerprint = component_fingerprint(component_path)
+            if fingerprint is not None:
+                cached = self.cache.get(component_path, fingerprint)
+                if cached is not None:
+                    validate_span.set_attribute("cached", True)
+                    return construct_trusted(BaseMetaSchema, cached)  # type: ignore[return-value]
+
+            meta_model = self._validate(component_path)
+            if fingerprint is not None:
+                self.cache.put(component_path, fingerprint, meta_model)
+            return meta_model
+
+    def _validate(self, component_path: Path) -> BaseMetaSchema:
+
         meta_path = component_path / "__meta__.py"
 
-        metadata = parse_meta_file(meta_path)
+        with span("validator.parse"):
+            metadata = parse_meta_file(meta_path)
 
         # validar schema pydantic
-        meta_model = BaseMetaSchema(**metadata)
+        with span("validator.schema"):
+            meta_model = BaseMetaSchema(**metadata)
 
         # validar estructura
-        self.structure_validator.validate_structure(component_path)
+        with span("validator.structure"):
+            self.structure_validator.validate_structure(component_path)
 
         # validar dependencias (solo formato por ahora)
-        self.dependency_validator.validate_dependencies(meta_model)
+        with span("validator.dependencies", count=len(meta_model.depends)):
+            self.dependency_validator.validate_dependencies(meta_model)
 
         return meta_model
 
@@ -1,14 +1,34 @@
 from pathlib import Path
+from typing import Optional
 
 from ..utils.meta_parser import parse_meta_file
-from ..utils.validation_utils import ValidationUtils
-from ..exceptions import ValidationError
+from ..utils.validation_utils import SyntaxCheckCache, ValidationUtils
+from ..exceptions import SourceSyntaxError, ValidationError
 
 
 class StructureValidator:
 
     REQUIRED_FILES = ["__meta__.py"]
 
+    def __init__(
+        self,
+        check_sources: bool = True,
+        syntax_cache: Optional[SyntaxCheckCache] = None,
+        max_workers: Optional[int] = 1,
+        syntax_cache_path: Optional[Path] = None,
+    ):
+        # check_sources: compila todos los .py del componente, no solo __meta__.py
+        # max_workers: 1 compila en el proceso actual; el pool es opcional
+        #   (None = cpu_count) porque este validador se usa en cada instalación
+        #   y dentro de los workers de BulkValidator
+        # syntax_cache_path: persiste los resultados para que las siguientes
+        #   ejecuciones omitan los archivos sin cambios
+        self.check_sources = check_sources
+        if syntax_cache is None and syntax_cache_path is not None:
+            syntax_cache = SyntaxCheckCache(syntax_cache_path)
+        self.syntax_cache = syntax_cache
+        self.max_workers = max_workers
+
     def validate_structure(self, component_path: Path) -> None:
 
         if not component_path.exists():
@@ -39,3 +59,11 @@ class StructureValidator:
             core_models = component_path / "core" / "models.py"
             if not core_models.exists():
                 raise ValidationError("registry_flags.models=True requiere core/models.py")
+
+        # Sintaxis de todos los .py del componente (incremental con syntax_cache)
+        if self.check_sources:
+            issues = ValidationUtils.scan_syntax(
+                component_path, cache=self.syntax_cache, max_workers=self.max_workers
+            )
+            if issues:
+                raise SourceSyntaxError(issues)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import typing
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from ..constants import META_SCHEMA_VERSION
+from ..schemas.meta_schema import BaseMetaSchema
+from ..utils.validation_utils import ValidationUtils
+
+CACHE_FORMAT_VERSION = 1
+
+# Módulos cuyas reglas determinan el resultado de una validación: si cambia su
+# código fuente, todas las entradas de la caché dejan de ser válidas.
+_RULE_MODULES = (
+    "constants",
+    "schemas.meta_schema",
+    "schemas.dependency_schema",
+    "utils.meta_parser",
+    "utils.validation_utils",
+    "validation.component_validator",
+    "validation.structure_validator",
+    "validation.dependency_validator",
+)
+_PACKAGE = __name__.rsplit(".", 2)[0]
+
+
+@lru_cache(maxsize=1)
+def rules_fingerprint() -> str:
+    """
+    Huella de las reglas de validación: versión del schema y código fuente
+    de los módulos que validan. Se calcula una vez por proceso.
+    """
+    import importlib
+
+    digest = hashlib.sha256()
+    digest.update(f"schema={META_SCHEMA_VERSION};format={CACHE_FORMAT_VERSION}".encode())
+    for module_name in _RULE_MODULES:
+        module = importlib.import_module(f"{_PACKAGE}.{module_name}")
+        source = Path(module.__file__ or "")
+        digest.update(module_name.encode())
+        digest.update(source.read_bytes() if source.is_file() else b"")
+    return digest.hexdigest()
+
+
+def component_fingerprint(component_path: Path) -> Optional[str]:
+    """
+    Huella de un componente: reglas + contenido de __meta__.py + estructura relevante
+    (existencia de core/models.py y (ruta, mtime, tamaño) de cada .py, que
+    StructureValidator compila). None si el componente no tiene __meta__.py.
+    """
+    try:
+        meta_bytes = (component_path / "__meta__.py").read_bytes()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(rules_fingerprint().encode())
+    digest.update(component_path.name.encode())
+    digest.update(b"\0")
+    digest.update(meta_bytes)
+    digest.update(b"\0models=")
+    digest.update(b"1" if os.path.exists(component_path / "core" / "models.py") else b"0")
+    sources = sorted(
+        (entry.path, entry.stat()) for entry in ValidationUtils.iter_python_files(component_path)
+    )
+    for path, stat in sources:
+        digest.update(f"\0{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()
+
+
+def construct_trusted(model: Type[BaseModel], data: Dict[str, Any]) -> BaseModel:
+    """
+    Reconstruye un modelo (y sus submodelos) desde un model_dump ya validado,
+    sin volver a ejecutar la validación de pydantic.
+    """
+    values: Dict[str, Any] = {}
+    for name, info in model.model_fields.items():
+        if name not in data:
+            continue
+        value = data[name]
+        annotation = info.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, dict):
+            value = construct_trusted(annotation, value)
+        elif typing.get_origin(annotation) in (list, typing.List) and isinstance(value, list):
+            args = typing.get_args(annotation)
+            item = args[0] if args else None
+            if isinstance(item, type) and issubclass(item, BaseModel):
+                value = [construct_trusted(item, v) if isinstance(v, dict) else v for v in value]
+        values[name] = value
+    return model.model_construct(**values)
+
+
+class ValidationCache:
+    """
+    Caché persistente en JSON de componentes validados correctamente.
+    Las escrituras se acumulan en memoria; save() (o salir del bloque with)
+    las persiste en una sola escritura atómica.
+    """
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        # Reglas distintas: ninguna entrada sirve, se descartan todas
+        if data.get("rules") != rules_fingerprint():
+            self._dirty = True
+            return
+        self._entries = data.get("entries", {})
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"rules": rules_fingerprint(), "entries": self._entries}),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self.cache_path)
+        self._dirty = False
+
+    @staticmethod
+    def _key(component_path: Path) -> str:
+        return os.path.abspath(component_path)
+
+    def get(self, component_path: Path, fingerprint: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(self._key(component_path))
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return None
+        return entry["meta"]
+
+    def put(
+        self,
+        component_path: Path,
+        fingerprint: str,
+        meta: Union[BaseMetaSchema, Dict[str, Any]],
+    ) -> None:
+        if isinstance(meta, BaseMetaSchema):
+            meta = meta.model_dump(mode="json")
+        self._entries[self._key(component_path)] = {
+            "fingerprint": fingerprint,
+            "meta": meta,
+        }
+        self._dirty = True
+
+    def invalidate(self, component_path: Path) -> None:
+        if self._entries.pop(self._key(component_path), None) is not None:
+            self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self) -> "ValidationCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.save()
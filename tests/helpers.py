@@ -0,0 +1,89 @@
+"""
+Utilidades compartidas por los tests: manifests en disco, catálogos y un
+backend de almacenamiento sobre el filesystem.
+"""
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Iterable, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.contracts import StorageBackend  # noqa: E402
+from sdk.registry import ComponentRegistry  # noqa: E402
+
+
+def write_meta(component_dir: Path, *, name: str, depends: list | None = None, **fields: Any) -> None:
+    """
+    Escribe un __meta__.py mínimo y válido. Cada campo extra sustituye al valor
+    por defecto (python, erp_version, version) o se añade al final.
+    """
+    depends = depends or []
+    defaults = {"python": ">=3.11", "erp_version": ">=0.1.0", "version": "0.1.0"}
+    overrides = {key: fields.pop(key) for key in list(fields) if key in defaults}
+    values = {key: overrides.get(key, value) for key, value in defaults.items()}
+
+    def literal(value: Any) -> str:
+        return f'"{value}"' if isinstance(value, str) else repr(value)
+
+    content = (
+        f'technical_name = "{name}"\n'
+        f'display_name = "{name.replace("_", " ").title()}"\n'
+        'component_type = "module"\n'
+        'package_type = "extension"\n'
+        f'python = {literal(values["python"])}\n'
+        f'erp_version = {literal(values["erp_version"])}\n'
+        f'version = {literal(values["version"])}\n'
+        f"depends = {depends}\n"
+    )
+    content += "".join(f"{key} = {value!r}\n" for key, value in fields.items())
+    (component_dir / "__meta__.py").write_text(content, encoding="utf-8")
+
+
+def make_catalog(base: Path, components: Iterable[tuple]) -> List[Path]:
+    """
+    Crea un componente por cada tupla (name, depends) o (name, depends, fields)
+    bajo base y devuelve sus rutas en el mismo orden.
+    """
+    paths = []
+    for name, depends, *fields in components:
+        comp = base / name
+        comp.mkdir(parents=True)
+        write_meta(comp, name=name, depends=list(depends), **(fields[0] if fields else {}))
+        paths.append(comp)
+    return paths
+
+
+class FilesystemStorage(StorageBackend):
+    def __init__(self, base_path: Path):
+        self.base_path = base_path
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.registry = ComponentRegistry(self.base_path / "registry.json")
+
+    def copy_files(self, source: Path, destination: Path) -> None:
+        if destination.exists():
+            shutil.rmtree(destination)
+        shutil.copytree(source, destination)
+
+    def remove_files(self, path: Path) -> None:
+        if path.exists():
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+
+    def register_component(self, path: Path, manifest: dict) -> None:
+        self.registry.register(manifest["technical_name"], {"path": str(path)})
+
+    def unregister_component(self, name: str) -> None:
+        self.registry.unregister(name)
+
+    def resolve_dependency(self, name: str, version_spec: str):
+        return None
+
+    def get_default_install_path(self, component_name: str) -> Path:
+        return self.base_path / component_name
+
+    def batch(self):
+        return self.registry.batch()
@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from benchmarks.catalog import CatalogSpec, dependency_edges, generate_catalog, synthetic_manifests  # noqa: E402
+from benchmarks.runner import BENCHMARKS, compare_results, run_suite  # noqa: E402
+from sdk.dependency.install_plan import build_install_plan  # noqa: E402
+from sdk.validation.catalog_validator import CatalogValidator  # noqa: E402
+
+
+def test_synthetic_catalog_is_a_valid_dag(tmp_path: Path) -> None:
+    spec = CatalogSpec(components=30, depth=4, fan_out=2, files=1, file_size=256)
+
+    edges = dependency_edges(spec)
+    paths = generate_catalog(tmp_path, spec)
+    plan = build_install_plan(paths)
+
+    assert all(dep < i for i, deps in enumerate(edges) for dep in deps)
+    assert max(len(deps) for deps in edges) == 2
+    assert plan.total == 30
+    assert CatalogValidator().validate(synthetic_manifests(spec)).ok
+    assert dependency_edges(spec) == edges
+
+
+def test_suite_smoke_and_regression_detection(tmp_path: Path) -> None:
+    results = run_suite(scales=[5], repeat=1, workdir=tmp_path)
+
+    assert set(results["results"]) == {f"{name}@5" for name in BENCHMARKS}
+    assert all(r["median"] > 0 and r["peak_bytes"] > 0 for r in results["results"].values())
+    assert compare_results(results, results) == []
+
+    slower = {**results, "results": {
+        key: {**r, "median": r["median"] * 2} for key, r in results["results"].items()
+    }}
+    regressions = compare_results(results, slower)
+    assert {r.key for r in regressions} == set(results["results"])
+
+
+def test_extra_scales_only_apply_to_their_benchmarks(tmp_path: Path) -> None:
+    results = run_suite(
+        scales=[3], repeat=1, workdir=tmp_path,
+        only=["build_install_plan_lean", "parse_meta_file"],
+        extra_scales={"build_install_plan_lean": [6]},
+    )
+
+    assert set(results["results"]) == {
+        "build_install_plan_lean@3", "parse_meta_file@3", "build_install_plan_lean@6",
+    }
+    assert results["results"]["build_install_plan_lean@6"]["peak_bytes"] > 0
+    assert set(results["catalogs"]) == {"3", "6"}
@@ -0,0 +1,147 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk import binary_snapshot  # noqa: E402
+from sdk.binary_snapshot import (  # noqa: E402
+    MANIFEST_COLUMNS,
+    MANIFEST_FIELDS,
+    dump_manifests,
+    dump_payload,
+    load_manifests,
+    load_payload,
+)
+from sdk.exceptions import SnapshotError  # noqa: E402
+from sdk.registry import ComponentRegistry  # noqa: E402
+from sdk.schemas.meta_schema import BaseMetaSchema  # noqa: E402
+from sdk.utils.meta_parser import parse_meta_file  # noqa: E402
+from tests.helpers import make_catalog  # noqa: E402
+
+
+def _model(name: str, **extra) -> BaseMetaSchema:
+    data = {
+        "technical_name": name,
+        "display_name": name.title(),
+        "component_type": "module",
+        "package_type": "extension",
+        "version": "1.2.0",
+        "domain": "sales",
+        "depends": ["core_base"],
+    }
+    data.update(extra)
+    return BaseMetaSchema(**data)
+
+
+MODELS = [
+    _model("core_sales"),
+    _model(
+        "sales_ui",
+        license="LGPL-3.0",
+        keywords=["ventas", "pedidos"],
+        description="Interfaz de ventas con pedidos y presupuestos",
+        authors=[
+            {"name": "Ana Pérez", "role": "author", "email": "ana@example.com"},
+            {"name": "Equipo ERP"},
+        ],
+        geo_restrictions={"include": ["ES", "MX"], "exclude": ["MX"]},
+        external_dependencies={"python": ["requests>=2"], "bin": ["wkhtmltopdf"]},
+        auto_install=["core_sales"],
+        lifecycle={"post_install": "hooks.post_install"},
+        load_priority=90,
+        registry_flags={"models": True, "api": True},
+        installable=False,
+    ),
+]
+
+
+def test_layout_covers_every_manifest_field() -> None:
+    assert MANIFEST_FIELDS == tuple(BaseMetaSchema.model_fields)
+    for parent in ("geo_restrictions", "external_dependencies", "lifecycle", "registry_flags"):
+        annotation = BaseMetaSchema.model_fields[parent].annotation
+        covered = {path.split(".", 1)[1] for path, _ in MANIFEST_COLUMNS if path.startswith(f"{parent}.")}
+        assert covered == set(annotation.model_fields)
+
+    # Los valores por defecto de las columnas coinciden con los del schema
+    for name in ("python", "erp_version", "license", "installable", "auto_install", "load_priority"):
+        assert binary_snapshot._DEFAULTS[name] == BaseMetaSchema.model_fields[name].default
+
+
+def test_manifests_round_trip_without_validation() -> None:
+    records = load_manifests(dump_manifests(MODELS))
+
+    assert [r.to_dict() for r in records] == [m.model_dump(mode="json") for m in MODELS]
+    assert records[1].authors[0]["name"] == "Ana Pérez"
+    assert records[1].auto_install == ["core_sales"] and records[0].auto_install is False
+    assert [r.to_model() for r in records] == MODELS
+    # Strings repetidos internados: un único objeto compartido
+    assert records[0].domain is records[1].domain
+    assert records[0].depends[0] is records[1].depends[0]
+
+    # También acepta los dicts de model_dump o de parse_meta_file
+    dumps = [m.model_dump(mode="json") for m in MODELS]
+    assert load_manifests(dump_manifests(dumps)) == records
+    assert load_manifests(dump_manifests([])) == []
+
+
+def test_payload_round_trip_for_registry(tmp_path: Path) -> None:
+    registry = ComponentRegistry(tmp_path / "registry.json")
+    for model in MODELS:
+        registry.register(model.technical_name, {**model.model_dump(mode="json"), "size": -3, "ratio": 0.5})
+    payload = {p["technical_name"]: p for p in registry.list()}
+
+    assert load_payload(dump_payload(payload)) == payload
+    assert load_payload(dump_payload([None, True, "ñ", {"": []}])) == [None, True, "ñ", {"": []}]
+    with pytest.raises(SnapshotError):
+        dump_payload({1: "clave no str"})
+
+    extremes = [2 ** 63 - 1, -(2 ** 63)]
+    assert load_payload(dump_payload(extremes)) == extremes
+    for overflow in (2 ** 63, -(2 ** 63) - 1):
+        with pytest.raises(SnapshotError, match="64 bits"):
+            dump_payload({"size": [overflow]})
+
+
+def test_invalid_snapshots_raise_snapshot_error(monkeypatch) -> None:
+    data = dump_manifests(MODELS)
+
+    for broken in (b"", b"XXXX" + data[4:], data[:-7], data[:4] + b"\x09\x00" + data[6:]):
+        with pytest.raises(SnapshotError):
+            load_manifests(broken)
+    with pytest.raises(SnapshotError, match="Tipo de snapshot"):
+        load_payload(data)
+
+    monkeypatch.setattr(binary_snapshot, "META_SCHEMA_VERSION", "99.0")
+    with pytest.raises(SnapshotError, match="otra versión del schema"):
+        load_manifests(data)
+
+
+def test_loading_does_no_parsing_or_validation(tmp_path: Path, monkeypatch) -> None:
+    # La velocidad se sigue en el benchmark snapshot_load; aquí se comprueba el trabajo
+    import ast
+    import json
+
+    import sdk.utils.meta_parser as meta_parser
+
+    paths = make_catalog(tmp_path, [
+        (f"component_{i}", [f"component_{i - 1}"] if i else []) for i in range(50)
+    ])
+    models = [BaseMetaSchema(**parse_meta_file(p / "__meta__.py")) for p in paths]
+    data = dump_manifests(models)
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("load_manifests no debe parsear ni validar")
+
+    monkeypatch.setattr(BaseMetaSchema, "__init__", forbidden)
+    monkeypatch.setattr(BaseMetaSchema, "model_validate", forbidden)
+    monkeypatch.setattr(meta_parser, "parse_meta_file", forbidden)
+    monkeypatch.setattr(ast, "parse", forbidden)
+    monkeypatch.setattr(json, "loads", forbidden)
+
+    records = load_manifests(data)
+
+    assert [r.technical_name for r in records] == [m.technical_name for m in models]
+    assert records[-1].depends == ["component_48"]
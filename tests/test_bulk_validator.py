@@ -0,0 +1,68 @@
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.validation.bulk_validator import BulkValidator  # noqa: E402
+from tests.helpers import make_catalog, write_meta  # noqa: E402
+
+
+def _catalog(base: Path) -> list:
+    paths = make_catalog(base, [(f"comp_{i}", []) for i in range(4)])
+
+    broken_syntax = base / "broken_syntax"
+    broken_syntax.mkdir()
+    (broken_syntax / "__meta__.py").write_text("technical_name = (\n", encoding="utf-8")
+
+    bad_schema = base / "bad_schema"
+    bad_schema.mkdir()
+    (bad_schema / "__meta__.py").write_text(
+        'technical_name = "bad_schema"\nversion = "uno"\n', encoding="utf-8"
+    )
+
+    wrong_dir = base / "wrong_dir"
+    wrong_dir.mkdir()
+    write_meta(wrong_dir, name="other_name")
+
+    return paths + [broken_syntax, bad_schema, wrong_dir, base / "missing"]
+
+
+def test_bulk_validation_keeps_going_and_categorizes(tmp_path: Path) -> None:
+    report = BulkValidator(max_workers=1).validate_many(_catalog(tmp_path))
+
+    assert report.total == 8
+    assert report.valid == 4
+    assert not report.ok
+    categories = {Path(r.path).name: {e.category for e in r.errors} for r in report.failures()}
+    assert categories == {
+        "broken_syntax": {"parse"},
+        "bad_schema": {"schema"},
+        "wrong_dir": {"structure"},
+        "missing": {"not_found"},
+    }
+    bad_schema = next(r for r in report.results if r.name == "bad_schema")
+    assert "version" in {e.location for e in bad_schema.errors}
+
+
+def test_bulk_validation_in_process_pool_matches_serial(tmp_path: Path) -> None:
+    paths = _catalog(tmp_path)
+
+    serial = BulkValidator(max_workers=1).validate_many(paths)
+    parallel = BulkValidator(max_workers=2, min_parallel=1).validate_many(paths)
+
+    assert parallel.workers == 2
+    assert [(r.path, r.valid) for r in parallel.results] == [
+        (r.path, r.valid) for r in serial.results
+    ]
+    data = json.loads(parallel.to_json())
+    assert data["invalid"] == 4
+    assert data["by_category"]["schema"] >= 1
+
+
+def test_pool_workers_scan_sources_without_nested_pool(monkeypatch) -> None:
+    from sdk.validation import bulk_validator
+
+    monkeypatch.setattr(bulk_validator, "_worker_validator", None)
+    assert bulk_validator._validator().structure_validator.max_workers == 1
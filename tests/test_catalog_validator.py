@@ -0,0 +1,107 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.schemas.meta_schema import BaseMetaSchema  # noqa: E402
+from sdk.validation.catalog_validator import CatalogValidator  # noqa: E402
+from tests.helpers import write_meta  # noqa: E402
+
+
+def _manifest(name: str, version: str = "1.0.0", depends: list | None = None) -> dict:
+    return {"technical_name": name, "version": version, "depends": depends or []}
+
+
+def test_catalog_report_classifies_edges() -> None:
+    catalog = [
+        _manifest("base", "1.0.0"),
+        _manifest("base", "1.4.0"),
+        _manifest("sales", depends=[
+            "base",
+            {"name": "base", "version": ">=1.2.0"},
+            {"name": "inventory", "version": ">=2.0.0"},
+            {"name": "ghost"},
+            {"name": "extras", "optional": True},
+        ]),
+        _manifest("inventory", "1.5.0", depends=[
+            {"name": "base", "version": ">=2.0.0"},
+            {"name": "base", "version": "not-a-spec"},
+        ]),
+        _manifest("pos", depends=[{"name": "base", "version": "???"}, 42]),
+    ]
+
+    report = CatalogValidator().validate(catalog)
+
+    assert report.components == 5
+    assert [(i.edge.source, i.edge.target) for i in report.unsatisfiable] == [
+        ("sales", "inventory"), ("inventory", "base"),
+    ]
+    assert [i.edge.target for i in report.dangling] == ["ghost"]
+    assert [(i.edge.source, i.edge.target) for i in report.redundant] == [
+        ("sales", "base"), ("inventory", "base"),
+    ]
+    # "not-a-spec" es redundante y además inválida
+    assert len(report.invalid) == 3
+    assert not report.ok
+
+
+def test_duplicate_declaration_spec_is_still_checked() -> None:
+    report = CatalogValidator().validate([
+        _manifest("base", "1.0.0"),
+        _manifest("sales", depends=["base", {"name": "base", "version": ">=3.0.0"}]),
+    ])
+
+    assert [i.edge.spec for i in report.redundant] == [">=3.0.0"]
+    assert [i.edge.spec for i in report.unsatisfiable] == [">=3.0.0"]
+    assert not report.ok
+
+
+def test_non_text_versions_and_specs_are_invalid_not_fatal() -> None:
+    report = CatalogValidator().validate([
+        {"technical_name": "base", "version": 1, "depends": []},
+        _manifest("sales", depends=[
+            {"name": "base", "version": [">=1.0.0"]},
+            {"name": "base", "version": 0},
+        ]),
+        {"technical_name": "pos", "version": "1.0.0", "depends": "base"},
+    ])
+
+    assert [i.edge.source for i in report.invalid] == ["sales", "sales", "pos"]
+    assert "se esperaba un texto" in report.invalid[0].message
+    assert "depends debe ser una lista" in report.invalid[2].message
+    assert not report.ok
+
+def test_catalog_accepts_schemas_and_paths(tmp_path: Path) -> None:
+    for name, depends in (("core_auth", []), ("core_users", ["core_auth"])):
+        (tmp_path / name).mkdir()
+        write_meta(tmp_path / name, name=name, depends=depends)
+    paths = [tmp_path / "core_auth", tmp_path / "core_users"]
+
+    from_paths = CatalogValidator().validate_paths(paths)
+    schemas = [
+        BaseMetaSchema(technical_name="core_users", display_name="Users", component_type="module",
+                       package_type="core", version="1.0.0", depends=["core_missing"]),
+    ]
+    from_schemas = CatalogValidator().validate(schemas)
+
+    assert from_paths.ok and from_paths.edges == 1
+    assert [i.edge.target for i in from_schemas.dangling] == ["core_missing"]
+
+
+def test_catalog_of_5k_components_is_linear() -> None:
+    catalog = [
+        _manifest(f"comp_{i}", f"1.{i % 7}.0", depends=[
+            {"name": f"comp_{j}", "version": ">=1.0.0,<2.0.0"} for j in range(max(0, i - 3), i)
+        ])
+        for i in range(5000)
+    ]
+
+    validator = CatalogValidator()
+    report = validator.validate(catalog)
+
+    assert report.ok
+    assert report.edges == 3 * 5000 - 6
+    # Cada versión y cada spec distintos se parsean una sola vez
+    assert len(validator._versions) == 7
+    assert len(validator._specs) == 1
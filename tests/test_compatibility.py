@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.compatibility import CompatibilityChecker, RuntimeProfile, spec_matches  # noqa: E402
+from sdk.dependency.install_plan import build_install_plan  # noqa: E402
+from sdk.exceptions import IncompatibleComponentError  # noqa: E402
+from sdk.installer import TransactionalInstaller  # noqa: E402
+from tests.helpers import FilesystemStorage, make_catalog, write_meta  # noqa: E402
+
+PY311 = RuntimeProfile(python="3.11", erp_version="1.0.0")
+PY313 = RuntimeProfile(python="3.13.1", erp_version="2.1.0")
+
+
+def test_checker_caches_report_per_profile() -> None:
+    checker = CompatibilityChecker([
+        {"technical_name": "legacy", "python": ">=3.11,<3.13", "erp_version": "<2.0.0"},
+        {"technical_name": "modern", "python": ">=3.12", "erp_version": ">=2.0.0"},
+        {"technical_name": "defaults"},
+        {"technical_name": "broken", "python": "tres"},
+    ])
+
+    old = checker.evaluate(PY311)
+    new = checker.evaluate(PY313)
+
+    assert old.compatible == ["legacy", "defaults"]
+    assert set(old.incompatible) == {"modern", "broken"}
+    assert [i.field for i in old.issues["modern"]] == ["python", "erp_version"]
+    assert new.compatible == ["modern", "defaults"]
+    # Mismo perfil (otro tenant): mismo reporte, sin reevaluar
+    assert checker.evaluate(RuntimeProfile("3.11", "1.0.0")) is old
+    assert spec_matches("tres", "3.11") is None
+
+    checker.remove("broken")
+    assert checker.evaluate(PY311) is not old and checker.evaluate(PY311).incompatible == ["modern"]
+
+
+def _catalog(base: Path) -> list:
+    return make_catalog(base, [
+        ("core_base", []),
+        ("fast_cache", ["core_base"], {"python": ">=3.13"}),
+        ("cache_ui", ["fast_cache"]),
+        ("reports", ["core_base"]),
+    ])
+
+
+def test_plan_prunes_or_rejects_before_copying(tmp_path: Path) -> None:
+    paths = _catalog(tmp_path / "src")
+
+    assert build_install_plan(paths, runtime=PY313).total == 4
+    plan = build_install_plan(paths, runtime=PY311, on_incompatible="prune")
+    assert plan.install_order[0] == "core_base" and set(plan.install_order) == {"core_base", "reports"}
+    assert set(plan.excluded) == {"fast_cache", "cache_ui"}
+    assert "3.13" in plan.excluded["fast_cache"]
+
+    storage = FilesystemStorage(tmp_path / "installed")
+    with pytest.raises(IncompatibleComponentError) as excinfo:
+        TransactionalInstaller(storage).install_many(paths, runtime=PY311)
+    assert [i.component for i in excinfo.value.issues] == ["fast_cache"]
+    assert not (storage.base_path / "core_base").exists()
+
+
+def test_non_text_specs_are_reported_as_issues(tmp_path: Path) -> None:
+    comp = tmp_path / "list_spec"
+    comp.mkdir()
+    write_meta(comp, name="list_spec", python=[">=3.11"])
+
+    with pytest.raises(IncompatibleComponentError) as excinfo:
+        build_install_plan([comp], runtime=PY311)
+    issue = excinfo.value.issues[0]
+    assert (issue.component, issue.field) == ("list_spec", "python")
+    assert "se esperaba un texto" in issue.message
+
+    report = CompatibilityChecker([{"technical_name": "odd", "erp_version": 2}]).evaluate(PY311)
+    assert [i.field for i in report.issues["odd"]] == ["erp_version"]
@@ -0,0 +1,156 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.dependency import external_requirements  # noqa: E402
+from sdk.dependency.external_requirements import (  # noqa: E402
+    ExternalRequirementsResolver,
+    aggregate_external_requirements,
+    parse_requirement,
+    version_key,
+)
+from sdk.dependency.install_plan import build_install_plan  # noqa: E402
+from tests.helpers import write_meta  # noqa: E402
+
+
+def _manifest(python=(), binaries=()):
+    return {"external_dependencies": {"python": list(python), "bin": list(binaries)}}
+
+
+def test_parse_requirement_normalizes_name_extras_and_marker() -> None:
+    requirement = parse_requirement("Django_REST.Framework[B, a]>=3.14,<4;python_version<'3.12'", "api")
+    assert requirement.name == "django-rest-framework"
+    assert requirement.extras == ("a", "b")
+    assert requirement.clauses == ((">=", "3.14"), ("<", "4"))
+    assert requirement.marker == 'python_version < "3.12"'
+    assert requirement.component == "api"
+
+    with pytest.raises(ValueError):
+        parse_requirement("requests >> 2")
+    with pytest.raises(ValueError):
+        parse_requirement("requests>=2.*")
+
+
+def test_version_key_orders_pre_post_and_dev_releases() -> None:
+    ordered = ["1.0.dev1", "1.0a1", "1.0rc1", "1.0", "1.0.post1", "1.1"]
+    assert sorted(ordered, key=version_key) == ordered
+    assert version_key("1.0") == version_key("1.0.0")
+
+
+def test_constraints_are_intersected_per_distribution() -> None:
+    report = aggregate_external_requirements([
+        ("a", _manifest(["Requests>=2.20", "numpy~=1.24", "lxml==4.9.*", "pytz"], ["wkhtmltopdf"])),
+        ("b", _manifest(["requests[socks]<3,!=2.29.0", "numpy>=1.25"], ["WKHTMLTOPDF", "ffmpeg"])),
+        ("c", _manifest(["pytz"])),
+    ])
+
+    assert report.ok
+    assert [str(r) for r in report.requirements] == [
+        "lxml>=4.9,<4.10",
+        "numpy>=1.25,<2",
+        "pytz",
+        "requests[socks]>=2.20,<3,!=2.29.0",
+    ]
+    assert report.requirements[2].components == ("a", "c")
+    assert "numpy>=1.25,<2  # a, b\n" in report.requirements_txt()
+    assert report.binary_checklist() == ["[ ] ffmpeg (b)", "[ ] wkhtmltopdf (a, b)"]
+
+
+def test_conflicts_and_invalid_entries_are_reported() -> None:
+    report = aggregate_external_requirements([
+        ("a", _manifest(["numpy<1.25", "pillow==9.5", "lxml==5.0", "bad spec!!"])),
+        ("b", _manifest(["numpy>=1.25", "pillow==10.0", "lxml!=5.0"])),
+        ("c", _manifest(["django==4.2 ; python_version<'3.12'", "django==5.0; python_version>='3.12'"])),
+    ])
+
+    assert not report.ok
+    assert {c.name: c.message for c in report.conflicts} == {
+        "lxml": "==5.0 excluida con !=",
+        "numpy": "rango vacío: >=1.25 y <1.25",
+        "pillow": "versiones fijadas incompatibles: 10.0, 9.5",
+    }
+    assert [(component, raw) for component, raw, _ in report.invalid] == [("a", "bad spec!!")]
+    # Marcadores distintos no compiten entre sí
+    assert [str(r) for r in report.requirements if r.name == "django"] == [
+        'django==4.2 ; python_version < "3.12"',
+        'django==5.0 ; python_version >= "3.12"',
+    ]
+
+
+def test_unmarked_constraints_apply_to_marked_groups() -> None:
+    report = aggregate_external_requirements([
+        ("web", _manifest(["django>=4.2"])),
+        ("legacy", _manifest(["django<4 ; python_version<'3.12'"])),
+        ("api", _manifest(["requests>=2.28", "requests<3; sys_platform == 'win32'"])),
+    ])
+
+    assert [str(r) for r in report.requirements] == [
+        "django>=4.2",
+        'django>=4.2,<4 ; python_version < "3.12"',
+        "requests>=2.28",
+        'requests>=2.28,<3 ; sys_platform == "win32"',
+    ]
+    assert report.requirements[1].components == ("web", "legacy")
+    assert [(c.name, c.marker) for c in report.conflicts] == [("django", 'python_version < "3.12"')]
+
+
+def test_unmarked_conflict_is_reported_once_across_marked_groups() -> None:
+    report = aggregate_external_requirements([
+        ("a", _manifest(["numpy>=2.0", "numpy<1.25; python_version<'3.12'"])),
+        ("b", _manifest(["numpy<1.25", "numpy>=1.20; sys_platform=='win32'"])),
+    ])
+
+    assert [(c.name, c.marker, c.message) for c in report.conflicts] == [
+        ("numpy", None, "rango vacío: >=2.0 y <1.25"),
+    ]
+    assert len([r for r in report.requirements if r.name == "numpy"]) == 3
+
+def test_exclusion_of_the_only_admitted_version_is_a_conflict() -> None:
+    report = aggregate_external_requirements([
+        ("a", _manifest(["x>=1.0", "y>=1.0,<=1.0"])),
+        ("b", _manifest(["x<=1.0", "x!=1.0", "y!=1.1"])),
+    ])
+
+    assert {c.name: c.message for c in report.conflicts} == {
+        "x": "rango vacío: solo admite 1.0, excluida con !=",
+    }
+
+
+def _component(root: Path, name: str, depends=(), python=()) -> Path:
+    path = root / name
+    path.mkdir()
+    write_meta(path, name=name, depends=list(depends),
+               external_dependencies={"python": list(python), "bin": ["git"]})
+    return path
+
+
+def test_resolver_caches_by_plan_fingerprint(tmp_path: Path, monkeypatch) -> None:
+    paths = [
+        _component(tmp_path, "base", python=["requests>=2"]),
+        _component(tmp_path, "sales", ["base"], python=["requests<3"]),
+    ]
+    resolver = ExternalRequirementsResolver()
+    parses = []
+    original = external_requirements.parse_meta_file
+    monkeypatch.setattr(
+        external_requirements, "parse_meta_file", lambda p: parses.append(p) or original(p)
+    )
+
+    report = resolver.resolve(build_install_plan(paths, lean=True))
+    assert [str(r) for r in report.requirements] == ["requests>=2,<3"]
+    assert report.binaries[0].components == ("base", "sales")
+    assert len(parses) == 2
+
+    # Mismo plan reconstruido: se sirve desde la caché sin volver a parsear
+    assert resolver.resolve(build_install_plan(paths)) is report
+    assert len(parses) == 2
+
+    # Cambiar un manifest cambia la huella del plan
+    write_meta(paths[1], name="sales", depends=["base"])
+    fresh = resolver.resolve(build_install_plan(paths))
+    assert fresh.fingerprint != report.fingerprint
+    assert [str(r) for r in fresh.requirements] == ["requests>=2"]
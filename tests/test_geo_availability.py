@@ -0,0 +1,81 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.dependency.install_plan import build_install_plan  # noqa: E402
+from sdk.exceptions import UnavailableComponentError, ValidationError  # noqa: E402
+from sdk.geo_availability import GeoAvailabilityIndex, is_available  # noqa: E402
+from tests.helpers import make_catalog, write_meta  # noqa: E402
+
+CATALOG = {
+    "global_mod": {"include": ["*"], "exclude": []},
+    "no_cuba": {"include": ["*"], "exclude": ["cu"]},
+    "es_only": {"include": ["ES"], "exclude": []},
+    "latam": {"include": ["MX", "AR", "ES"], "exclude": ["ES"]},
+    "withdrawn": {"include": ["*"], "exclude": ["*"]},
+    "defaults": None,
+}
+
+
+def test_rules_and_index_agree() -> None:
+    index = GeoAvailabilityIndex(CATALOG)
+
+    assert index.available("es") == {"global_mod", "no_cuba", "es_only", "defaults"}
+    assert index.available("CU") == {"global_mod", "defaults"}
+    assert index.available("MX") == {"global_mod", "no_cuba", "latam", "defaults"}
+    # País sin reglas explícitas: solo los comodines
+    assert index.available("JP") == {"global_mod", "no_cuba", "defaults"}
+    assert index.countries() == ["AR", "CU", "ES", "MX"]
+    for country in ("ES", "CU", "MX", "JP", "AR"):
+        for name, rules in CATALOG.items():
+            assert index.is_available(name, country) == is_available(rules, country)
+
+    assert index.filter(["latam", "es_only", "unknown"], "MX") == ["latam", "unknown"]
+    index.remove("global_mod")
+    index.add("es_only", {"include": ["*"]})
+    assert "global_mod" not in index.available("JP") and "es_only" in index.available("JP")
+
+
+def _catalog(base: Path) -> list:
+    return make_catalog(base, [
+        ("core_base", []),
+        ("mx_billing", ["core_base"], {"geo_restrictions": {"include": ["MX"], "exclude": []}}),
+        ("mx_reports", ["mx_billing"]),
+    ])
+
+
+def test_plan_filtering_and_up_front_rejection(tmp_path: Path) -> None:
+    paths = _catalog(tmp_path)
+    index = GeoAvailabilityIndex({"mx_billing": {"include": ["MX"]}})
+
+    plan = build_install_plan(paths, lean=True)
+    assert index.filter_plan(plan, "MX").install_order == plan.install_order
+    filtered = index.filter_plan(plan, "ES")
+    assert filtered.install_order == ["core_base"] and filtered.total == 1
+    assert set(filtered.paths_by_name) == {"core_base"}
+    assert set(filtered.excluded) == {"mx_billing", "mx_reports"}
+
+    assert build_install_plan(paths, country="mx").total == 3
+    with pytest.raises(UnavailableComponentError) as excinfo:
+        build_install_plan(paths, country="ES")
+    assert excinfo.value.components == ["mx_billing"]
+
+
+@pytest.mark.parametrize("restrictions", [
+    "ES",
+    {"include": ["MX"], "exclude": None},
+    {"include": "ES"},
+])
+def test_malformed_restrictions_are_rejected(tmp_path: Path, restrictions) -> None:
+    with pytest.raises(ValidationError, match="geo_restrictions"):
+        is_available(restrictions, "ES")
+
+    component = tmp_path / "bad_geo"
+    component.mkdir()
+    write_meta(component, name="bad_geo", geo_restrictions=restrictions)
+    with pytest.raises(ValidationError, match="bad_geo"):
+        build_install_plan([component], country="ES")
@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+import sdk  # noqa: E402
+
+HEAVY = ("pydantic", "semantic_version", "sdk.installer", "sdk.registry", "sdk.schemas.meta_schema")
+
+# El tiempo de importación se mide en el benchmark import_sdk, no aquí
+PROBE = """
+import json, sys
+{statement}
+print(json.dumps({{"modules": sorted(sys.modules)}}))
+"""
+
+
+def _loaded_modules(statement: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)],
+        cwd=ROOT / "src",
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def test_lightweight_entry_points_stay_light() -> None:
+    for statement in (
+        "import sdk",
+        "from sdk import parse_meta_file",
+        "from sdk.utils.meta_parser import parse_meta_file",
+        "from sdk.meta_codegen.meta_writer import MetaWriter",
+    ):
+        result = _loaded_modules(statement)
+        loaded = [m for m in HEAVY if m in result["modules"]]
+        assert loaded == [], f"{statement!r} importa {loaded}"
+
+
+def test_public_api_resolves_on_first_access() -> None:
+    assert set(sdk.__all__) <= set(dir(sdk))
+    for name in sdk.__all__:
+        assert getattr(sdk, name) is not None
+    assert sdk.BaseMetaSchema is sdk.schemas.BaseMetaSchema
+    try:
+        sdk.does_not_exist
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("se esperaba AttributeError")
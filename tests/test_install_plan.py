@@ -0,0 +1,47 @@
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from benchmarks.catalog import CatalogSpec, generate_catalog  # noqa: E402
+from sdk.dependency.install_plan import build_install_plan  # noqa: E402
+from sdk.dependency.plan_estimate import estimate_install_plan  # noqa: E402
+from sdk.dependency.plan_record import PlanRecord  # noqa: E402
+from sdk.schemas.meta_schema import BaseMetaSchema  # noqa: E402
+
+
+def _retained(paths: list, lean: bool) -> int:
+    tracemalloc.start()
+    try:
+        plan = build_install_plan(paths, lean=lean)
+        retained, _ = tracemalloc.get_traced_memory()
+        del plan
+    finally:
+        tracemalloc.stop()
+    return retained
+
+
+def test_lean_plan_matches_full_plan(tmp_path: Path) -> None:
+    paths = generate_catalog(tmp_path, CatalogSpec(components=40, depth=5, files=1, file_size=128))
+
+    full = build_install_plan(paths)
+    lean = build_install_plan(paths, lean=True)
+
+    assert lean.install_order == full.install_order
+    assert lean.paths_by_name == full.paths_by_name
+    assert lean.lean and not full.lean
+    record = lean.components["bench_00039"]
+    assert isinstance(record, PlanRecord) and not hasattr(record, "__dict__")
+    assert list(record.depends) == full.components["bench_00039"].depends
+    assert isinstance(lean.meta("bench_00039"), BaseMetaSchema)
+    assert lean.meta("bench_00039") == full.meta("bench_00039")
+    assert estimate_install_plan(lean).waves == estimate_install_plan(full).waves
+
+
+def test_lean_plan_retains_less_memory(tmp_path: Path) -> None:
+    paths = generate_catalog(tmp_path, CatalogSpec(components=300, files=0))
+    build_install_plan(paths[:5])  # calentamiento: schemas pydantic y cachés de módulos
+
+    assert _retained(paths, lean=True) * 3 < _retained(paths, lean=False)
@@ -1,4 +1,3 @@
-import shutil
 import sys
 from pathlib import Path
 
@@ -9,54 +8,8 @@ sys.path.append(str(ROOT / "src"))
 
 from sdk.installer import TransactionalInstaller  # noqa: E402
 from sdk.registry import ComponentRegistry  # noqa: E402
-from sdk.contracts import StorageBackend  # noqa: E402
 from sdk.exceptions import InstallationError  # noqa: E402
-
-
-def _write_meta(component_dir: Path, *, name: str, depends: list | None = None) -> None:
-    depends = depends or []
-    content = (
-        f'technical_name = "{name}"\n'
-        f'display_name = "{name.replace("_", " ").title()}"\n'
-        'component_type = "module"\n'
-        'package_type = "extension"\n'
-        'python = ">=3.11"\n'
-        'erp_version = ">=0.1.0"\n'
-        'version = "0.1.0"\n'
-        f"depends = {depends}\n"
-    )
-    (component_dir / "__meta__.py").write_text(content, encoding="utf-8")
-
-
-class FilesystemStorage(StorageBackend):
-    def __init__(self, base_path: Path):
-        self.base_path = base_path
-        self.base_path.mkdir(parents=True, exist_ok=True)
-        self.registry = ComponentRegistry(self.base_path / "registry.json")
-
-    def copy_files(self, source: Path, destination: Path) -> None:
-        if destination.exists():
-            shutil.rmtree(destination)
-        shutil.copytree(source, destination)
-
-    def remove_files(self, path: Path) -> None:
-        if path.exists():
-            if path.is_dir():
-                shutil.rmtree(path)
-            else:
-                path.unlink()
-
-    def register_component(self, path: Path, manifest: dict) -> None:
-        self.registry.register(manifest["technical_name"], {"path": str(path)})
-
-    def unregister_component(self, name: str) -> None:
-        self.registry.unregister(name)
-
-    def resolve_dependency(self, name: str, version_spec: str):
-        return None
-
-    def get_default_install_path(self, component_name: str) -> Path:
-        return self.base_path / component_name
+from tests.helpers import FilesystemStorage, write_meta as _write_meta  # noqa: E402
 
 
 def test_install_success(tmp_path: Path) -> None:
@@ -111,3 +64,127 @@ def test_install_many_respects_dependencies(tmp_path: Path) -> None:
     results = installer.install_many([comp_b, comp_a])
 
     assert [r.name for r in results] == ["core_auth", "core_users"]
+
+
+def test_install_many_reports_metrics_and_summary(tmp_path: Path) -> None:
+    base = tmp_path / "components"
+    comp_a = base / "core_auth"
+    comp_b = base / "core_users"
+    comp_a.mkdir(parents=True)
+    comp_b.mkdir(parents=True)
+    _write_meta(comp_a, name="core_auth")
+    _write_meta(comp_b, name="core_users", depends=["core_auth"])
+
+    results = TransactionalInstaller(FilesystemStorage(tmp_path / "installed")).install_many(
+        [comp_b, comp_a]
+    )
+
+    metrics = results[0].metrics
+    assert set(metrics.timings) == {"validate", "copy", "register"}
+    assert metrics.files == 1 and metrics.bytes == (comp_a / "__meta__.py").stat().st_size
+    assert metrics.total >= sum(metrics.timings.values())
+
+    summary = results.summary
+    assert summary.components == 2 and summary.failed is None
+    assert summary.bytes == sum(r.metrics.bytes for r in results)
+    assert [name for name, _ in summary.slowest] == sorted(
+        ["core_auth", "core_users"], key=lambda n: -next(r.metrics.total for r in results if r.name == n)
+    )
+    assert summary.components_per_second > 0
+    assert summary.to_dict()["phase_totals"]["pre_hook"] == 0.0
+
+
+def test_install_retries_transient_copy_errors(tmp_path: Path) -> None:
+    component_dir = tmp_path / "demo_module"
+    component_dir.mkdir()
+    _write_meta(component_dir, name="demo_module")
+
+    class FlakyStorage(FilesystemStorage):
+        failures = 1
+
+        def copy_files(self, source: Path, destination: Path) -> None:
+            if self.failures:
+                self.failures -= 1
+                destination.mkdir(parents=True)
+                raise OSError("disco ocupado")
+            super().copy_files(source, destination)
+
+    result = TransactionalInstaller(FlakyStorage(tmp_path / "installed"), copy_retries=2).install(
+        component_dir
+    )
+    assert result.metrics.attempts == 2
+
+    with pytest.raises(InstallationError) as excinfo:
+        storage = FlakyStorage(tmp_path / "again")
+        TransactionalInstaller(storage).install(component_dir)
+    assert excinfo.value.metrics.rolled_back
+    assert excinfo.value.metrics.failed_phase == "copy"
+
+
+def test_install_many_writes_registry_once(tmp_path: Path, monkeypatch) -> None:
+    base = tmp_path / "components"
+    paths = []
+    for i in range(5):
+        comp = base / f"comp_{i}"
+        comp.mkdir(parents=True)
+        _write_meta(comp, name=f"comp_{i}", depends=[f"comp_{i - 1}"] if i else [])
+        paths.append(comp)
+
+    storage = FilesystemStorage(tmp_path / "installed")
+    saves = []
+    original_save = storage.registry._save
+    monkeypatch.setattr(storage.registry, "_save", lambda: (saves.append(1), original_save()))
+
+    TransactionalInstaller(storage).install_many(paths)
+
+    assert len(saves) == 1
+    reloaded = ComponentRegistry(storage.base_path / "registry.json")
+    assert len(reloaded.list()) == 5
+
+
+def test_install_many_keeps_installed_components_on_failure(tmp_path: Path) -> None:
+    base = tmp_path / "components"
+    comp_a = base / "core_auth"
+    comp_b = base / "core_users"
+    comp_a.mkdir(parents=True)
+    comp_b.mkdir(parents=True)
+    _write_meta(comp_a, name="core_auth")
+    _write_meta(comp_b, name="core_users", depends=["core_auth"])
+
+    class FailingStorage(FilesystemStorage):
+        def register_component(self, path: Path, manifest: dict) -> None:
+            if manifest["technical_name"] == "core_users":
+                raise RuntimeError("registry down")
+            super().register_component(path, manifest)
+
+    storage = FailingStorage(tmp_path / "installed")
+
+    with pytest.raises(InstallationError):
+        TransactionalInstaller(storage).install_many([comp_a, comp_b])
+
+    reloaded = ComponentRegistry(storage.base_path / "registry.json")
+    assert reloaded.get("core_auth") is not None
+    assert reloaded.get("core_users") is None
+
+
+def test_install_many_failure_reports_batch_summary(tmp_path: Path) -> None:
+    base = tmp_path / "components"
+    comp_a = base / "core_auth"
+    comp_b = base / "core_users"
+    comp_a.mkdir(parents=True)
+    comp_b.mkdir(parents=True)
+    _write_meta(comp_a, name="core_auth")
+    _write_meta(comp_b, name="core_users", depends=["core_auth"])
+
+    class FailingStorage(FilesystemStorage):
+        def register_component(self, path: Path, manifest: dict) -> None:
+            if manifest["technical_name"] == "core_users":
+                raise RuntimeError("registry down")
+            super().register_component(path, manifest)
+
+    with pytest.raises(InstallationError) as excinfo:
+        TransactionalInstaller(FailingStorage(tmp_path / "installed")).install_many([comp_a, comp_b])
+
+    summary = excinfo.value.summary
+    assert summary.components == 1 and summary.failed == "core_users"
+    assert excinfo.value.metrics.failed_phase == "register"
@@ -0,0 +1,109 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.exceptions import ValidationError  # noqa: E402
+from sdk.journal_registry import JournaledComponentRegistry  # noqa: E402
+
+
+def test_mutations_append_and_replay(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    with JournaledComponentRegistry(path) as registry:
+        registry.register("core_auth", {"path": "/a"})
+        registry.register("core_users", {"path": "/u"})
+        registry.unregister("core_auth")
+        snapshot = path.read_text(encoding="utf-8")
+
+    # El snapshot no se reescribe en cada mutación
+    assert path.read_text(encoding="utf-8") == snapshot
+    assert len(registry.journal_path.read_bytes().splitlines()) == 3
+
+    with JournaledComponentRegistry(path) as reopened:
+        assert reopened.get("core_auth") is None
+        assert reopened.get("core_users") == {"path": "/u"}
+
+
+def test_batch_is_a_single_record(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    with JournaledComponentRegistry(path) as registry:
+        with registry.batch():
+            for i in range(10):
+                registry.register(f"comp_{i}", {"i": i})
+
+    assert len(registry.journal_path.read_bytes().splitlines()) == 1
+    with JournaledComponentRegistry(path) as reopened:
+        assert len(reopened.list()) == 10
+
+
+def test_torn_tail_is_ignored_and_truncated(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    with JournaledComponentRegistry(path) as registry:
+        registry.register("core_auth", {"path": "/a"})
+    with open(registry.journal_path, "ab") as f:
+        f.write(b'{"seq":2,"ops":[["register","core_us')
+
+    with JournaledComponentRegistry(path) as reopened:
+        assert [c for c in reopened.list()] == [{"path": "/a"}]
+        reopened.register("core_users", {"path": "/u"})
+
+    with JournaledComponentRegistry(path) as again:
+        assert again.get("core_users") == {"path": "/u"}
+
+
+def test_corrupt_record_in_the_middle_raises(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    with JournaledComponentRegistry(path) as registry:
+        registry.register("core_auth", {"path": "/a"})
+    data = registry.journal_path.read_bytes()
+    registry.journal_path.write_bytes(b"garbage\n" + data)
+
+    with pytest.raises(ValidationError):
+        JournaledComponentRegistry(path)
+
+
+
+@pytest.mark.parametrize("record", [
+    b"[1, 2]",
+    b'{"ops": []}',
+    b'{"seq": 99, "ops": [["register"]]}',
+    b'{"seq": "1", "ops": []}',
+])
+def test_well_formed_json_with_wrong_shape_raises(tmp_path: Path, record: bytes) -> None:
+    path = tmp_path / "registry.json"
+    with JournaledComponentRegistry(path) as registry:
+        registry.register("core_auth", {"path": "/a"})
+    data = registry.journal_path.read_bytes()
+    registry.journal_path.write_bytes(record + b"\n" + data)
+
+    with pytest.raises(ValidationError, match="registro 1"):
+        JournaledComponentRegistry(path)
+
+def test_compaction_folds_journal_into_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    with JournaledComponentRegistry(path, compact_threshold=200) as registry:
+        for i in range(50):
+            registry.register(f"comp_{i}", {"i": i})
+        registry.wait_for_compaction()
+        registry.compact()
+
+    assert registry.journal_path.stat().st_size == 0
+    with JournaledComponentRegistry(path) as reopened:
+        assert len(reopened.list()) == 50
+
+
+def test_stale_records_before_snapshot_are_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    with JournaledComponentRegistry(path, background_compaction=False) as registry:
+        registry.register("core_auth", {"path": "/a"})
+        journal = registry.journal_path.read_bytes()
+        registry.unregister("core_auth")
+        registry.compact()
+
+    # Simular crash entre snapshot y recorte: el journal conserva registros ya plegados
+    registry.journal_path.write_bytes(journal)
+    with JournaledComponentRegistry(path) as reopened:
+        assert reopened.get("core_auth") is None
@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.meta_codegen.meta_editor import MetaEditor, edit_meta_source  # noqa: E402
+from sdk.utils.meta_parser import parse_meta_file  # noqa: E402
+from sdk.validation.bulk_validator import BulkValidator  # noqa: E402
+from tests.helpers import write_meta  # noqa: E402
+
+SOURCE = (
+    "# cabecera — ñandú\n"
+    'technical_name = "demo"  # nombre\n'
+    'version = "1.0.0"\n'
+    "depends = [\n"
+    '    "base",  # obligatoria\n'
+    "]\n"
+    "custom_field = {'a': 1}\n"
+)
+
+
+def test_edit_preserves_everything_but_targeted_values() -> None:
+    edited = edit_meta_source(SOURCE, {
+        "version": "1.1.0",
+        "depends": lambda current: current + [{"name": "sales", "version": ">=1.0.0"}],
+        "keywords": ["crm"],
+        "technical_name": "demo",
+    })
+
+    assert edited == (
+        "# cabecera — ñandú\n"
+        'technical_name = "demo"  # nombre\n'
+        'version = "1.1.0"\n'
+        'depends = ["base", {"name": "sales", "version": ">=1.0.0"}]\n'
+        "custom_field = {'a': 1}\n"
+        'keywords = ["crm"]\n'
+    )
+
+
+def test_edit_many_revalidates_only_touched(tmp_path: Path) -> None:
+    paths = []
+    for i in range(4):
+        comp = tmp_path / f"comp_{i}"
+        comp.mkdir()
+        write_meta(comp, name=f"comp_{i}")
+        paths.append(comp)
+    already = paths[0] / "__meta__.py"
+    already.write_text(already.read_text(encoding="utf-8").replace("0.1.0", "0.2.0"), encoding="utf-8")
+    (tmp_path / "broken").mkdir()
+    (tmp_path / "broken" / "__meta__.py").write_text("version = (\n", encoding="utf-8")
+
+    report = MetaEditor(BulkValidator(max_workers=1)).edit_many(
+        paths + [tmp_path / "broken"], {"version": "0.2.0"}
+    )
+
+    assert (report.written, report.unchanged, report.failed) == (3, 1, 1)
+    assert report.validation.total == 3 and report.validation.ok
+    assert parse_meta_file(paths[3] / "__meta__.py")["version"] == "0.2.0"
+
+    invalid = MetaEditor(BulkValidator(max_workers=1)).edit_many(paths, {"version": "dos"})
+    assert invalid.validation.invalid == 4
+    assert not invalid.ok
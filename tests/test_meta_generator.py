@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.meta_codegen.meta_generator import MetaGenerator  # noqa: E402
+from sdk.meta_codegen.meta_writer import DEFAULT_FILE_MODE  # noqa: E402
+from sdk.utils.meta_parser import parse_meta_file  # noqa: E402
+
+TEMPLATES = ROOT / "src" / "sdk" / "templates"
+
+
+def _rows(count: int):
+    for i in range(count):
+        yield {
+            "technical_name": f"tenant_{i:03d}",
+            "display_name": f"Tenant {i}",
+            "component_type": "module",
+            "package_type": "extension",
+            "version": f"1.0.{i}",
+        }
+
+
+def test_generate_many_streams_and_reports(tmp_path: Path) -> None:
+    rows = list(_rows(25))
+    rows.insert(3, {"technical_name": "Bad Name", "display_name": "x"})
+    rows.append(dict(rows[0]))
+
+    report = MetaGenerator(TEMPLATES).generate_many(
+        iter(rows), tmp_path, max_workers=3, batch_size=4
+    )
+
+    assert len(report.results) == 27
+    assert [r.index for r in report.results] == list(range(27))
+    assert report.written == 25
+    assert report.failed == 2
+    assert "duplicado" in report.errors()[-1].error
+    meta = parse_meta_file(tmp_path / "tenant_007" / "__meta__.py")
+    assert meta["version"] == "1.0.7"
+
+
+def test_generate_many_matches_single_generation(tmp_path: Path) -> None:
+    generator = MetaGenerator(TEMPLATES)
+    row = next(_rows(1))
+
+    generator.generate_many([row], lambda meta: tmp_path / f"{meta.technical_name}.py")
+
+    assert (tmp_path / "tenant_000.py").read_text(encoding="utf-8") == generator.generate(row)
+
+
+def test_regeneration_skips_unchanged_files(tmp_path: Path) -> None:
+    generator = MetaGenerator(TEMPLATES)
+    rows = list(_rows(5))
+
+    first = generator.generate_many(rows, tmp_path)
+    target = tmp_path / "tenant_002" / "__meta__.py"
+    mtime = target.stat().st_mtime_ns
+
+    rows[4] = dict(rows[4], version="2.0.0")
+    second = generator.generate_many(rows, tmp_path)
+
+    assert (first.written, first.unchanged) == (5, 0)
+    assert (second.written, second.unchanged) == (1, 4)
+    assert target.stat().st_mtime_ns == mtime
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_generate_many_threads_never_touch_the_umask(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    def no_umask(mask: int) -> int:
+        raise AssertionError("generate_many no debe cambiar la umask del proceso")
+
+    monkeypatch.setattr(os, "umask", no_umask)
+    report = MetaGenerator(TEMPLATES).generate_many(_rows(40), tmp_path, max_workers=8)
+
+    assert report.written == 40
+    modes = {p.stat().st_mode & 0o777 for p in tmp_path.rglob("__meta__.py")}
+    assert modes == {DEFAULT_FILE_MODE}
@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.meta_codegen.meta_writer import DEFAULT_FILE_MODE, MetaWriter  # noqa: E402
+
+
+def test_write_meta_file_only_writes_changes(tmp_path: Path) -> None:
+    target = tmp_path / "pkg" / "__meta__.py"
+
+    assert MetaWriter.write_meta_file(target, "A = 1\n") is True
+    mtime = target.stat().st_mtime_ns
+    assert MetaWriter.write_meta_file(target, "A = 1\n") is False
+    assert target.stat().st_mtime_ns == mtime
+    assert MetaWriter.write_meta_file(target, "A = 2\n") is True
+    assert target.read_text(encoding="utf-8") == "A = 2\n"
+    assert [p.name for p in target.parent.iterdir()] == ["__meta__.py"]
+
+
+def test_write_many_counts(tmp_path: Path) -> None:
+    files = [(tmp_path / f"m{i}.py", f"N = {i}\n") for i in range(3)]
+    MetaWriter.write_many(files[:2])
+
+    stats = MetaWriter.write_many(files)
+
+    assert (stats.written, stats.unchanged) == (1, 2)
+
+
+def test_new_files_get_umask_default_mode(tmp_path: Path) -> None:
+    import os
+
+    umask = os.umask(0o022)
+    os.umask(umask)
+    assert DEFAULT_FILE_MODE == 0o666 & ~umask
+
+    target = tmp_path / "__meta__.py"
+    MetaWriter.write_meta_file(target, "A = 1\n")
+    assert target.stat().st_mode & 0o777 == DEFAULT_FILE_MODE
+
+    target.chmod(0o640)
+    MetaWriter.write_meta_file(target, "A = 2\n")
+    assert target.stat().st_mode & 0o777 == 0o640
@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.dependency.install_plan import build_install_plan  # noqa: E402
+from sdk.dependency.plan_estimate import (  # noqa: E402
+    ThroughputModel,
+    estimate_install_plan,
+    scan_source,
+)
+from tests.helpers import FilesystemStorage, write_meta  # noqa: E402
+from sdk.installer import TransactionalInstaller  # noqa: E402
+
+
+def _component(base: Path, name: str, depends: list | None = None, payload: int = 0) -> Path:
+    path = base / name
+    (path / "core").mkdir(parents=True)
+    write_meta(path, name=name, depends=depends)
+    (path / "core" / "data.bin").write_bytes(b"x" * payload)
+    return path
+
+
+def test_scan_source_counts_files_and_bytes(tmp_path: Path) -> None:
+    comp = _component(tmp_path, "core_auth", payload=1000)
+    meta_size = (comp / "__meta__.py").stat().st_size
+
+    stats = scan_source(comp)
+
+    assert stats.files == 2
+    assert stats.bytes == 1000 + meta_size
+
+
+def test_estimate_groups_components_in_waves(tmp_path: Path) -> None:
+    a = _component(tmp_path, "core_auth", payload=100)
+    b = _component(tmp_path, "core_users", depends=["core_auth"], payload=200)
+    c = _component(tmp_path, "core_audit", depends=["core_auth"])
+    d = _component(tmp_path, "core_portal", depends=["core_users", "core_audit"])
+
+    model = ThroughputModel(bytes_per_second=1000, files_per_second=10, hook_seconds=5)
+    estimate = estimate_install_plan(build_install_plan([d, c, b, a]), model)
+
+    assert [w.components for w in estimate.waves][0] == ["core_auth"]
+    assert sorted(estimate.waves[1].components) == ["core_audit", "core_users"]
+    assert estimate.waves[2].components == ["core_portal"]
+    assert estimate.files == 8
+    assert estimate.components["core_users"].estimated_seconds == model.estimate(
+        2, estimate.components["core_users"].bytes
+    )
+    assert estimate.waves[1].critical_seconds <= estimate.waves[1].estimated_seconds
+
+
+def test_dry_run_does_not_install(tmp_path: Path) -> None:
+    a = _component(tmp_path / "src", "core_auth")
+    storage = FilesystemStorage(tmp_path / "installed")
+
+    estimate = TransactionalInstaller(storage).dry_run([a])
+
+    assert estimate.components["core_auth"].files == 2
+    assert not (storage.base_path / "core_auth").exists()
+    assert storage.registry.get("core_auth") is None
+
+
+def test_measure_returns_positive_throughput(tmp_path: Path) -> None:
+    model = ThroughputModel.measure(tmp_path, sample_files=5, sample_bytes=1024)
+
+    assert model.bytes_per_second > 0
+    assert model.files_per_second > 0
@@ -0,0 +1,200 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.registry import ComponentRegistry  # noqa: E402
+
+
+def test_batch_defers_to_single_write(tmp_path: Path) -> None:
+    registry = ComponentRegistry(tmp_path / "registry.json")
+
+    with registry.batch():
+        registry.register("core_auth", {"path": "/a"})
+        with registry.batch():
+            registry.register("core_users", {"path": "/u"})
+        assert ComponentRegistry(tmp_path / "registry.json").list() == []
+
+    assert len(ComponentRegistry(tmp_path / "registry.json").list()) == 2
+
+
+def test_batch_discards_changes_on_error(tmp_path: Path) -> None:
+    registry = ComponentRegistry(tmp_path / "registry.json", fsync="full")
+    registry.register("core_auth", {"path": "/a"})
+
+    with pytest.raises(RuntimeError):
+        with registry.batch():
+            registry.register("core_users", {"path": "/u"})
+            registry.unregister("core_auth")
+            raise RuntimeError("boom")
+
+    assert registry.get("core_auth") == {"path": "/a"}
+    assert registry.get("core_users") is None
+    assert ComponentRegistry(tmp_path / "registry.json").list() == [{"path": "/a"}]
+
+
+def _register_from_worker(args: tuple) -> None:
+    registry_path, worker, count = args
+    registry = ComponentRegistry(Path(registry_path))
+    for i in range(count):
+        registry.register(f"w{worker}_comp_{i}", {"worker": worker})
+
+
+def test_concurrent_processes_do_not_lose_registrations(tmp_path: Path) -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    path = tmp_path / "registry.json"
+    ComponentRegistry(path)
+
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_register_from_worker, [(str(path), w, 25) for w in range(4)]))
+
+    registry = ComponentRegistry(path)
+    assert len(registry.list()) == 100
+    assert registry.generation == 100
+
+
+def test_stale_instances_merge_and_reload(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    first = ComponentRegistry(path)
+    second = ComponentRegistry(path)
+
+    first.register("core_auth", {"path": "/a"})
+    # second detecta el cambio con un stat y recarga al leer
+    assert second.get("core_auth") == {"path": "/a"}
+
+    second.register("core_users", {"path": "/u"})
+    first.register("core_audit", {"path": "/x"})
+
+    names = {p["path"] for p in ComponentRegistry(path).list()}
+    assert names == {"/a", "/u", "/x"}
+
+
+def _manifest(name: str, **fields) -> dict:
+    payload = {"technical_name": name, "version": "1.0.0", "package_type": "extension"}
+    payload.update(fields)
+    return payload
+
+
+def test_query_uses_secondary_indexes(tmp_path: Path) -> None:
+    registry = ComponentRegistry(tmp_path / "registry.json")
+    registry.register("pos", _manifest("pos", domain="hospitality", package_type="integration",
+                                        keywords=["Hospitalidad", "tpv"],
+                                        registry_flags={"workers": True, "api": False}))
+    registry.register("rooms", _manifest("rooms", domain="hospitality", version="2.1.0"))
+    registry.register("ledger", _manifest("ledger", domain="accounting", version="1.5.0",
+                                           registry_flags={"workers": True}))
+
+    assert list(registry.query(domain="hospitality", package_type="integration")) == ["pos"]
+    assert list(registry.query(flags=["workers"])) == ["ledger", "pos"]
+    assert list(registry.query(keywords=["hospitalidad"])) == ["pos"]
+    assert list(registry.query(version_spec=">=1.5.0")) == ["ledger", "rooms"]
+    assert list(registry.query(domain="hospitality", version_spec="<2.0.0")) == ["pos"]
+    assert list(registry.query(version_spec=">1.0.0,<=1.5.0")) == ["ledger"]
+    assert len(registry.query()) == 3
+
+
+def test_query_indexes_follow_writes(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    registry = ComponentRegistry(path)
+    registry.register("pos", _manifest("pos", domain="hospitality"))
+    registry.register("pos", _manifest("pos", domain="retail"))
+
+    assert registry.query(domain="hospitality") == {}
+    assert list(registry.query(domain="retail")) == ["pos"]
+
+    with pytest.raises(RuntimeError):
+        with registry.batch():
+            registry.unregister("pos")
+            raise RuntimeError("boom")
+    assert list(registry.query(domain="retail")) == ["pos"]
+
+    # Otra instancia escribe: el índice se reconstruye al recargar
+    ComponentRegistry(path).register("rooms", _manifest("rooms", domain="retail"))
+    assert list(registry.query(domain="retail")) == ["pos", "rooms"]
+
+    registry.unregister("pos")
+    assert list(registry.query(domain="retail")) == ["rooms"]
+
+
+def test_reload_if_changed_only_after_external_write(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    reader = ComponentRegistry(path)
+
+    assert reader.reload_if_changed() is False
+    ComponentRegistry(path).register("core_auth", {"path": "/a"})
+    assert reader.reload_if_changed() is True
+    assert reader.reload_if_changed() is False
+    assert reader.get("core_auth") == {"path": "/a"}
+
+
+def test_snapshot_is_shared_until_generation_changes(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    registry = ComponentRegistry(path)
+    registry.register("core_auth", {"path": "/a"})
+
+    first = registry.snapshot()
+    assert registry.snapshot() is first
+    assert ComponentRegistry.read_snapshot(path) is first
+    assert first.get("core_auth") == {"path": "/a"}
+    with pytest.raises(TypeError):
+        first.get("core_auth")["path"] = "/b"  # type: ignore[index]
+
+    registry.register("core_users", {"path": "/u"})
+    second = registry.snapshot()
+    assert second is not first
+    assert second.generation == first.generation + 1
+    assert len(first) == 1 and len(second) == 2
+
+
+def test_snapshot_is_isolated_from_live_payloads(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    registry = ComponentRegistry(path)
+    registry.register("core_auth", {"path": "/a", "keywords": ["auth"], "flags": {"api": True}})
+    snapshot = registry.snapshot()
+
+    live = registry.get("core_auth")
+    live["path"] = "/b"
+    live["keywords"].append("users")
+    live["flags"]["api"] = False
+
+    frozen = snapshot.get("core_auth")
+    assert frozen == {"path": "/a", "keywords": ("auth",), "flags": {"api": True}}
+    assert ComponentRegistry.read_snapshot(path) is snapshot
+    with pytest.raises(TypeError):
+        frozen["flags"]["api"] = False  # type: ignore[index]
+    # Una instancia nueva recibe su propia copia mutable, sin tuplas
+    assert ComponentRegistry(path).get("core_auth")["keywords"] == ["auth"]
+
+
+def test_shared_snapshots_are_bounded(tmp_path: Path, monkeypatch) -> None:
+    import sdk.registry as registry_module
+
+    monkeypatch.setattr(registry_module, "MAX_SHARED_SNAPSHOTS", 3)
+    for i in range(5):
+        registry = ComponentRegistry(tmp_path / f"registry_{i}.json")
+        registry.register("core_auth", {"path": "/a"})
+        registry.snapshot()
+    assert len(registry_module._SHARED_SNAPSHOTS) == 3
+    assert str(tmp_path / "registry_4.json") in registry_module._SHARED_SNAPSHOTS
+
+
+def test_new_instances_reuse_shared_parse(tmp_path: Path, monkeypatch) -> None:
+    import sdk.registry as registry_module
+
+    path = tmp_path / "registry.json"
+    ComponentRegistry(path).register("core_auth", {"path": "/a"})
+    ComponentRegistry(path)
+
+    parses = []
+    original = registry_module._parse_registry
+    monkeypatch.setattr(
+        registry_module, "_parse_registry",
+        lambda *args: (parses.append(1), original(*args))[1],
+    )
+    for _ in range(5):
+        assert ComponentRegistry(path).get("core_auth") == {"path": "/a"}
+    assert parses == []
@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.search_index import SearchIndex, normalize_text  # noqa: E402
+
+MANIFESTS = [
+    {
+        "technical_name": "conta_basica",
+        "display_name": "Contabilidad Básica",
+        "keywords": ["contabilidad", "reportes"],
+        "domain": "finanzas",
+        "description": "Asientos, balances y reportes contables para pymes",
+    },
+    {
+        "technical_name": "hotel_pms",
+        "display_name": "Gestión Hotelera",
+        "keywords": ["hospitalidad"],
+        "domain": "turismo",
+        "description": "Reservas y facturación para hoteles, con reportes de ocupación",
+    },
+    {
+        "technical_name": "school_core",
+        "display_name": "Educación",
+        "keywords": ["educación", "Latam"],
+        "domain": "educacion",
+        "description": None,
+    },
+]
+
+
+def test_accent_insensitive_ranked_search() -> None:
+    index = SearchIndex.from_manifests(MANIFESTS)
+
+    assert normalize_text("Educación ÑANDÚ") == "educacion nandu"
+    assert [h.name for h in index.search("educacion")] == ["school_core"]
+    assert [h.name for h in index.search("EDUCACIÓN latam")] == ["school_core"]
+    # keyword pesa más que la descripción
+    assert [h.name for h in index.search("reportes")] == ["conta_basica", "hotel_pms"]
+    assert [h.name for h in index.search("facturación hote")] == ["hotel_pms"]
+    assert index.search("contabilidad turismo") == []
+    assert index.search("de la") == []
+
+
+def test_incremental_updates() -> None:
+    index = SearchIndex.from_manifests(MANIFESTS)
+
+    index.add({**MANIFESTS[1], "keywords": ["hospitalidad", "contabilidad"]})
+    assert {h.name for h in index.search("contabilidad")} == {"conta_basica", "hotel_pms"}
+
+    index.remove("conta_basica")
+    assert [h.name for h in index.search("conta")] == ["hotel_pms"]
+    assert index.search("asientos") == []
+    assert len(index) == 2 and "conta_basica" not in index
+
+
+def test_queries_on_large_catalog_touch_only_needed_postings(monkeypatch) -> None:
+    groups = ["contabilidad", "hospitalidad", "educacion", "salud", "logistica"]
+    index = SearchIndex.from_manifests(
+        {
+            "technical_name": f"comp_{i:05d}",
+            "display_name": f"Componente {i}",
+            "keywords": [groups[i % 5], f"tag{i % 200}"],
+            "description": f"Módulo de {groups[(i + 1) % 5]} número {i}",
+        }
+        for i in range(10_000)
+    )
+    # El tiempo por consulta se sigue en benchmarks/ (search_index_query)
+    merges = []
+    original_idf = index._idf
+    monkeypatch.setattr(index, "_idf", lambda token: (merges.append(token), original_idf(token))[1])
+
+    hits = index.search("tag7 salud", limit=10)
+    assert hits and all(int(h.name[-5:]) % 200 == 7 for h in hits)
+    # "salud" solo tiene un término: sus postings se usan sin fusionar ni copiar
+    assert merges == ["tag7", "salud"]
+    assert index._prefix_postings("salud")[0] is index._postings["salud"]
+
+    # Un prefijo con varios términos se fusiona una vez y queda en caché
+    index.search("salud tag1", limit=10)
+    merged = len(merges)
+    assert index.search("salud tag1", limit=10) == index.search("salud tag1", limit=10)
+    assert len(merges) == merged + 2  # solo el idf de "salud", sin volver a fusionar
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.sqlite_registry import SQLiteComponentRegistry, migrate_json_registry  # noqa: E402
+from sdk.registry import ComponentRegistry  # noqa: E402
+from sdk.exceptions import ValidationError  # noqa: E402
+
+
+def test_register_get_list_unregister(tmp_path: Path) -> None:
+    with SQLiteComponentRegistry(tmp_path / "registry.db") as registry:
+        registry.register("core_auth", {"path": "/a", "version": "1.0.0"})
+        registry.register("core_users", {"path": "/u"})
+        registry.register("core_auth", {"path": "/a2", "version": "1.1.0"})
+
+        assert registry.get("core_auth") == {"path": "/a2", "version": "1.1.0"}
+        assert registry.list() == [{"path": "/a2", "version": "1.1.0"}, {"path": "/u"}]
+
+        registry.unregister("core_auth")
+        assert registry.get("core_auth") is None
+        assert len(registry) == 1
+
+    with SQLiteComponentRegistry(tmp_path / "registry.db") as reopened:
+        assert reopened.get("core_users") == {"path": "/u"}
+
+
+def test_find_uses_indexed_fields(tmp_path: Path) -> None:
+    with SQLiteComponentRegistry(tmp_path / "registry.db") as registry:
+        registry.register("pos", {"domain": "hospitality", "package_type": "integration"})
+        registry.register("rooms", {"domain": "hospitality", "package_type": "extension"})
+
+        found = registry.find(domain="hospitality", package_type="integration")
+
+        assert found == [{"domain": "hospitality", "package_type": "integration"}]
+        with pytest.raises(ValueError):
+            registry.find(authors="nobody")
+
+
+def test_batch_rolls_back_on_error(tmp_path: Path) -> None:
+    with SQLiteComponentRegistry(tmp_path / "registry.db") as registry:
+        registry.register("core_auth", {"path": "/a"})
+
+        with pytest.raises(RuntimeError):
+            with registry.batch():
+                registry.register("core_users", {"path": "/u"})
+                registry.unregister("core_auth")
+                raise RuntimeError("boom")
+
+        assert registry.get("core_auth") == {"path": "/a"}
+        assert registry.get("core_users") is None
+
+
+def test_migrate_json_registry(tmp_path: Path) -> None:
+    json_registry = ComponentRegistry(tmp_path / "registry.json")
+    json_registry.register("core_auth", {"path": "/a"})
+    json_registry.register("core_users", {"path": "/u"})
+
+    migrated = migrate_json_registry(tmp_path / "registry.json", tmp_path / "registry.db")
+
+    assert migrated == 2
+    with SQLiteComponentRegistry(tmp_path / "registry.db") as registry:
+        assert registry.list() == json_registry.list()
+
+
+def test_migrate_rejects_corrupt_json(tmp_path: Path) -> None:
+    (tmp_path / "registry.json").write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(ValidationError):
+        migrate_json_registry(tmp_path / "registry.json", tmp_path / "registry.db")
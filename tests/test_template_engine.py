@@ -0,0 +1,66 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.exceptions import TemplateError  # noqa: E402
+from sdk.meta_codegen.meta_generator import MetaGenerator  # noqa: E402
+from sdk.meta_codegen.template_engine import TemplateEngine  # noqa: E402
+from sdk.utils.meta_parser import parse_meta_file  # noqa: E402
+
+
+def _engine(tmp_path: Path, source: str) -> TemplateEngine:
+    (tmp_path / "t.tpl").write_text(source, encoding="utf-8")
+    return TemplateEngine(tmp_path)
+
+
+def test_render_is_single_pass(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, 'a = "{{ a }}"\nb = "{{ b }}"\na2 = "{{ a }}"\n')
+
+    rendered = engine.render("t.tpl", {"a": "{{ b }}", "b": 2})
+
+    assert rendered == 'a = "{{ b }}"\nb = "2"\na2 = "{{ b }}"\n'
+
+
+def test_missing_and_unknown_placeholders(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, "{{ a }} {{ b }}")
+
+    with pytest.raises(TemplateError, match="b"):
+        engine.render("t.tpl", {"a": 1})
+    assert engine.render("t.tpl", {"a": 1, "b": 2, "c": 3}) == "1 2"
+    with pytest.raises(TemplateError, match="c"):
+        engine.render("t.tpl", {"a": 1, "b": 2, "c": 3}, strict=True)
+    assert engine.compile("t.tpl").fields == {"a", "b"}
+
+
+def test_compiled_template_is_cached_until_file_changes(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, "v1 {{ a }}")
+    first = engine.compile("t.tpl")
+    assert engine.compile("t.tpl") is first
+
+    template = tmp_path / "t.tpl"
+    template.write_text("version2 {{ a }}", encoding="utf-8")
+    os.utime(template, ns=(first.signature[0] + 10**9, first.signature[0] + 10**9))
+
+    assert engine.render("t.tpl", {"a": "x"}) == "version2 x"
+
+
+def test_meta_generator_output_still_parses(tmp_path: Path) -> None:
+    generator = MetaGenerator(ROOT / "src" / "sdk" / "templates")
+    output = tmp_path / "demo_mod" / "__meta__.py"
+
+    generator.generate_and_write(output, {
+        "technical_name": "demo_mod",
+        "display_name": "Demo Mod",
+        "component_type": "module",
+        "package_type": "extension",
+        "version": "1.2.0",
+    })
+
+    meta = parse_meta_file(output)
+    assert meta["technical_name"] == "demo_mod"
+    assert meta["version"] == "1.2.0"
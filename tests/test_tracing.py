@@ -0,0 +1,81 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.installer import TransactionalInstaller  # noqa: E402
+from sdk.tracing import (  # noqa: E402
+    NOOP_SPAN,
+    InMemoryExporter,
+    JsonLinesExporter,
+    Tracer,
+    get_tracer,
+    span,
+    use_tracer,
+)
+from tests.helpers import FilesystemStorage, make_catalog  # noqa: E402
+
+
+def _components(base: Path) -> list:
+    paths = make_catalog(base, [("base_mod", []), ("sales_mod", ["base_mod"])])
+    for comp in paths:
+        (comp / "models.py").write_text("X = 1\n", encoding="utf-8")
+    return paths
+
+
+def test_disabled_tracing_is_noop() -> None:
+    assert get_tracer() is None
+    with span("anything", component="x") as s:
+        s.set_attribute("bytes", 1)
+    assert s is NOOP_SPAN and not s.recording
+
+
+def test_install_many_emits_nested_spans(tmp_path: Path) -> None:
+    exporter = InMemoryExporter()
+    installer = TransactionalInstaller(FilesystemStorage(tmp_path / "installed"))
+
+    with use_tracer(Tracer(exporter)):
+        installer.install_many(_components(tmp_path / "src"))
+    assert get_tracer() is None
+
+    [root] = exporter.by_name("installer.install_many")
+    assert root.parent_id is None and root.attributes["installed"] == 2
+    installs = exporter.by_name("installer.install")
+    assert [s.attributes["component"] for s in installs] == ["base_mod", "sales_mod"]
+    assert all(s.parent_id == root.span_id for s in installs)
+
+    children = {s.name for s in exporter.children(installs[0])}
+    assert {"installer.validate", "installer.copy_files", "installer.register"} <= children
+    copy = exporter.by_name("installer.copy_files")[0]
+    assert copy.attributes["files"] == 2 and copy.attributes["bytes"] > 0
+    assert {s.name for s in exporter.children(exporter.by_name("validator.validate")[0])} >= {
+        "validator.parse", "validator.schema", "validator.structure",
+    }
+    [flush] = exporter.by_name("registry.flush")
+    assert flush.parent_id == root.span_id and flush.attributes["ops"] == 2
+    assert root.duration >= sum(s.duration for s in installs)
+
+
+def test_failures_and_jsonl_export(tmp_path: Path) -> None:
+    storage = FilesystemStorage(tmp_path / "installed")
+
+    def fail(*_args):
+        raise RuntimeError("registro caído")
+
+    storage.register_component = fail
+    comp = _components(tmp_path / "src")[0]
+
+    with JsonLinesExporter(tmp_path / "trace.jsonl") as exporter:
+        with use_tracer(Tracer(exporter)):
+            with pytest.raises(Exception):
+                TransactionalInstaller(storage).install(comp)
+
+    records = [json.loads(line) for line in (tmp_path / "trace.jsonl").read_text().splitlines()]
+    by_name = {r["name"]: r for r in records}
+    assert "RuntimeError" in by_name["installer.register"]["error"]
+    assert by_name["installer.rollback"]["error"] is None
+    assert by_name["installer.install"]["attributes"]["component"] == "base_mod"
@@ -0,0 +1,96 @@
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from sdk.validation.bulk_validator import BulkValidator  # noqa: E402
+from sdk.validation.component_validator import ComponentValidator  # noqa: E402
+from sdk.validation.validation_cache import ValidationCache, component_fingerprint  # noqa: E402
+from tests.helpers import write_meta  # noqa: E402
+
+
+def _counting_validator(cache: ValidationCache) -> tuple:
+    validator = ComponentValidator(cache=cache)
+    calls = []
+    original = validator.structure_validator.validate_structure
+    validator.structure_validator.validate_structure = lambda path: (calls.append(path), original(path))
+    return validator, calls
+
+
+def test_unchanged_component_is_skipped(tmp_path: Path) -> None:
+    comp = tmp_path / "core_auth"
+    comp.mkdir()
+    write_meta(comp, name="core_auth")
+    cache_path = tmp_path / "cache.json"
+
+    with ValidationCache(cache_path) as cache:
+        validator, calls = _counting_validator(cache)
+        first = validator.validate_component(comp)
+
+    validator, calls = _counting_validator(ValidationCache(cache_path))
+    second = validator.validate_component(comp)
+
+    assert calls == []
+    assert second == first
+    assert second.lifecycle.pre_install is None
+
+
+def test_fingerprint_changes_with_meta_and_structure(tmp_path: Path) -> None:
+    comp = tmp_path / "core_auth"
+    comp.mkdir()
+    write_meta(comp, name="core_auth")
+    original = component_fingerprint(comp)
+
+    (comp / "core").mkdir()
+    (comp / "core" / "models.py").write_text("", encoding="utf-8")
+    with_models = component_fingerprint(comp)
+    write_meta(comp, name="core_auth", depends=["base"])
+
+    assert len({original, with_models, component_fingerprint(comp)}) == 3
+
+
+def test_cache_from_other_rules_is_discarded(tmp_path: Path) -> None:
+    comp = tmp_path / "core_auth"
+    comp.mkdir()
+    write_meta(comp, name="core_auth")
+    cache_path = tmp_path / "cache.json"
+    with ValidationCache(cache_path) as cache:
+        ComponentValidator(cache=cache).validate_component(comp)
+
+    data = json.loads(cache_path.read_text(encoding="utf-8"))
+    data["rules"] = "reglas-anteriores"
+    cache_path.write_text(json.dumps(data), encoding="utf-8")
+
+    assert len(ValidationCache(cache_path)) == 0
+
+
+def test_bulk_validator_uses_cache(tmp_path: Path) -> None:
+    paths = []
+    for i in range(3):
+        comp = tmp_path / f"comp_{i}"
+        comp.mkdir()
+        write_meta(comp, name=f"comp_{i}")
+        paths.append(comp)
+    cache_path = tmp_path / "cache.json"
+
+    first = BulkValidator(max_workers=1, cache=ValidationCache(cache_path)).validate_many(paths)
+    write_meta(paths[0], name="comp_0", depends=["comp_1"])
+    second = BulkValidator(max_workers=1, cache=ValidationCache(cache_path)).validate_many(paths)
+
+    assert first.cached == 0
+    assert second.cached == 2
+    assert second.ok
+    assert not second.results[0].cached
+
+
+def test_syntax_cache_is_persisted_next_to_validation_cache(tmp_path: Path) -> None:
+    comp = tmp_path / "core_auth"
+    comp.mkdir()
+    write_meta(comp, name="core_auth")
+
+    with ValidationCache(tmp_path / "cache.json") as cache:
+        ComponentValidator(cache=cache).validate_component(comp)
+
+    assert (tmp_path / "cache.syntax.json").exists()
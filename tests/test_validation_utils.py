@@ -0,0 +1,110 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+import sdk.utils.validation_utils as validation_utils  # noqa: E402
+from sdk.exceptions import SourceSyntaxError  # noqa: E402
+from sdk.utils.validation_utils import SyntaxCheckCache, ValidationUtils  # noqa: E402
+from sdk.validation.structure_validator import StructureValidator  # noqa: E402
+from tests.helpers import write_meta  # noqa: E402
+
+
+def _component(base: Path) -> Path:
+    comp = base / "core_auth"
+    (comp / "core").mkdir(parents=True)
+    write_meta(comp, name="core_auth")
+    (comp / "core" / "models.py").write_text("class A:\n    pass\n", encoding="utf-8")
+    (comp / "core" / "views.py").write_text("def f(:\n    pass\n", encoding="utf-8")
+    (comp / "core" / "api.py").write_text("x = 1\nif x\n", encoding="utf-8")
+    return comp
+
+
+def test_scan_syntax_reports_every_file_with_line(tmp_path: Path) -> None:
+    comp = _component(tmp_path)
+
+    issues = ValidationUtils.scan_syntax(comp)
+
+    assert [(i.path.name, i.lineno) for i in issues] == [("api.py", 2), ("views.py", 1)]
+    assert ValidationUtils.scan_directory_for_syntax_errors(comp) == [i.path for i in issues]
+
+
+def test_scan_syntax_skips_unchanged_files(tmp_path: Path, monkeypatch) -> None:
+    comp = _component(tmp_path)
+    cache_path = tmp_path / "syntax.json"
+    ValidationUtils.scan_syntax(comp, cache=SyntaxCheckCache(cache_path))
+
+    compiled = []
+    original = validation_utils._compile_check_item
+    monkeypatch.setattr(
+        validation_utils, "_compile_check_item",
+        lambda item: (compiled.append(Path(item[0]).name), original(item))[1],
+    )
+
+    # Solo cambia el mtime: el hash coincide y no se recompila
+    views = comp / "core" / "views.py"
+    os.utime(views, ns=(views.stat().st_atime_ns, views.stat().st_mtime_ns + 10**9))
+    issues = ValidationUtils.scan_syntax(comp, cache=SyntaxCheckCache(cache_path))
+    assert compiled == []
+    assert len(issues) == 2
+
+    views.write_text("def f():\n    pass\n", encoding="utf-8")
+    issues = ValidationUtils.scan_syntax(comp, cache=SyntaxCheckCache(cache_path))
+    assert compiled == ["views.py"]
+    assert [i.path.name for i in issues] == ["api.py"]
+
+
+def test_scan_syntax_in_process_pool(tmp_path: Path, monkeypatch) -> None:
+    comp = _component(tmp_path)
+    monkeypatch.setattr(ValidationUtils, "PARALLEL_THRESHOLD", 1)
+
+    issues = ValidationUtils.scan_syntax(comp, max_workers=2)
+
+    assert [i.path.name for i in issues] == ["api.py", "views.py"]
+
+
+def test_structure_validator_checks_all_sources(tmp_path: Path) -> None:
+    comp = _component(tmp_path)
+
+    with pytest.raises(SourceSyntaxError) as excinfo:
+        StructureValidator().validate_structure(comp)
+
+    assert len(excinfo.value.issues) == 2
+    assert "api.py:2" in str(excinfo.value)
+    StructureValidator(check_sources=False).validate_structure(comp)
+
+
+def test_structure_validator_scans_serially_and_persists_cache(tmp_path: Path, monkeypatch) -> None:
+    import sdk.utils.validation_utils as validation_utils
+
+    comp = tmp_path / "big_module"
+    comp.mkdir()
+    write_meta(comp, name="big_module")
+    for i in range(ValidationUtils.PARALLEL_THRESHOLD + 6):
+        (comp / f"mod_{i}.py").write_text(f"VALUE = {i}\n", encoding="utf-8")
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("el escaneo por defecto no debe lanzar un pool")
+
+    compiled = []
+    original = validation_utils._compile_check
+    monkeypatch.setattr(validation_utils, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(
+        validation_utils, "_compile_check",
+        lambda source, filename: (compiled.append(filename), original(source, filename))[1],
+    )
+
+    cache_path = tmp_path / "cache" / "syntax.json"
+    StructureValidator(syntax_cache_path=cache_path).validate_structure(comp)
+    sources = [name for name in compiled if "mod_" in name]
+    assert len(sources) == ValidationUtils.PARALLEL_THRESHOLD + 6 and cache_path.exists()
+
+    # Otra instancia (otra ejecución) no recompila los archivos sin cambios
+    compiled.clear()
+    (comp / "mod_0.py").write_text("VALUE = 'nuevo'\n", encoding="utf-8")
+    StructureValidator(syntax_cache_path=cache_path).validate_structure(comp)
+    assert [name for name in compiled if "mod_" in name] == [str(comp / "mod_0.py")]